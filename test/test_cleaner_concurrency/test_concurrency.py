@@ -0,0 +1,76 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from textwizard.text_wizard import TextWizard
+
+THREADS = 8
+ROUNDS = 40
+
+
+def html_job(i):
+    html = (f"<div id='d{i}'><script>x={i}</script><p class='c{i}' onclick='f()'>p{i}"
+            f"<b></b><span>{'s' * (i % 7)}</span></p>" * (1 + i % 5) + "</div>")
+    opts = [{"remove_script": True}, {"remove_specific_attributes": ["on*", "class"]},
+            {"remove_empty_tags": True, "remove_tags_and_contents": "span"}, {}]
+    return "clean_html", html, opts[i % len(opts)]
+
+
+def xml_job(i):
+    xml = (f"<?xml version='1.0'?><root xmlns:a='urn:a'><!-- c{i} --><a:item k='{i}'>v{i}</a:item>"
+           f"<empty/><item>  w  {i}  </item></root>")
+    opts = [{"remove_comments": True}, {"remove_namespaces": True, "remove_empty_tags": True},
+            {"collapse_whitespace": True, "remove_attributes": "k"}, {"remove_specific_tags": "item"}]
+    return "clean_xml", xml, opts[i % len(opts)]
+
+
+def csv_job(i):
+    rows = [f"id,name,note{i}"] + [f"{r}, n{r} ,{'' if r % 3 else 'x'}" for r in range(1 + i % 9)]
+    csv = "\n".join(rows + rows[1:3]) + "\n"
+    opts = [{"trim_whitespace": True}, {"remove_duplicates_rows": True},
+            {"remove_columns": "name", "remove_empty_rows": True}, {"remove_row_index": [0, 2]},
+            {"remove_values": "x", "remove_empty_columns": True}]
+    return "clean_csv", csv, opts[i % len(opts)]
+
+
+JOBS = [make(i) for i in range(60) for make in (html_job, xml_job, csv_job)]
+
+
+class SharedCleanerConcurrencyTests(unittest.TestCase):
+    """Concurrent clean_* calls on one TextWizard must match sequential results."""
+
+    def test_clean_calls_from_many_threads(self):
+        wizard = TextWizard()
+        expected = [getattr(wizard, name)(text, **opts) for name, text, opts in JOBS]
+        barrier = threading.Barrier(THREADS)
+
+        def worker(offset):
+            barrier.wait()
+            out = []
+            # Each thread walks the jobs from a different offset, so different
+            # cleaners and options overlap on the shared instances.
+            for k in range(ROUNDS * 3):
+                idx = (offset * 17 + k) % len(JOBS)
+                name, text, opts = JOBS[idx]
+                out.append((idx, getattr(wizard, name)(text, **opts)))
+            return out
+
+        with ThreadPoolExecutor(THREADS) as pool:
+            results = list(pool.map(worker, range(THREADS)))
+
+        for out in results:
+            for idx, got in out:
+                self.assertEqual(got, expected[idx], msg=f"job {idx} ({JOBS[idx][0]}) diverged")
+
+    def test_first_calls_race_on_lazy_cleaners(self):
+        # The lazily created cleaners are safe to race on first use too.
+        wizard = TextWizard()
+        _, html, opts = html_job(3)
+        expected = TextWizard().clean_html(html, **opts)
+        with ThreadPoolExecutor(THREADS) as pool:
+            out = list(pool.map(lambda _: wizard.clean_html(html, **opts), range(THREADS * 4)))
+        self.assertEqual(out, [expected] * len(out))
+
+
+if __name__ == "__main__":
+    unittest.main()
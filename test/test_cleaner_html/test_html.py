@@ -87,5 +87,76 @@ class TestHTMLCleanerViaPublicAPI(unittest.TestCase):
                          f"  Expected:\n{expected}\n"
                          f"  Output:\n{out}\n"))
 
+    def test_cleaning_parsed_document_via_public_api(self):
+        # One parse per case, cleaned twice: the handle must survive cleaning.
+        for tc in self.cases:
+            with self.subTest(test=tc.get("name","Unnamed"), file=tc.get("file","unknown")):
+                expected = tc.get("expected","").replace('\u00A0',' ').strip()
+                params   = normalize_html_params(parse_params(tc.get("params","")))
+                doc = tw.parse_html(tc.get("data",""))
+                for _ in range(2):
+                    out = tw.clean_html(doc, **params)
+                    self.assertEqual(expected, out.replace('\u00A0',' ').strip(),
+                        msg=f"Test '{tc.get('name')}' in '{tc.get('file')}' fail on parsed document")
+
+    def test_cleaning_via_profile(self):
+        # A profile compiled once per case must clean like clean_html, repeatedly.
+        for tc in self.cases:
+            with self.subTest(test=tc.get("name","Unnamed"), file=tc.get("file","unknown")):
+                expected = tc.get("expected","").replace('\u00A0',' ').strip()
+                profile  = tw.HtmlCleanProfile(**normalize_html_params(parse_params(tc.get("params",""))))
+                for src in (tc.get("data",""), tw.parse_html(tc.get("data",""))):
+                    out = profile.clean(src)
+                    self.assertEqual(expected, out.replace('\u00A0',' ').strip(),
+                        msg=f"Test '{tc.get('name')}' in '{tc.get('file')}' fail with profile")
+
+
+class TestHtmlCleanProfile(unittest.TestCase):
+    def test_wildcards_match_names_of_each_document(self):
+        profile = tw.HtmlCleanProfile(remove_specific_attributes=["on*", "data-*"],
+                                      remove_tags_and_contents="x-ad*")
+        self.assertEqual(profile.clean('<p onclick="f()" data-k="1" id="a">A<x-ad-1>ad</x-ad-1></p>'),
+                         '<html><head></head><body><p id="a">A</p></body></html>')
+        self.assertEqual(profile.clean('<p ONLOAD="g()">B<X-AD-2>ad</X-AD-2></p>'),
+                         '<html><head></head><body><p>B</p></body></html>')
+
+    def test_profile_is_shared_across_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        profile = tw.HtmlCleanProfile(remove_script=True, remove_specific_tags="s*", remove_empty_tags=True)
+        pages = [f"<div><span>{i}</span><script>x()</script><b></b></div>" for i in range(200)]
+        with ThreadPoolExecutor(8) as pool:
+            out = list(pool.map(profile.clean, pages))
+        self.assertEqual(out, [tw.clean_html(p, remove_script=True, remove_specific_tags="s*",
+                                             remove_empty_tags=True) for p in pages])
+
+    def test_options_and_input_are_checked(self):
+        with self.assertRaises(TypeError):
+            tw.HtmlCleanProfile(remove_scripts=True)
+        with self.assertRaises(TypeError):
+            tw.HtmlCleanProfile().clean(b"<p>x</p>")
+        self.assertEqual(tw.HtmlCleanProfile().clean("<p>a</p><p>b</p>"), tw.clean_html("<p>a</p><p>b</p>"))
+        self.assertEqual(repr(tw.HtmlCleanProfile(remove_comments=True)), "HtmlCleanProfile(remove_comments=True)")
+
+class TestUnwrapSpacing(unittest.TestCase):
+    def test_nested_unwraps_space_like_separate_passes(self):
+        # Expected outputs of the former one-pass-per-level unwrapping: a
+        # child spliced out of an unwrapped element is unwrapped on the next
+        # scan, against the siblings that scan sees.
+        tricky = ("<TABLE>\n<TR>\n<CENTER><CENTER><TD></TD></TR><TR>\n<FONT>\n<TABLE><tr></tr></TABLE>\n</P>\n"
+                  "<a></font><font></a>\nThis page contains an insanely badly-nested tag sequence.")
+        cases = (
+            ("<div>a<a></div>b</a>", ["a", "div"], "<html><head></head><body>ab</body></html>"),
+            ("<!DOCTYPE html><div>a<a></div>b<p>c</p>d", ["div", "a", "p"],
+             "<!DOCTYPE html><html><head></head><body>ab c d</body></html>"),
+            (tricky, ["t*"],
+             "<html><head></head><body><center><center></center></center><font>\n</font>\n<tbody>\n\n</tbody>"
+             "<tbody></tbody><font>\n<p></p>\n<a></a></font><a><font></font></a><font>\nThis page contains "
+             "an insanely badly-nested tag sequence.</font></body></html>"),
+        )
+        for src, tags, expected in cases:
+            with self.subTest(src=src, tags=tags):
+                self.assertEqual(tw.clean_html(src, remove_specific_tags=tags), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# ── Budget ─────────────────────────────────────────────────────────────────────
+# Cumulative time of `import textwizard` as reported by `python -X importtime`
+# (best of RUNS). Wall-clock budgets depend on the machine, so the check only
+# runs when TW_IMPORT_BUDGET_MS is set (e.g. 150 on a quiet dev box; eager
+# imports of fitz/pandas/lxml used to cost ~600 ms). The module checks below
+# are what guards the lazy imports everywhere else.
+IMPORT_BUDGET_MS = os.environ.get("TW_IMPORT_BUDGET_MS")
+RUNS = 5
+
+# Third-party modules that must only be imported on first use.
+HEAVY_MODULES = (
+    "fitz",
+    "pymupdf",
+    "pandas",
+    "numpy",
+    "lxml",
+    "marisa_trie",
+    "ahocorasick",
+    "openpyxl",
+    "PIL",
+    "torch",
+)
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_time_ms() -> float:
+    proc = _run("import textwizard")
+    for line in reversed(proc.stderr.splitlines()):
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == "textwizard":
+            return int(parts[1]) / 1000.0
+    raise AssertionError(f"no importtime entry for textwizard:\n{proc.stderr}")
+
+
+class TestImportTime(unittest.TestCase):
+    @unittest.skipUnless(IMPORT_BUDGET_MS, "set TW_IMPORT_BUDGET_MS to check the import time")
+    def test_import_within_budget(self):
+        best = min(import_time_ms() for _ in range(RUNS))
+        self.assertLess(best, float(IMPORT_BUDGET_MS))
+
+    def test_heavy_dependencies_not_imported(self):
+        code = (
+            "import sys, json, textwizard; "
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+        )
+        loaded = json.loads(_run(code).stdout)
+        self.assertEqual(loaded, [])
+
+    def test_first_use_imports_only_what_it_needs(self):
+        code = (
+            "import sys, json, textwizard as tw; "
+            "tw.clean_html('<p>x</p>'); tw.extract_text(b'a,b', extension='csv'); "
+            f"print(json.dumps([m for m in ('fitz', 'pymupdf', 'lxml', 'openpyxl') if m in sys.modules]))"
+        )
+        self.assertEqual(json.loads(_run(code).stdout), [])
+
+    def test_html_cleaning_imports_no_async_or_wildcard_machinery(self):
+        code = (
+            "import sys, json, textwizard as tw; "
+            "tw.clean_html('<p>x &amp; y</p>'); "
+            f"print(json.dumps([m for m in ('asyncio', 'regex', 'marisa_trie') if m in sys.modules]))"
+        )
+        self.assertEqual(json.loads(_run(code).stdout), [])
+
+    def test_lazy_exports(self):
+        import textwizard as tw
+        self.assertIn("DiskOcrCache", dir(tw))
+        self.assertTrue(issubclass(tw.DiskOcrCache, tw.OcrCache))
+        self.assertEqual(tw.EntitiesResult.__name__, "EntitiesResult")
+        with self.assertRaises(AttributeError):
+            tw.does_not_exist
+
+
+if __name__ == "__main__":
+    unittest.main()
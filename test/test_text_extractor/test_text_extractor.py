@@ -7,6 +7,8 @@ import hashlib
 import unicodedata
 import difflib
 import subprocess
+import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 import unittest
@@ -168,5 +170,488 @@ class TestTextExtractorSnapshots(unittest.TestCase):
         if UPDATE == 1 and cls.changed:
             save_baseline(cls.snap)
 
+
+class TestTextExtractorBatch(unittest.TestCase):
+    FILES = ["file1.txt", "file1.csv", "file1.html", "file1.pdf", "file1.docx", "file1.xlsx"]
+
+    def _inputs(self):
+        items = [FILES_DIR / f for f in self.FILES]
+        items.insert(2, FILES_DIR / "missing.pdf")
+        items.append(((FILES_DIR / "file1.pdf").read_bytes(), "pdf"))
+        return items
+
+    def _check(self, results, items):
+        self.assertEqual(sorted(r.index for r in results), list(range(len(items))))
+        for r in results:
+            item = items[r.index]
+            if r.index == 2:
+                self.assertFalse(r.ok)
+                self.assertEqual(r.error_type, "FileNotFoundCustomError")
+                continue
+            self.assertTrue(r.ok, r.error)
+            data, ext = item if isinstance(item, tuple) else (item, None)
+            self.assertEqual(r.text, tw.extract_text(data, extension=ext))
+
+    def test_batch_serial(self):
+        items = self._inputs()
+        results = list(tw.extract_text_batch(items, workers=1))
+        self.assertEqual([r.index for r in results], list(range(len(items))))
+        self._check(results, items)
+
+    def test_batch_pool_ordered(self):
+        items = self._inputs()
+        results = list(tw.extract_text_batch(items, workers=2, ordered=True))
+        self.assertEqual([r.index for r in results], list(range(len(items))))
+        self._check(results, items)
+
+    def test_batch_pool_unordered(self):
+        items = self._inputs()
+        self._check(list(tw.extract_text_batch(items, workers=2, ordered=False)), items)
+
+    def test_batch_survives_worker_crash(self):
+        import multiprocessing
+        import os
+        from unittest import mock
+        from textwizard.wizard_extractors.extraction_text import TextExtractor
+        if multiprocessing.get_start_method() != "fork":
+            self.skipTest("workers inherit the patched reader only with fork")
+
+        real = TextExtractor.data_extractor
+
+        def crashing(self, input_data, *args, **kwargs):
+            if input_data == b"crash":
+                os._exit(1)
+            return real(self, input_data, *args, **kwargs)
+
+        items = [(f"row {i}\n".encode(), "txt") for i in range(12)]
+        items[3] = (b"crash", "txt")
+        with mock.patch.object(TextExtractor, "data_extractor", crashing):
+            for ordered in (True, False):
+                results = list(tw.extract_text_batch(items, workers=3, ordered=ordered))
+                self.assertEqual(sorted(r.index for r in results), list(range(len(items))))
+                failed = [r.index for r in results if not r.ok]
+                self.assertEqual(failed, [3])
+                for r in results:
+                    if r.ok:
+                        self.assertEqual(r.text, tw.extract_text(*items[r.index]))
+
+
+class TestAsyncExtraction(unittest.TestCase):
+    def test_matches_sync(self):
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        files = [FILES_DIR / name for name in ("file1.pdf", "file1.txt", "file1.csv")]
+
+        async def main(executor=None):
+            return await asyncio.gather(*(tw.aextract_text(p, executor=executor) for p in files))
+
+        expected = [tw.extract_text(p) for p in files]
+        self.assertEqual(asyncio.run(main()), expected)
+        with ThreadPoolExecutor(2) as pool:
+            self.assertEqual(asyncio.run(main(pool)), expected)
+
+    def test_errors_propagate(self):
+        import asyncio
+        from textwizard.utils.errors.errors import FileNotFoundCustomError
+        with self.assertRaises(FileNotFoundCustomError):
+            asyncio.run(tw.aextract_text(FILES_DIR / "missing.pdf"))
+
+
+class TestAsyncAzureDocx(unittest.TestCase):
+    IMAGES = 10
+
+    @classmethod
+    def _docx(cls) -> bytes:
+        import io
+        import zipfile
+        body = "".join(
+            f'<w:p><w:r><w:drawing><a:blip r:embed="rId{i}"/></w:drawing></w:r></w:p>'
+            for i in range(cls.IMAGES)
+        )
+        rels = "".join(
+            f'<Relationship Id="rId{i}" Target="media/image{i}.png"/>' for i in range(cls.IMAGES)
+        )
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("word/document.xml", (
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+                ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+                ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+                f"<w:body>{body}</w:body></w:document>"
+            ))
+            zf.writestr("word/_rels/document.xml.rels", (
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f"{rels}</Relationships>"
+            ))
+            for i in range(cls.IMAGES):
+                zf.writestr(f"word/media/image{i}.png", f"image {i}")
+        return buf.getvalue()
+
+    def test_calls_and_reads_stay_within_the_limit(self):
+        import asyncio
+        from types import SimpleNamespace
+        from unittest import mock
+        from textwizard.wizard_extractors.ocr_service.azure_ocr import AsyncAzureOcr, _DocxParser
+
+        state = {"in_flight": 0, "peak": 0, "held": 0, "peak_held": 0, "langs": set()}
+
+        class Poller:
+            def __init__(self, blob):
+                self._blob = blob
+
+            async def result(self):
+                await asyncio.sleep(0.01)
+                state["in_flight"] -= 1
+                state["held"] -= 1
+                line = SimpleNamespace(content=self._blob.decode())
+                return SimpleNamespace(pages=[SimpleNamespace(lines=[line])])
+
+        class Client:
+            async def begin_analyze_document(self, model_id, blob, **kwargs):
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+                state["langs"].add(kwargs.get("locale"))
+                return Poller(blob)
+
+        def read_image(parser, target):
+            state["held"] += 1
+            state["peak_held"] = max(state["peak_held"], state["held"])
+            return real_read(parser, target)
+
+        real_read = _DocxParser.read_image
+        ocr = object.__new__(AsyncAzureOcr)
+        ocr._client = Client()
+        ocr._max_concurrency = 3
+        with mock.patch.object(_DocxParser, "read_image", read_image):
+            res = asyncio.run(ocr.extract(self._docx(), extension="docx", language_ocr="ita"))
+
+        self.assertEqual(state["peak"], 3)
+        self.assertEqual(state["peak_held"], 3)
+        self.assertEqual(state["langs"], {"it"})
+        for i in range(self.IMAGES):
+            self.assertIn(f"image {i}", res.text)
+
+
+class TestPdfPageIterator(unittest.TestCase):
+    PDF = FILES_DIR / "file1.pdf"
+
+    def test_pages_match_extract_text(self):
+        pages = list(tw.iter_pages(self.PDF))
+        self.assertGreater(len(pages), 0)
+        self.assertEqual([n for n, _ in pages], list(range(1, len(pages) + 1)))
+        self.assertEqual("".join(t for _, t in pages), tw.extract_text(self.PDF))
+
+    def test_selection_and_bytes(self):
+        raw = self.PDF.read_bytes()
+        pages = list(tw.iter_pages(raw, pages=[1]))
+        self.assertEqual([n for n, _ in pages], [1])
+        self.assertEqual(pages[0][1], tw.extract_text(raw, extension="pdf", pages=1))
+
+    def test_buffer_inputs(self):
+        expected = tw.extract_text(self.PDF)
+        raw = self.PDF.read_bytes()
+        for buf in (bytearray(raw), memoryview(raw)):
+            with self.subTest(kind=type(buf).__name__):
+                self.assertEqual(tw.extract_text(buf, extension="pdf"), expected)
+
+    def test_parallel_ocr_matches_sequential(self):
+        ready, info = tesseract_ready(OCR_LANG)
+        if not ready:
+            self.skipTest(f"OCR not available ({info}).")
+        seq = list(tw.iter_pages(self.PDF, ocr=True, language_ocr=OCR_LANG))
+        par = list(tw.iter_pages(self.PDF, ocr=True, language_ocr=OCR_LANG, ocr_workers=2))
+        self.assertEqual(par, seq)
+
+    def test_ocr_workers_get_a_filename(self):
+        from concurrent.futures import Future
+        from unittest import mock
+        from textwizard.wizard_extractors.tool import pdf_reader
+
+        seen = []
+
+        class InlinePool:
+            # Runs the worker functions in this process and records initargs.
+            def __init__(self, max_workers, initializer, initargs):
+                seen.append((initargs[0], os.path.isfile(initargs[0])))
+                initializer(*initargs)
+
+            def submit(self, fn, *args):
+                fut = Future()
+                fut.set_result(fn(*args))
+                return fut
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                pdf_reader._WORKER_DOC.close()
+
+        raw = self.PDF.read_bytes()
+        with mock.patch.object(pdf_reader, "ProcessPoolExecutor", InlinePool), \
+                mock.patch.object(pdf_reader, "_needs_ocr", lambda page, mode: True), \
+                mock.patch.object(pdf_reader, "_ocr_page", lambda page, *a: f"ocr{page.number}"), \
+                mock.patch.object(pdf_reader, "_WORKER_DOC", None):
+            from_path = list(tw.iter_pages(self.PDF, ocr=True, ocr_workers=2))
+            from_bytes = list(tw.iter_pages(raw, ocr=True, ocr_workers=2))
+        self.assertEqual(from_bytes, from_path)
+        self.assertEqual(from_path[0], (1, "ocr0"))
+        (path, _), (spilled, existed) = seen
+        self.assertEqual(path, str(self.PDF))
+        self.assertIsInstance(spilled, str)
+        self.assertTrue(existed)
+        self.assertFalse(os.path.exists(spilled))
+
+    def test_parallel_ocr_keeps_a_bounded_window(self):
+        from concurrent.futures import Future
+        from unittest import mock
+        import fitz
+        from textwizard.wizard_extractors.tool import pdf_reader
+
+        src = fitz.open()
+        for i in range(40):
+            src.new_page().insert_text((72, 72), f"page {i}")
+        raw = src.tobytes()
+        src.close()
+        inspected, submitted = [], []
+
+        class InlinePool:
+            def __init__(self, max_workers, initializer, initargs):
+                pass
+
+            def submit(self, fn, idx, lang):
+                submitted.append(idx)
+                fut = Future()
+                fut.set_result(f"ocr{idx}")
+                return fut
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                pass
+
+        def needs_ocr(page, mode):
+            inspected.append(page.number)
+            return page.number % 2 == 0
+
+        window = 2 * pdf_reader._INFLIGHT_PER_WORKER
+        with mock.patch.object(pdf_reader, "ProcessPoolExecutor", InlinePool), \
+                mock.patch.object(pdf_reader, "_needs_ocr", needs_ocr):
+            it = tw.iter_pages(raw, ocr=True, ocr_workers=2)
+            self.assertEqual(next(it), (1, "ocr0"))
+            self.assertLessEqual(len(inspected), window)
+            self.assertLessEqual(len(submitted), window)
+            pages = list(it)
+        self.assertEqual(len(pages), 39)
+        self.assertEqual(pages[0], (2, "page 1\n\n"))
+        self.assertEqual(inspected, list(range(40)))
+
+    def test_lazy(self):
+        it = tw.iter_pages(self.PDF)
+        first = next(it)
+        self.assertEqual(first[0], 1)
+        it.close()
+
+
+class TestOcrCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_roundtrip_and_key(self):
+        from textwizard.wizard_extractors.utils.ocr_cache import ocr_cache_key
+        cache = tw.DiskOcrCache(self.dir)
+        k = ocr_cache_key("image", b"pixels", 300, "eng")
+        self.assertNotEqual(k, ocr_cache_key("image", b"pixels", 300, "ita"))
+        self.assertNotEqual(k, ocr_cache_key("image", b"pixels", 200, "eng"))
+        self.assertIsNone(cache.get(k))
+        cache.put(k, "héllo")
+        self.assertEqual(cache.get(k), "héllo")
+
+    def test_interface_is_abstract(self):
+        with self.assertRaises(TypeError):
+            tw.OcrCache()
+
+        class GetOnly(tw.OcrCache):
+            def get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            GetOnly()
+
+    def test_lru_eviction(self):
+        cache = tw.DiskOcrCache(self.dir, max_bytes=300)
+        for i in range(3):
+            cache.put(f"{i:040x}", "x" * 100)
+            time.sleep(0.02)
+        cache.get(f"{0:040x}")          # refresh the oldest entry
+        cache.put(f"{9:040x}", "x" * 100)
+        self.assertIsNotNone(cache.get(f"{0:040x}"))
+        self.assertIsNone(cache.get(f"{1:040x}"))
+        self.assertIsNotNone(cache.get(f"{9:040x}"))
+
+    def test_shared_directory_stays_bounded(self):
+        # Two instances stand in for two processes sharing one directory.
+        first = tw.DiskOcrCache(self.dir, max_bytes=1000)
+        second = tw.DiskOcrCache(self.dir, max_bytes=1000)
+        for i in range(30):
+            (first if i % 2 else second).put(f"{i:040x}", "x" * 100)
+            size = sum(p.stat().st_size for p in self.dir.rglob("*.txt"))
+            self.assertLessEqual(size, 1000, msg=f"after {i + 1} writes")
+        self.assertIsNotNone(first.get(f"{29:040x}"))
+
+    def test_pdf_pages_served_from_cache(self):
+        import fitz
+        from textwizard.wizard_extractors.utils.ocr_cache import ocr_cache_key
+        pdf = FILES_DIR / "file1.pdf"
+        cache = tw.DiskOcrCache(self.dir)
+        with fitz.open(pdf) as doc:
+            for page in doc:
+                if page.get_images(full=True):
+                    pix = page.get_pixmap(dpi=300)
+                    cache.put(ocr_cache_key("pdf-page", pix.samples_mv, 300, "eng"), f"cached {page.number}\n")
+        pages = dict(tw.iter_pages(pdf, ocr=True, ocr_cache=cache))
+        self.assertTrue(any(t.startswith("cached ") for t in pages.values()))
+        self.assertEqual(tw.extract_text(pdf, ocr=True, ocr_cache=self.dir), "".join(pages.values()))
+
+    def test_cache_miss_renders_each_page_once(self):
+        import fitz
+        from unittest import mock
+        with fitz.open() as ocr_doc:
+            ocr_doc.new_page().insert_text((72, 72), "ocr text")
+            ocr_pdf = ocr_doc.tobytes()
+        renders = []
+        get_pixmap = fitz.Page.get_pixmap
+
+        def counting(page, *args, **kwargs):
+            renders.append(page.number)
+            return get_pixmap(page, *args, **kwargs)
+
+        with mock.patch.object(fitz.Page, "get_pixmap", counting), \
+                mock.patch.object(fitz.Pixmap, "pdfocr_tobytes", lambda pix, **kw: ocr_pdf):
+            pages = dict(tw.iter_pages(FILES_DIR / "file1.pdf", ocr=True, ocr_cache=tw.DiskOcrCache(self.dir)))
+        self.assertTrue(renders)
+        self.assertEqual(len(renders), len(set(renders)))
+        self.assertEqual(sum("ocr text" in t for t in pages.values()), len(renders))
+
+
+class TestAdaptiveOcr(unittest.TestCase):
+    @staticmethod
+    def _pdf(text: str, image_rect) -> bytes:
+        import fitz
+        doc = fitz.open()
+        page = doc.new_page()
+        if text:
+            page.insert_textbox(fitz.Rect(50, 400, 550, 800), text)
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 64, 64), False)
+        pix.clear_with(200)
+        page.insert_image(fitz.Rect(*image_rect), pixmap=pix)
+        return doc.tobytes()
+
+    def test_text_page_with_logo_skips_ocr(self):
+        from textwizard.wizard_extractors.tool.pdf_reader import _needs_ocr
+        import fitz
+        raw = self._pdf("Quarterly report with a real text layer. " * 5, (50, 50, 120, 120))
+        with fitz.open(stream=raw, filetype="pdf") as doc:
+            self.assertTrue(_needs_ocr(doc[0], "images"))
+            self.assertFalse(_needs_ocr(doc[0], "adaptive"))
+        # No Tesseract call is made, so this works without OCR installed.
+        self.assertEqual(
+            tw.extract_text(raw, extension="pdf", ocr=True, ocr_mode="adaptive"),
+            tw.extract_text(raw, extension="pdf"),
+        )
+
+    def test_scanned_page_is_ocred(self):
+        from textwizard.wizard_extractors.tool.pdf_reader import _needs_ocr
+        import fitz
+        scan = self._pdf("", (0, 0, 595, 842))
+        caption = self._pdf("Figure 1", (0, 0, 595, 600))
+        with fitz.open(stream=scan, filetype="pdf") as d1, fitz.open(stream=caption, filetype="pdf") as d2:
+            self.assertTrue(_needs_ocr(d1[0], "adaptive"))
+            self.assertTrue(_needs_ocr(d2[0], "adaptive"))
+
+    def test_invalid_mode(self):
+        from textwizard.utils.errors.errors import ValidationError
+        with self.assertRaises(ValidationError):
+            tw.extract_text(FILES_DIR / "file1.pdf", ocr=True, ocr_mode="never")
+
+
+class TestRegionOcr(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = tw.DiskOcrCache(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_auto_dpi_follows_native_resolution(self):
+        from textwizard.wizard_extractors.tool.pdf_reader import _pick_dpi
+        low = {"bbox": (0, 0, 72, 72), "width": 100, "height": 100}     # 100 DPI
+        mid = {"bbox": (0, 0, 72, 72), "width": 200, "height": 200}     # 200 DPI
+        high = {"bbox": (0, 0, 72, 72), "width": 1200, "height": 1200}  # 1200 DPI
+        self.assertEqual(_pick_dpi("auto", [low]), 150)
+        self.assertEqual(_pick_dpi("auto", [mid]), 200)
+        self.assertEqual(_pick_dpi("auto", [low, high]), 300)
+        self.assertEqual(_pick_dpi(220, [high]), 220)
+
+    def test_only_image_regions_are_ocred(self):
+        import fitz
+        from textwizard.wizard_extractors.utils.ocr_cache import ocr_cache_key
+        raw = TestAdaptiveOcr._pdf("Body text that stays native.", (50, 50, 250, 150))
+        with fitz.open(stream=raw, filetype="pdf") as doc:
+            page = doc[0]
+            pix = page.get_pixmap(dpi=150, clip=fitz.Rect(50, 50, 250, 150))
+            self.cache.put(ocr_cache_key("pdf-region", pix.samples_mv, 150, "eng"), "STAMP\n")
+            native = page.get_text()
+        text = tw.extract_text(
+            raw, extension="pdf", ocr=True, ocr_regions=True, ocr_dpi="auto", ocr_cache=self.cache,
+        )
+        self.assertEqual(text, native + "STAMP\n")
+
+    def test_invalid_dpi(self):
+        from textwizard.utils.errors.errors import ValidationError
+        with self.assertRaises(ValidationError):
+            tw.extract_text(FILES_DIR / "file1.pdf", ocr=True, ocr_dpi="high")
+
+
+class TestXlsxStreaming(unittest.TestCase):
+    @staticmethod
+    def _workbook() -> bytes:
+        import io
+        from openpyxl import Workbook
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "People"
+        ws.append(["name", "age", None])
+        ws.append(["Ada", 36, None])
+        ws.append([None, None, None])
+        ws.append(["Alan", 41, "x"])
+        wb.create_sheet("Empty")
+        wb.create_sheet("Notes").append(["hello"])
+        buf = io.BytesIO()
+        wb.save(buf)
+        return buf.getvalue()
+
+    def test_rows_are_streamed_tab_separated(self):
+        raw = self._workbook()
+        text = tw.extract_text(raw, extension="xlsx", xlsx_streaming=True)
+        self.assertEqual(
+            text,
+            "Sheet: People\nname\tage\nAda\t36\nAlan\t41\tx\n\nSheet: Notes\nhello",
+        )
+        self.assertEqual(
+            tw.extract_text(raw, extension="xlsx", pages="Notes", xlsx_streaming=True),
+            "Sheet: Notes\nhello",
+        )
+
+    def test_same_cells_as_pandas(self):
+        path = FILES_DIR / "file1.xlsx"
+        streamed = tw.extract_text(path, xlsx_streaming=True)
+        self.assertTrue(streamed.startswith("Sheet: "))
+        header = streamed.splitlines()[1].split("\t")
+        self.assertIn(" ".join(header[:3]), normalize(tw.extract_text(path), ocr=False))
+
+    def test_xls_falls_back_to_pandas(self):
+        path = FILES_DIR / "file1.xls"
+        self.assertEqual(tw.extract_text(path, xlsx_streaming=True), tw.extract_text(path))
+
+
 if __name__ == "__main__":
     unittest.main()
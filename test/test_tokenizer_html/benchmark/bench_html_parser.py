@@ -0,0 +1,247 @@
+# SPDX-FileCopyrightText: 2024–2025 Mattia Rubino
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Throughput and memory benchmark for ``TWHTMLTokenizer`` and ``TWHTMLParser``.
+
+Runs every page of the bundled corpus (``corpus/*.html``) through two stages:
+
+- ``tokenize``: ``TWHTMLTokenizer(text)`` iterated to EOF;
+- ``parse``: ``TWHTMLParser(text).parse()`` (tokenizer + tree construction).
+
+For each page and stage it reports the best of ``--repeat`` timed samples
+(each long enough to swamp timer noise) as MB/s, tokens/s and nodes/s, and the
+peak traced memory of one extra run.
+
+Typical use, to catch regressions in a change::
+
+    git stash
+    python test/test_tokenizer_html/benchmark/bench_html_parser.py --save-baseline
+    git stash pop
+    python test/test_tokenizer_html/benchmark/bench_html_parser.py --compare
+
+``--compare`` exits with status 1 when a throughput drops (or a peak memory
+grows) by more than ``--threshold`` against the baseline. Baselines are
+machine specific; the environment they were taken on is stored with them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+ROOT = Path(__file__).resolve().parents[3]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from textwizard.utils.tw_html_parser import tokenizer as _tokenizer_module  # noqa: E402
+from textwizard.utils.tw_html_parser.parser import TWHTMLParser  # noqa: E402
+from textwizard.utils.tw_html_parser.tokenizer import TWHTMLTokenizer  # noqa: E402
+
+BENCH_DIR = Path(__file__).resolve().parent
+CORPUS_DIR = BENCH_DIR / "corpus"
+BASELINE_PATH = BENCH_DIR / "baselines" / "html_parser.json"
+
+STAGES = ("tokenize", "parse")
+DEFAULT_THRESHOLD = 0.10
+# Each timed sample loops over the page until it lasts at least this long.
+MIN_SAMPLE_SECONDS = 0.2
+
+
+def load_corpus(names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    pages = {p.stem: p.read_text(encoding="utf-8") for p in sorted(CORPUS_DIR.glob("*.html"))}
+    if names:
+        missing = set(names) - set(pages)
+        if missing:
+            raise SystemExit(f"unknown pages: {', '.join(sorted(missing))}")
+        pages = {name: pages[name] for name in names}
+    return pages
+
+
+def _tokenize(text: str) -> None:
+    for _ in TWHTMLTokenizer(text):
+        pass
+
+
+def _parse(text: str) -> None:
+    TWHTMLParser(text).parse()
+
+
+RUNNERS: Dict[str, Callable[[str], None]] = {"tokenize": _tokenize, "parse": _parse}
+
+
+def _count_nodes(root) -> int:
+    count, stack = 0, list(root.child_nodes)
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.child_nodes)
+    return count
+
+
+def count_work(stage: str, text: str) -> Dict[str, int]:
+    """Tokens (and, for ``parse``, DOM nodes) produced for ``text``; not timed."""
+    if stage == "tokenize":
+        return {"tokens": sum(1 for _ in TWHTMLTokenizer(text)), "nodes": 0}
+    parser = TWHTMLParser(text)
+    tokens = 0
+    process = parser.process_token
+    for token in parser.tokenizer:
+        tokens += 1
+        process(token)
+    parser.finalize_parsing()
+    return {"tokens": tokens, "nodes": _count_nodes(parser.document)}
+
+
+def best_time(run: Callable[[str], None], text: str, repeat: int, min_sample: float = MIN_SAMPLE_SECONDS) -> float:
+    # Like timeit.autorange, but with the collector on: tree construction
+    # allocates heavily and GC time is part of its real cost.
+    number = 1
+    while True:
+        sample = _sample(run, text, number)
+        if sample >= min_sample:
+            break
+        number *= 2 if sample * 2 >= min_sample else 10
+    best = sample / number
+    for _ in range(repeat - 1):
+        best = min(best, _sample(run, text, number) / number)
+    return best
+
+
+def _sample(run: Callable[[str], None], text: str, number: int) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(number):
+        run(text)
+    return time.perf_counter() - start
+
+
+def peak_memory(run: Callable[[str], None], text: str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(text)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(pages: Dict[str, str], stages: Iterable[str] = STAGES, repeat: int = 5,
+            min_sample: float = MIN_SAMPLE_SECONDS) -> Dict[str, dict]:
+    results: Dict[str, dict] = {}
+    for stage in stages:
+        run = RUNNERS[stage]
+        for name, text in pages.items():
+            work = count_work(stage, text)
+            seconds = best_time(run, text, repeat, min_sample)
+            size = len(text.encode("utf-8"))
+            results[f"{name}/{stage}"] = {
+                "bytes": size,
+                "seconds": seconds,
+                "mb_per_s": size / seconds / 1e6,
+                "tokens_per_s": work["tokens"] / seconds,
+                "nodes_per_s": work["nodes"] / seconds,
+                "peak_kib": peak_memory(run, text) / 1024,
+            }
+    return results
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "compiled_tokenizer": str(_tokenizer_module._tokenize_c is not None),
+    }
+
+
+def compare(current: Dict[str, dict], baseline: Dict[str, dict], threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """Return one message per regression larger than ``threshold`` (a fraction)."""
+    regressions = []
+    for key, cur in current.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        # Token and node counts are fixed per page, so MB/s speaks for all three rates.
+        if cur["mb_per_s"] < base["mb_per_s"] * (1 - threshold):
+            regressions.append(f"{key}: MB/s {base['mb_per_s']:.2f} -> {cur['mb_per_s']:.2f} "
+                               f"({cur['mb_per_s'] / base['mb_per_s'] - 1:+.1%})")
+        if base["peak_kib"] and cur["peak_kib"] > base["peak_kib"] * (1 + threshold):
+            regressions.append(f"{key}: peak KiB {base['peak_kib']:,.0f} -> {cur['peak_kib']:,.0f} "
+                               f"({cur['peak_kib'] / base['peak_kib'] - 1:+.1%})")
+    return regressions
+
+
+def format_table(current: Dict[str, dict], baseline: Optional[Dict[str, dict]] = None) -> str:
+    header = f"{'page/stage':<24}{'KiB':>8}{'MB/s':>9}{'tokens/s':>12}{'nodes/s':>12}{'peak KiB':>10}"
+    if baseline:
+        header += f"{'vs base':>9}"
+    lines = [header, "-" * len(header)]
+    for key, r in current.items():
+        line = (f"{key:<24}{r['bytes'] / 1024:>8.0f}{r['mb_per_s']:>9.2f}{r['tokens_per_s']:>12,.0f}"
+                f"{r['nodes_per_s']:>12,.0f}{r['peak_kib']:>10,.0f}")
+        base = (baseline or {}).get(key)
+        if base:
+            line += f"{r['mb_per_s'] / base['mb_per_s'] - 1:>+9.1%}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def save_baseline(path: Path, results: Dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"environment": environment(), "results": results}
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    ap.add_argument("pages", nargs="*", help="corpus pages to run (default: all)")
+    ap.add_argument("--stage", choices=STAGES + ("all",), default="all")
+    ap.add_argument("--repeat", type=int, default=5, help="timed samples per page, best is kept")
+    ap.add_argument("--save-baseline", nargs="?", const=BASELINE_PATH, type=Path, metavar="PATH",
+                    help=f"write results as the baseline (default {BASELINE_PATH.relative_to(ROOT)})")
+    ap.add_argument("--compare", nargs="?", const=BASELINE_PATH, type=Path, metavar="PATH",
+                    help="compare against a saved baseline; exit 1 on regression")
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                    help="allowed relative slowdown before --compare fails (default 0.10)")
+    ap.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = ap.parse_args(argv)
+
+    stages = STAGES if args.stage == "all" else (args.stage,)
+    results = measure(load_corpus(args.pages), stages, max(1, args.repeat))
+
+    baseline = None
+    if args.compare:
+        saved = load_baseline(args.compare)
+        baseline = saved["results"]
+        if saved.get("environment") != environment():
+            print(f"warning: baseline taken on {saved.get('environment')}, now {environment()}", file=sys.stderr)
+
+    print(json.dumps(results, indent=2) if args.json else format_table(results, baseline))
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"baseline saved to {args.save_baseline}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nregressions:\n  " + "\n  ".join(regressions))
+            return 1
+        print(f"\nno regression beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
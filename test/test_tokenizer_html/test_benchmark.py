@@ -0,0 +1,46 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "benchmark"))
+import bench_html_parser as bench  # noqa: E402
+
+
+class BenchmarkHarnessTests(unittest.TestCase):
+    def test_corpus_is_bundled(self):
+        pages = bench.load_corpus()
+        self.assertEqual(set(pages), {"small", "large", "table_heavy", "script_heavy", "entity_heavy", "malformed"})
+
+    def test_measure_reports_rates_and_memory(self):
+        results = bench.measure(bench.load_corpus(["small"]), repeat=1, min_sample=0.0)
+        self.assertEqual(set(results), {"small/tokenize", "small/parse"})
+        parse = results["small/parse"]
+        for key in ("mb_per_s", "tokens_per_s", "nodes_per_s", "peak_kib"):
+            self.assertGreater(parse[key], 0, key)
+        self.assertEqual(results["small/tokenize"]["nodes_per_s"], 0)
+
+    def test_compare_flags_regressions_only(self):
+        base = {"p/parse": {"mb_per_s": 2.0, "peak_kib": 100.0}}
+        self.assertEqual(bench.compare({"p/parse": {"mb_per_s": 1.9, "peak_kib": 105.0}}, base), [])
+        slow = bench.compare({"p/parse": {"mb_per_s": 1.0, "peak_kib": 100.0}}, base)
+        fat = bench.compare({"p/parse": {"mb_per_s": 2.0, "peak_kib": 200.0}}, base)
+        self.assertEqual(len(slow), 1)
+        self.assertIn("MB/s", slow[0])
+        self.assertIn("peak KiB", fat[0])
+
+    def test_baseline_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "base.json"
+            rc = bench.main(["small", "--stage", "tokenize", "--repeat", "1", "--save-baseline", str(path)])
+            self.assertEqual(rc, 0)
+            saved = json.loads(path.read_text())
+            self.assertIn("small/tokenize", saved["results"])
+            self.assertEqual(saved["environment"], bench.environment())
+            self.assertEqual(bench.main(["small", "--stage", "tokenize", "--repeat", "1",
+                                         "--compare", str(path), "--threshold", "0.99"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import time
+import unittest
+
+from textwizard.utils.tw_html_parser.dom import Document
+
+
+def build(n):
+    doc = Document()
+    parent = doc.create_element("div")
+    doc.append_child(parent)
+    kids = [doc.create_text_node(str(i)) for i in range(n)]
+    for k in kids:
+        parent.append_child(k)
+    return doc, parent, kids
+
+
+def walk_links(parent):
+    out, node = [], parent.first_child
+    while node is not None:
+        out.append(node)
+        node = node.next_sibling
+    back, node = [], parent.last_child
+    while node is not None:
+        back.append(node)
+        node = node.previous_sibling
+    return out, back[::-1]
+
+
+class SiblingLinkTests(unittest.TestCase):
+    def assertConsistent(self, parent):
+        forward, backward = walk_links(parent)
+        self.assertEqual(forward, backward)
+        self.assertEqual(list(parent.child_nodes), forward)
+        for child in forward:
+            self.assertIs(child.parent_node, parent)
+
+    def test_links_follow_append_insert_remove(self):
+        doc, parent, kids = build(5)
+        self.assertIs(parent.first_child, kids[0])
+        self.assertIs(parent.last_child, kids[-1])
+        self.assertIsNone(kids[0].previous_sibling)
+        self.assertIs(kids[2].next_sibling, kids[3])
+
+        parent.remove_child(kids[2])
+        self.assertIsNone(kids[2].parent_node)
+        self.assertIsNone(kids[2].next_sibling)
+        self.assertIs(kids[1].next_sibling, kids[3])
+        self.assertConsistent(parent)
+
+        new = doc.create_element("b")
+        parent.insert_before(new, kids[0])
+        self.assertIs(parent.first_child, new)
+        parent.insert_before(kids[2], None)
+        self.assertIs(parent.last_child, kids[2])
+        self.assertConsistent(parent)
+
+        # Moving a node detaches it from its old parent first.
+        other = doc.create_element("p")
+        doc.append_child(other)
+        other.append_child(kids[3])
+        self.assertConsistent(parent)
+        self.assertConsistent(other)
+        self.assertNotIn(kids[3], parent.child_nodes)
+
+        parent.replace_children(kids[4], new)
+        self.assertEqual(parent.child_nodes, [kids[4], new])
+        self.assertIsNone(kids[0].parent_node)
+        self.assertConsistent(parent)
+        parent.replace_children()
+        self.assertFalse(parent.has_child_nodes())
+        self.assertIsNone(parent.first_child)
+
+    def test_remove_unknown_child_raises(self):
+        doc, parent, _ = build(2)
+        with self.assertRaises(ValueError):
+            parent.remove_child(doc.create_text_node("x"))
+        with self.assertRaises(ValueError):
+            parent.insert_before(doc.create_text_node("x"), doc.create_text_node("y"))
+
+    def test_clone_keeps_links(self):
+        _, parent, _ = build(4)
+        copy = parent.clone_node(deep=True)
+        self.assertConsistent(copy)
+        self.assertEqual([c.data for c in copy.child_nodes], ["0", "1", "2", "3"])
+
+    def test_removal_is_linear(self):
+        def cost(n):
+            _, parent, kids = build(n)
+            start = time.perf_counter()
+            for k in kids[n // 2:] + kids[:n // 2]:
+                parent.remove_child(k)
+            return time.perf_counter() - start
+
+        small, large = cost(5_000), cost(50_000)
+        # Quadratic removal would be ~100x slower; allow generous noise.
+        self.assertLess(large, small * 40 + 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
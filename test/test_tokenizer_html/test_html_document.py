@@ -0,0 +1,138 @@
+import sys
+import unittest
+from pathlib import Path
+
+import textwizard as tw
+from textwizard.utils.tw_html_parser import html_document
+from textwizard.utils.tw_html_parser.dom import NodeType
+from textwizard.utils.tw_html_parser.html_document import (
+    clear_parse_cache, parse_html, set_parse_cache_size,
+)
+from textwizard.utils.tw_html_parser.serializer import HTMLSerializer
+
+sys.path.insert(0, str(Path(__file__).parent))
+from test_tree_construction import parse_html5lib_dat  # noqa: E402
+
+TREE_DIR = Path(__file__).parent / "test_tree_construction"
+
+HTML = (
+    '<!DOCTYPE html><html><head><title>T</title><script>var a = 1;</script></head>'
+    '<body><h1 id="t">Title</h1><p class="x">One &amp; <b>two</b></p>'
+    '<ul><li>a</li><li>b</li></ul><template><i>t</i></template><!-- c --></body></html>'
+)
+
+
+def find(root, tag):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.node_type == NodeType.ELEMENT_NODE and node.tag_name == tag:
+            return node
+        stack.extend(reversed(node.child_nodes))
+    return None
+
+
+def render(doc):
+    return HTMLSerializer(quote_attr_values="always").render(doc)
+
+
+class CloneNodeTests(unittest.TestCase):
+    def test_deep_clone_is_equal_and_detached(self):
+        doc = parse_html(HTML).document
+        copy = doc.clone_node(deep=True)
+        self.assertEqual(render(copy), render(doc))
+
+        stack = [(doc, copy)]
+        while stack:
+            a, b = stack.pop()
+            self.assertIsNot(a, b)
+            self.assertIs(b.owner_document, copy)
+            for ca, cb in zip(a.child_nodes, b.child_nodes):
+                self.assertIs(cb.parent_node, b)
+                stack.append((ca, cb))
+
+        h1 = find(copy, "h1")
+        h1.set_attribute("id", "changed")
+        h1.parent_node.remove_child(h1)
+        self.assertEqual(find(doc, "h1").get_attribute("id"), "t")
+
+    def test_shallow_clone(self):
+        p = find(parse_html(HTML).document, "h1")
+        copy = p.clone_node()
+        self.assertEqual(copy.tag_name, "h1")
+        self.assertEqual(copy.get_attributes(), {"id": "t"})
+        self.assertEqual(copy.child_nodes, [])
+        self.assertIsNone(copy.parent_node)
+        self.assertEqual(copy.node_type, NodeType.ELEMENT_NODE)
+
+
+class ParsedDocumentReuseTests(unittest.TestCase):
+    def test_public_apis_accept_document(self):
+        doc = tw.parse_html(HTML)
+        self.assertIsInstance(doc, tw.HTMLDocument)
+        before = render(doc.document)
+        self.assertEqual(tw.clean_html(doc), tw.clean_html(HTML))
+        self.assertEqual(tw.clean_html(doc, remove_script=True, remove_comments=True),
+                         tw.clean_html(HTML, remove_script=True, remove_comments=True))
+        self.assertEqual(tw.clean_html(doc, remove_heading_tags=False),
+                         tw.clean_html(HTML, remove_heading_tags=False))
+        self.assertEqual(tw.beautiful_html(doc), tw.beautiful_html(HTML))
+        self.assertEqual(tw.html_to_markdown(doc), tw.html_to_markdown(HTML))
+        self.assertEqual(render(doc.document), before)
+
+    def test_default_clean_is_the_same_for_documents(self):
+        for dat in sorted(TREE_DIR.glob("*.dat")):
+            for case in parse_html5lib_dat(dat):
+                if not case["container"]:
+                    src = case["input_html"]
+                    self.assertEqual(tw.clean_html(tw.parse_html(src)), tw.clean_html(src), msg=repr(src))
+        src = "<table><tr><td>x</td></tr>stray</table>after"
+        self.assertEqual(tw.clean_html(src), "stray x after")
+        self.assertEqual(tw.clean_html(tw.parse_html(src)), "stray x after")
+
+    def test_parse_html_passes_documents_through(self):
+        doc = parse_html(HTML)
+        self.assertIs(parse_html(doc), doc)
+        with self.assertRaises(TypeError):
+            parse_html(b"<p>x</p>")
+
+
+class ParseCacheTests(unittest.TestCase):
+    def setUp(self):
+        clear_parse_cache()
+        self.addCleanup(set_parse_cache_size, html_document.DEFAULT_PARSE_CACHE_SIZE)
+        self.addCleanup(clear_parse_cache)
+
+    def test_cache_is_opt_in_and_keyed_by_content(self):
+        self.assertIsNot(parse_html(HTML), parse_html(HTML))
+        doc = parse_html(HTML, cache=True)
+        self.assertIs(parse_html("".join(list(HTML)), cache=True), doc)
+        self.assertIsNot(parse_html(HTML + " ", cache=True), doc)
+
+    def test_time_budget_truncation_is_not_cached(self):
+        limits = tw.ParserLimits(time_budget=0.0)
+        doc = parse_html(HTML, cache=True, limits=limits)
+        self.assertEqual(doc.truncation_reason, "time_budget")
+        self.assertIsNot(parse_html(HTML, cache=True, limits=limits), doc)
+        limits = tw.ParserLimits(max_depth=2)
+        doc = parse_html(HTML, cache=True, limits=limits)
+        self.assertTrue(doc.truncated)
+        self.assertIs(parse_html(HTML, cache=True, limits=limits), doc)
+
+    def test_cache_is_bounded_lru(self):
+        set_parse_cache_size(2)
+        a = parse_html("<p>a</p>", cache=True)
+        b = parse_html("<p>b</p>", cache=True)
+        self.assertIs(parse_html("<p>a</p>", cache=True), a)
+        parse_html("<p>c</p>", cache=True)  # evicts b, the least recently used
+        self.assertIs(parse_html("<p>a</p>", cache=True), a)
+        self.assertIsNot(parse_html("<p>b</p>", cache=True), b)
+
+        set_parse_cache_size(0)
+        self.assertIsNot(parse_html("<p>a</p>", cache=True), parse_html("<p>a</p>", cache=True))
+        with self.assertRaises(ValueError):
+            set_parse_cache_size(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import itertools
+import unittest
+from unittest import mock
+
+import textwizard as tw
+from textwizard.utils.tw_html_parser import parser as parser_module
+from textwizard.utils.tw_html_parser.dom import NodeType
+from textwizard.utils.tw_html_parser.parser import ParserLimits, TWHTMLParser, parse_fragment
+from textwizard.utils.tw_html_parser.serializer import HTMLSerializer
+
+
+def depth(node):
+    best, stack = 0, [(node, 0)]
+    while stack:
+        n, d = stack.pop()
+        best = max(best, d)
+        stack.extend((c, d + 1) for c in n.child_nodes)
+    return best
+
+
+def render(doc):
+    return HTMLSerializer(quote_attr_values="always").render(doc)
+
+
+class ParserLimitsTests(unittest.TestCase):
+    def test_no_limits_by_default(self):
+        parser = TWHTMLParser("<div>" * 600)
+        parser.parse()
+        self.assertFalse(parser.truncated)
+        self.assertIsNone(parser.truncation_reason)
+
+    def test_max_depth_truncates(self):
+        parser = TWHTMLParser("<div>" * 100_000 + "tail", limits=ParserLimits(max_depth=50))
+        doc = parser.parse()
+        self.assertTrue(parser.truncated)
+        self.assertEqual(parser.truncation_reason, "max_depth")
+        self.assertLessEqual(depth(doc), 53)
+        self.assertTrue(any("max_depth" in e for e in parser.errors))
+
+    def test_max_nodes_truncates(self):
+        parser = TWHTMLParser("<p>x</p>" * 1000, limits=ParserLimits(max_nodes=100))
+        parser.parse()
+        self.assertEqual(parser.truncation_reason, "max_nodes")
+        self.assertLessEqual(parser.node_count, 101)
+
+    def test_max_formatting_elements_keeps_content(self):
+        html = "<div>" + "".join(f"<b class=c{i}>" for i in range(50)) + "</div>" + "<p>x</p>" * 20
+        parser = TWHTMLParser(html, limits=ParserLimits(max_formatting_elements=5))
+        doc = parser.parse()
+        self.assertEqual(parser.truncation_reason, "max_formatting_elements")
+        self.assertLessEqual(len(parser.active_formatting_elements), 5)
+        full = TWHTMLParser(html).parse()
+        self.assertLess(render(doc).count("<b "), render(full).count("<b "))
+        self.assertEqual(render(doc).count("<p>"), 20)
+
+    def test_time_budget_truncates(self):
+        parser = TWHTMLParser("<p>x</p>" * 5000, limits=ParserLimits(time_budget=0.0))
+        parser.parse()
+        self.assertEqual(parser.truncation_reason, "time_budget")
+
+    def test_time_budget_truncates_push_parsing(self):
+        # Every chunk holds fewer tokens than the clock interval; the time
+        # spent in earlier chunks must still stop the parser.
+        clock = itertools.count(step=1.0)
+        with mock.patch.object(parser_module, "monotonic", lambda: next(clock)):
+            parser = TWHTMLParser(limits=ParserLimits(time_budget=5.0))
+            for _ in range(100):
+                parser.feed("<p>x</p>")
+            doc = parser.close()
+        self.assertEqual(parser.truncation_reason, "time_budget")
+        self.assertLess(render(doc).count("<p>"), 10)
+
+    def test_limits_that_are_not_reached_change_nothing(self):
+        html = "<!DOCTYPE html><table><tr><td>a<b>b<i>c</b>d</i></table><ul><li>x<li>y</ul>"
+        parser = TWHTMLParser(html, limits=ParserLimits())
+        self.assertEqual(render(parser.parse()), render(TWHTMLParser(html).parse()))
+        self.assertFalse(parser.truncated)
+
+    def test_push_parser_stops_feeding(self):
+        parser = TWHTMLParser(limits=ParserLimits(max_depth=10))
+        for _ in range(100):
+            parser.feed("<div>")
+        parser.feed("text")
+        doc = parser.close()
+        self.assertEqual(parser.truncation_reason, "max_depth")
+        self.assertLessEqual(depth(doc), 13)
+
+    def test_fragment(self):
+        frag = parse_fragment("<span>" * 1000, limits=ParserLimits(max_depth=20))
+        self.assertLessEqual(depth(frag), 21)
+        self.assertEqual(frag.child_nodes[0].node_type, NodeType.ELEMENT_NODE)
+
+    def test_parse_html_reports_truncation(self):
+        doc = tw.parse_html("<div>" * 1000, limits=tw.ParserLimits(max_depth=30))
+        self.assertTrue(doc.truncated)
+        self.assertEqual(doc.truncation_reason, "max_depth")
+        self.assertFalse(tw.parse_html("<div>x</div>", limits=tw.ParserLimits()).truncated)
+        self.assertEqual(tw.clean_html(tw.parse_html("<div>" * 100 + "x", limits=tw.ParserLimits(max_depth=30))), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
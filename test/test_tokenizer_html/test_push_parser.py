@@ -0,0 +1,139 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+
+from textwizard.utils.tw_html_parser.parser import ParserLimits, TWHTMLParser
+from textwizard.utils.tw_html_parser.sax import TWHTMLEventParser
+from textwizard.utils.tw_html_parser.tokenizer import TWHTMLTokenizer
+from textwizard.utils.tw_html_parser.tokens import NEED_DATA, CHARACTER
+
+sys.path.insert(0, str(Path(__file__).parent))
+from test_tree_construction import parse_html5lib_dat, dom_to_html5lib_tree_dump  # noqa: E402
+
+TREE_DIR = Path(__file__).parent / "test_tree_construction"
+CHUNK_SIZES = (1, 1, 2, 3, 7, 64, 200)
+
+
+def feed_in_chunks(text, rng):
+    parser = TWHTMLParser()
+    i = 0
+    while i < len(text):
+        n = rng.choice(CHUNK_SIZES)
+        parser.feed(text[i:i + n])
+        i += n
+    return parser.close()
+
+
+def coalesced(tokens):
+    out = []
+    for tok in tokens:
+        if tok is NEED_DATA:
+            continue
+        d = tok.to_dict()
+        if out and d["type"] == "Characters" and out[-1]["type"] == "Characters":
+            out[-1]["data"] += d["data"]
+        else:
+            d.pop("space_character", None)
+            d.pop("null_character", None)
+            out.append(d)
+    return out
+
+
+class PushParserTests(unittest.TestCase):
+    def test_random_chunking_matches_one_shot_parse(self):
+        rng = random.Random(1234)
+        for dat in sorted(TREE_DIR.glob("*.dat")):
+            for case in parse_html5lib_dat(dat):
+                if case["container"]:
+                    continue
+                src = case["input_html"]
+                expected = dom_to_html5lib_tree_dump(TWHTMLParser(src).parse())
+                got = dom_to_html5lib_tree_dump(feed_in_chunks(src, rng))
+                self.assertEqual(got, expected, msg=f"{dat.name}: {src!r}")
+
+    def test_crlf_split_across_chunks(self):
+        one_shot = TWHTMLParser("<pre>a\r\nb\rc\r\n\r\nd</pre>").parse()
+        parser = TWHTMLParser()
+        for chunk in ("<pre>a\r", "\nb\r", "c\r", "\n\r", "\nd</pre>"):
+            parser.feed(chunk)
+        doc = parser.close()
+        self.assertEqual(dom_to_html5lib_tree_dump(doc), dom_to_html5lib_tree_dump(one_shot))
+
+    def test_constructor_text_is_first_chunk(self):
+        parser = TWHTMLParser("<p>he")
+        parser.feed("llo</p>")
+        doc = parser.close()
+        self.assertEqual(dom_to_html5lib_tree_dump(doc), dom_to_html5lib_tree_dump(TWHTMLParser("<p>hello</p>").parse()))
+
+    def test_close_without_feed_parses_constructor_text(self):
+        doc = TWHTMLParser("<b>x</b>").close()
+        self.assertIn('|       "x"', dom_to_html5lib_tree_dump(doc))
+
+    def test_long_character_references_split_across_chunks(self):
+        zeros = "0" * 100
+        for src in ("<p>x&#" + zeros + "65;y</p>", "<p>x&#x" + zeros + "41;y</p>",
+                    '<p title="&#' + zeros + '65;">x</p>', "<p>&amp" + "b" * 100 + "y</p>"):
+            expected = dom_to_html5lib_tree_dump(TWHTMLParser(src).parse())
+            for size in (1, 3):
+                parser = TWHTMLParser()
+                for i in range(0, len(src), size):
+                    parser.feed(src[i:i + size])
+                self.assertEqual(dom_to_html5lib_tree_dump(parser.close()), expected, msg=f"{size}: {src!r}")
+
+    def test_tokens_arrive_before_close(self):
+        parser = TWHTMLParser()
+        parser.feed("<div><p>first paragraph</p>" + " " * 100)
+        self.assertEqual([e.tag_name for e in parser.open_elements], ["html", "body", "div"])
+
+    def test_bytes_are_rejected(self):
+        stopped = TWHTMLParser(limits=ParserLimits(max_depth=1))
+        stopped.feed("<div><div><div>")
+        for feeder in (TWHTMLParser(), TWHTMLEventParser(), TWHTMLTokenizer("", incremental=True), stopped):
+            with self.subTest(feeder=type(feeder).__name__):
+                with self.assertRaisesRegex(TypeError, "expects str, got bytes"):
+                    feeder.feed(b"<p>x</p>")
+        parser = TWHTMLParser()
+        with self.assertRaises(TypeError):
+            parser.feed(b"")
+        parser.feed("<p>x</p>")
+        self.assertIn('|       "x"', dom_to_html5lib_tree_dump(parser.close()))
+
+
+class IncrementalTokenizerTests(unittest.TestCase):
+    def test_same_tokens_as_one_shot(self):
+        text = '<!DOCTYPE html><a href="x&amp;y">&notin; &notit; &#x41;</a><!-- c -->\r\n<br/>'
+        expected = coalesced(TWHTMLTokenizer(text).tokenize())
+        for size in (1, 2, 5, 13):
+            tok = TWHTMLTokenizer("", incremental=True)
+            stream = iter(tok)
+            got = []
+            for i in range(0, len(text), size):
+                tok.feed(text[i:i + size])
+                for t in stream:
+                    if t is NEED_DATA:
+                        break
+                    got.append(t)
+            tok.close()
+            got.extend(stream)
+            self.assertEqual(coalesced(got), expected, msg=f"chunk size {size}")
+
+    def test_suspends_instead_of_eof(self):
+        tok = TWHTMLTokenizer("", incremental=True)
+        tok.feed("abc")
+        stream = iter(tok)
+        self.assertIs(next(stream), NEED_DATA)
+        tok.close()
+        tokens = list(stream)
+        self.assertEqual(tokens[0].type, CHARACTER)
+        self.assertEqual(tokens[0].data, "abc")
+
+    def test_feed_after_close_raises(self):
+        tok = TWHTMLTokenizer("", incremental=True)
+        tok.close()
+        with self.assertRaises(ValueError):
+            tok.feed("x")
+
+
+if __name__ == "__main__":
+    unittest.main()
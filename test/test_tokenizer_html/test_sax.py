@@ -0,0 +1,204 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from textwizard.utils.tw_html_parser.parser import TWHTMLParser
+from textwizard.utils.tw_html_parser.sax import (
+    START, END, TEXT, ContentHandler, TWHTMLEventParser, iter_events, sax_parse,
+)
+from textwizard.wizard_cleaners.tw_html_cleaner import html_cleaner
+from textwizard.wizard_cleaners.tw_html_cleaner.html_cleaner import HTMLCleaner
+
+sys.path.insert(0, str(Path(__file__).parent))
+from test_tree_construction import parse_html5lib_dat  # noqa: E402
+
+TREE_DIR = Path(__file__).parent / "test_tree_construction"
+
+
+def corpus():
+    for dat in sorted(TREE_DIR.glob("*.dat")):
+        for case in parse_html5lib_dat(dat):
+            if not case["container"]:
+                yield case["input_html"]
+
+
+class EventSequenceTests(unittest.TestCase):
+    def test_basic_document(self):
+        events = list(iter_events('<!DOCTYPE html><p class=x>a<!--c--><br>b</p>'))
+        self.assertEqual(events, [
+            ("doctype", "html", None),
+            (START, "p", {"class": "x"}),
+            (TEXT, "a", None),
+            ("comment", "c", None),
+            (START, "br", {}),
+            (END, "br", None),
+            (TEXT, "b", None),
+            (END, "p", None),
+        ])
+
+    def test_implied_end_tags(self):
+        names = [(k, v) for k, v, _ in iter_events("<ul><li>1<li>2</ul><p>x<div>y") if k != TEXT]
+        self.assertEqual(names, [
+            (START, "ul"), (START, "li"), (END, "li"), (START, "li"), (END, "li"), (END, "ul"),
+            (START, "p"), (END, "p"), (START, "div"), (END, "div"),
+        ])
+
+    def test_raw_text_is_not_tokenized(self):
+        events = list(iter_events("<script>if (a<b) x='</p>'</script><title>&amp;<i></title>"))
+        texts = [v for k, v, _ in events if k == TEXT]
+        self.assertEqual(texts, ["if (a<b) x='</p>'", "&<i>"])
+
+    def test_foreign_content(self):
+        events = list(iter_events("<svg><foreignobject><p>x</svg><math><mi/></math>"))
+        starts = [v for k, v, _ in events if k == START]
+        self.assertEqual(starts, ["svg", "foreignObject", "p", "math", "mi"])
+        self.assertEqual(list(iter_events("<svg><![CDATA[a<b]]></svg>"))[1], (TEXT, "a<b", None))
+
+    def test_tag_names_are_lowercased(self):
+        self.assertEqual([v for k, v, _ in iter_events("<DIV>x</Div>") if k != TEXT], ["div", "div"])
+
+    def test_events_are_balanced_on_corpus(self):
+        for src in corpus():
+            depth = 0
+            for kind, _, _ in iter_events(src):
+                if kind == START:
+                    depth += 1
+                elif kind == END:
+                    depth -= 1
+                    self.assertGreaterEqual(depth, 0, msg=repr(src))
+            self.assertEqual(depth, 0, msg=repr(src))
+
+
+class HandlerAndIncrementalTests(unittest.TestCase):
+    def test_sax_parse_calls_handler(self):
+        calls = []
+
+        class Recorder(ContentHandler):
+            def start_element(self, name, attrs):
+                calls.append(("start", name, attrs))
+
+            def end_element(self, name):
+                calls.append(("end", name))
+
+            def characters(self, data):
+                calls.append(("text", data))
+
+        sax_parse("<a href=u>t</a><!--ignored-->", Recorder())
+        self.assertEqual(calls, [("start", "a", {"href": "u"}), ("text", "t"), ("end", "a")])
+
+    def test_feed_matches_one_shot(self):
+        rng = random.Random(7)
+        for src in list(corpus())[:300]:
+            parser = TWHTMLEventParser()
+            got = []
+            i = 0
+            while i < len(src):
+                n = rng.choice((1, 2, 5, 40))
+                got.extend(parser.feed(src[i:i + n]))
+                i += n
+            got.extend(parser.close())
+            self.assertEqual(self._merged(got), self._merged(iter_events(src)), msg=repr(src))
+
+    @staticmethod
+    def _merged(events):
+        out = []
+        for ev in events:
+            if out and ev[0] == TEXT and out[-1][0] == TEXT:
+                out[-1] = (TEXT, out[-1][1] + ev[1], None)
+            else:
+                out.append(ev)
+        return out
+
+
+class StreamingTextExtractionTests(unittest.TestCase):
+    CASES = (
+        "<html>\n<head><title>T</title></head>\n<body><p>One<p>Two<ul><li>a<li>b</ul></body></html>",
+        "<div>1<script>2<script>3</script>4</script>5</div>",
+        "  lead <b>bold</b>tail<br>next\n<pre>\ncode</pre>",
+        "<svg><title>t</title><text>s</text></svg>after",
+    )
+
+    # Inputs whose tree construction the events do not replay: the cleaner
+    # must fall back to the DOM for them.
+    FALLBACK_CASES = (
+        "<body><table>\x00filler\x00text\x00",
+        "<table><tr><td>x</td></tr>stray</table>after",
+        "<select><b>a</b><p>b</select>",
+        "<frameset><frame></frameset>text",
+        "<head></head> <style>s</style>",
+        "<p>x<template><b>y</b></template>z</p>",
+        "<p>a<template x=1><button x=1>&lt;",
+        "<head><noscript><math>s</noscript><<![CDATA[x]]>",
+        "<form><math>a</form><![CDATA[</math>]]>",
+    )
+
+    def test_same_text_as_dom_extraction(self):
+        for src in self.CASES:
+            dom = HTMLCleaner._extract_text(TWHTMLParser(src).parse())
+            self.assertEqual(HTMLCleaner._extract_text_streaming(src), dom, msg=repr(src))
+
+    def test_nul_and_end_tag_quirks(self):
+        for src in ("<table><tr><td><math><mtext>\x00a", "<plaintext>a\x00b\x00", "<p>a\x00b",
+                    "<style>a</noframes>b", "<noembed>a</noframes>b", "<svg><g>a</br>b<title>c</t",
+                    "<p>x<table></table><plaintext>z", "<!DOCTYPE html><p>x<table></table><plaintext>z",
+                    "<math><mi><head><![CDATA[x]]>", "<option><math><html></option><button>pe</mi>\x00",
+                    "<svg><td><foreignObject><span></td><![CDATA[x]]>",
+                    "<table><caption><svg><g>a</g></svg><p>b</caption></table>c",
+                    "<svg><g><template>]]>x",
+                    "<table><tr><td><b>x</td></tr></table>"):
+            dom = HTMLCleaner._extract_text(TWHTMLParser(src).parse())
+            self.assertEqual(HTMLCleaner._extract_text_streaming(src), dom, msg=repr(src))
+
+    def test_unreplayed_inputs_fall_back_to_dom(self):
+        cleaner = HTMLCleaner()
+        for src in self.FALLBACK_CASES:
+            self.assertIsNone(HTMLCleaner._extract_text_streaming(src), msg=repr(src))
+            self.assertEqual(cleaner.clean(src), HTMLCleaner._extract_text(TWHTMLParser(src).parse()), msg=repr(src))
+
+    def test_corpus_text_matches_dom(self):
+        for src in corpus():
+            got = HTMLCleaner._extract_text_streaming(src)
+            if got is not None:
+                self.assertEqual(got, HTMLCleaner._extract_text(TWHTMLParser(src).parse()), msg=repr(src))
+
+    def test_random_inputs_match_dom(self):
+        # Recombined corpus fragments mixed with the tags whose insertion
+        # modes the events approximate; fixed seed for reproducibility.
+        rng = random.Random(1234)
+        sources = list(corpus())
+        tags = ("template", "textarea", "button", "svg", "math", "annotation-xml", "noscript", "html", "body",
+                "head", "p", "a", "b", "table", "td", "tr", "caption", "select", "title", "mi", "foreignObject",
+                "form", "li", "div", "font", "br", "plaintext", "script", "option")
+        atoms = ("&lt;", "&amp;", "]]>", "<![CDATA[x]]>", "\x00", "x", "y z", " ", "<!--c-->", "<!DOCTYPE html>")
+
+        def piece():
+            r = rng.random()
+            if r < 0.35:
+                return "<%s%s>" % (rng.choice(tags), rng.choice(("", " x=1", ' encoding="text/html"')))
+            if r < 0.5:
+                return "</%s>" % rng.choice(tags)
+            if r < 0.8:
+                return rng.choice(atoms)
+            src = rng.choice(sources)
+            i, j = sorted(rng.randint(0, len(src)) for _ in range(2))
+            return src[i:j]
+
+        for _ in range(3000):
+            src = "".join(piece() for _ in range(rng.randint(2, 10)))
+            try:
+                dom = HTMLCleaner._extract_text(TWHTMLParser(src).parse())
+            except RecursionError:
+                continue
+            got = HTMLCleaner._extract_text_streaming(src)
+            if got is not None:
+                self.assertEqual(got, dom, msg=repr(src))
+
+    def test_default_clean_builds_no_dom(self):
+        with mock.patch.object(html_cleaner, "TWHTMLParser", side_effect=AssertionError("DOM built")):
+            self.assertEqual(HTMLCleaner().clean("<p>a</p><p>b</p>"), "a b")
+
+
+if __name__ == "__main__":
+    unittest.main()
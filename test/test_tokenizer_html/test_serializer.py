@@ -0,0 +1,90 @@
+import io
+import sys
+import unittest
+
+from textwizard.utils.tw_html_parser.parser import TWHTMLParser
+from textwizard.utils.tw_html_parser.serializer import HTMLSerializer
+from textwizard.utils.tw_html_parser.serializer_pretty import PrettyHTMLSerializer
+
+PAGE = ("<!DOCTYPE html><html><head><title>a<b</title><style>p>b{}</style></head>"
+        "<body><!-- c --><div id=x class='a b'><p>café ☃ &amp; <br>text<img src=i></p>"
+        "<ul><li>one<li>two</ul><textarea>x</textarea></div></body></html>")
+
+
+def find(node, tag):
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if getattr(n, "tag_name", None) == tag:
+            return n
+        stack.extend(n.child_nodes)
+
+
+class RecordingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def write(self, s):
+        self.chunks.append(s)
+        return super().write(s)
+
+
+class RenderToTests(unittest.TestCase):
+    def setUp(self):
+        self.doc = TWHTMLParser(PAGE).parse()
+
+    def test_text_stream_matches_render(self):
+        for ser in (HTMLSerializer(), HTMLSerializer(quote_attr_values="always"),
+                    PrettyHTMLSerializer(), PrettyHTMLSerializer(indent=4, expand_mixed_content=True)):
+            with self.subTest(serializer=type(ser).__name__):
+                out = io.StringIO()
+                ser.render_to(self.doc, out)
+                self.assertEqual(out.getvalue(), ser.render(self.doc))
+
+    def test_output_is_written_in_chunks(self):
+        out = RecordingStream()
+        HTMLSerializer().render_to(self.doc, out, chunk_size=16)
+        self.assertGreater(len(out.chunks), 5)
+        self.assertTrue(all(len(c) < 16 + 200 for c in out.chunks))
+        self.assertEqual("".join(out.chunks), HTMLSerializer().render(self.doc))
+
+    def test_binary_stream_is_encoded(self):
+        ser = HTMLSerializer()
+        out = io.BytesIO()
+        ser.render_to(self.doc, out, chunk_size=8)
+        self.assertEqual(out.getvalue(), ser.render(self.doc).encode("utf-8"))
+
+        out = io.BytesIO()
+        ser.render_to(self.doc, out, encoding="ascii")
+        self.assertEqual(out.getvalue(), ser.render(self.doc, encoding="ascii"))
+        self.assertIn(b"&#9731;", out.getvalue())
+
+        out = io.BytesIO()
+        ser.render_to(self.doc, out, encoding="utf-16", chunk_size=4)
+        self.assertEqual(out.getvalue().decode("utf-16"), ser.render(self.doc))
+
+    def test_encoding_with_text_stream_is_rejected(self):
+        with self.assertRaises(ValueError):
+            HTMLSerializer().render_to(self.doc, io.StringIO(), encoding="utf-8")
+
+    def test_subtree_stops_at_its_siblings(self):
+        ul = find(self.doc, "ul")
+        self.assertIsNotNone(ul.next_sibling)
+        out = io.StringIO()
+        HTMLSerializer().render_to(ul, out)
+        self.assertEqual(out.getvalue(), "<ul><li>one</li><li>two</li></ul>")
+
+    def test_deep_documents_do_not_recurse(self):
+        depth = sys.getrecursionlimit() * 3
+        doc = TWHTMLParser("<div>" * depth + "x").parse()
+        html = HTMLSerializer().render(doc)
+        self.assertEqual(html.count("<div>"), depth)
+        self.assertTrue(html.endswith("</div>" * depth + "</body></html>"))
+        out = io.StringIO()
+        PrettyHTMLSerializer(indent=0).render_to(doc, out)
+        self.assertEqual(out.getvalue(), html)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,11 @@
 import os
 import json
 import re
+import sys
 import unittest
 from pathlib import Path
 from typing import List, Dict, Any
-from textwizard.utils.tw_html_parser.tokens import EOF
+from textwizard.utils.tw_html_parser.tokens import EOF, CHARACTER
 
 
 from textwizard.utils.tw_html_parser.tokenizer import TWHTMLTokenizer,TokenizerState
@@ -183,5 +184,126 @@ for file_path in test_files:
             return test_method
         setattr(HTML5LibLikeTokenizerTests, method_name, make_test(test_data))
 
+
+class CompiledDriverTests(unittest.TestCase):
+    """The optional Cython DFA driver must emit exactly the pure-Python tokens."""
+
+    def test_same_tokens_as_pure_python(self):
+        from textwizard.utils.tw_html_parser import tokenizer as tokenizer_mod
+        if tokenizer_mod._tokenize_c is None:
+            self.skipTest("compiled tokenizer driver not built")
+        mapper = HTML5LibLikeTokenizerTests()
+        for file_path in test_files:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for td in data.get('tests', data.get('xmlViolationTests', [])):
+                td = double_unescape_if_needed(td)
+                for init_state_str in td.get("initialStates", ["Data state"]):
+                    state = mapper._map_initial_state(init_state_str)
+                    runs = []
+                    for driver in ("tokenize", "_tokenize_py"):
+                        tok = TWHTMLTokenizer(text=td["input"], initial_state=state)
+                        if "lastStartTag" in td:
+                            tok.appropriate_end_tag_name = td["lastStartTag"]
+                        runs.append(([t.to_dict() for t in getattr(tok, driver)()], list(tok.errors)))
+                    self.assertEqual(runs[0], runs[1], msg=repr(td["input"]))
+
+
+class CharacterCoalescingTests(unittest.TestCase):
+    """Adjacent character data reaches the tree builder as a single token."""
+
+    def test_single_token_per_text_run(self):
+        tokens = list(TWHTMLTokenizer("<p>a < b &amp; c <= d</p>").tokenize())
+        chars = [t.data for t in tokens if t.type == CHARACTER]
+        self.assertEqual(chars, ["a < b & c <= d"])
+
+    def test_null_stays_separate(self):
+        tok = TWHTMLTokenizer("")
+        for data in ("a", "b", "\x00", "c"):
+            tok.emit_character(data)
+        tok.flush_characters()
+        self.assertEqual([(t.data, t.null_character) for t in tok.tokens],
+                         [("ab", False), ("\x00", True), ("c", False)])
+
+    def test_one_text_node_per_run(self):
+        from textwizard.utils.tw_html_parser.parser import TWHTMLParser
+        body = TWHTMLParser("<p>x < y</p>").parse().child_nodes[0].child_nodes[1]
+        self.assertEqual([n.data for n in body.child_nodes[0].child_nodes], ["x < y"])
+
+    def test_fragment_keeps_tags_after_text(self):
+        from textwizard.utils.tw_html_parser.parser import parse_fragment
+        frag = parse_fragment("a<b>c</b>d")
+        self.assertEqual([getattr(n, "tag_name", None) for n in frag.child_nodes], [None, "b", None])
+
+    def test_text_node_appends_join_once(self):
+        from textwizard.utils.tw_html_parser.dom import Document
+        node = Document().create_text_node("a")
+        for ch in "bcd":
+            node.append_data(ch)
+        self.assertEqual(node.data, "abcd")
+        node.append_data("e")
+        self.assertEqual(node.data, "abcde")
+
+
+class TokenRepresentationTests(unittest.TestCase):
+    """Tokens are per-type ``__slots__`` objects; tag names are interned."""
+
+    def test_one_class_per_type(self):
+        from textwizard.utils.tw_html_parser import tokens as tk
+        tokens = list(TWHTMLTokenizer("<!DOCTYPE html><p id=a>x</p><!--c-->").tokenize())
+        self.assertEqual([type(t) for t in tokens],
+                         [tk.DoctypeToken, tk.StartTagToken, tk.CharacterToken, tk.EndTagToken, tk.CommentToken, tk.EOFToken])
+        for t in tokens:
+            self.assertFalse(hasattr(t, "__dict__"))
+
+    def test_missing_fields_read_as_defaults(self):
+        from textwizard.utils.tw_html_parser.tokens import CharacterToken, EOFToken
+        char = CharacterToken("x")
+        self.assertEqual((char.name, char.attributes, char.self_closing), ('', (), False))
+        self.assertEqual(EOFToken().to_dict(), {"type": "EOF"})
+
+    def test_tag_names_interned(self):
+        built = "".join(["d", "iv"])
+        start, end = [t for t in TWHTMLTokenizer(f"<{built}></{built}>").tokenize() if t.type != EOF]
+        self.assertIs(start.name, end.name)
+        self.assertIs(start.name, sys.intern("div"))
+
+
+class BulkEntityDecodingTests(unittest.TestCase):
+    """Character references are resolved per text run by the C decoder."""
+
+    def test_decode_entities(self):
+        from textwizard.utils.tw_html_parser.entities_wrapper import decode_entities
+        self.assertEqual(decode_entities("a&nbsp;b &amp c &notit; &#x41;&#66; &#128; &bogus;"),
+                         "a\xa0b & c \xacit; AB \u20ac &bogus;")
+        self.assertEqual(decode_entities("?a=1&amp=2&ampx", in_attribute=True), "?a=1&amp=2&ampx")
+        self.assertEqual(decode_entities("&amp;&amp", in_attribute=True), "&&")
+
+    def test_errors_and_next_index(self):
+        from textwizard.utils.tw_html_parser.entities_wrapper import decode_character_references
+        decoded, end, errors = decode_character_references("x&#0;y&lt", 1, 9)
+        self.assertEqual((decoded, end), ("\ufffdy<", 9))
+        self.assertEqual([name for name, _ in errors],
+                         ["NULL_CHARACTER_REFERENCE", "MISSING_SEMICOLON_AFTER_CHARACTER_REFERENCE"])
+
+    def test_reference_may_read_past_run_end(self):
+        from textwizard.utils.tw_html_parser.entities_wrapper import decode_character_references
+        self.assertEqual(decode_character_references("&amp;", 0, 1)[:2], ("&", 5))
+
+    def test_numeric_reference_without_digits_reconsumes(self):
+        tokens = [t.to_dict() for t in TWHTMLTokenizer('&#<b title="&#">x').tokenize()]
+        self.assertEqual(tokens[0]["data"], "&#")
+        self.assertEqual(tokens[1]["name"], "b")
+        self.assertEqual(tokens[1]["attributes"][0]["value"], "&#")
+
+    def test_unquoted_attribute_reference_at_eof(self):
+        tokens = list(TWHTMLTokenizer("<a href=&amp").tokenize())
+        self.assertEqual([t.type for t in tokens], [EOF])
+
+    def test_attribute_value_read_as_one_run(self):
+        tag = list(TWHTMLTokenizer("<a title='a &lt; b&nbsp;c' href=\"/?x=1&copy=2\">").tokenize())[0]
+        self.assertEqual([a.value for a in tag.attributes], ["a < b\xa0c", "/?x=1&copy=2"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,13 +2,46 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from .text_wizard import TextWizard
-from .wizard_ner.wizard_ner import EntitiesResult, Entity, TokenAnalysis
+
+# Result and cache classes are resolved on first attribute access
+# (PEP 562) so that `import textwizard` stays cheap.
+_LAZY_ATTRS = {
+    "EntitiesResult": ".wizard_ner.wizard_ner",
+    "Entity": ".wizard_ner.wizard_ner",
+    "TokenAnalysis": ".wizard_ner.wizard_ner",
+    "BatchExtractionResult": ".wizard_extractors.batch_extraction",
+    "OcrCache": ".wizard_extractors.utils.ocr_cache",
+    "DiskOcrCache": ".wizard_extractors.utils.ocr_cache",
+    "HTMLDocument": ".utils.tw_html_parser.html_document",
+    "ParserLimits": ".utils.tw_html_parser.parser",
+    "HtmlCleanProfile": ".wizard_cleaners.tw_html_cleaner.html_cleaner",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 _wizard = TextWizard()
 
 extract_text       = _wizard.extract_text
+extract_text_batch = _wizard.extract_text_batch
+iter_pages         = _wizard.iter_pages
 extract_text_azure  = _wizard.extract_text_azure
+aextract_text      = _wizard.aextract_text
+aextract_text_azure = _wizard.aextract_text_azure
 extract_entities   = _wizard.extract_entities
+parse_html         = _wizard.parse_html
 clean_html         = _wizard.clean_html
 clean_xml          = _wizard.clean_xml
 clean_csv          = _wizard.clean_csv
@@ -23,9 +56,20 @@ html_to_markdown   = _wizard.html_to_markdown
 __all__ = [
     "TextWizard",
     "extract_text",
+    "extract_text_batch",
+    "BatchExtractionResult",
+    "iter_pages",
+    "OcrCache",
+    "DiskOcrCache",
     "extract_text_azure",
+    "aextract_text",
+    "aextract_text_azure",
     "extract_entities",
+    "parse_html",
+    "HTMLDocument",
+    "ParserLimits",
     "clean_html",
+    "HtmlCleanProfile",
     "clean_xml",
     "clean_csv",
     "EntitiesResult",
@@ -1,35 +1,71 @@
 # SPDX-FileCopyrightText: 2024–2025 Mattia Rubino
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-from textwizard.wizard_cleaners.tw_html_cleaner.html_cleaner import HTMLCleaner
-from textwizard.wizard_cleaners.tw_xml_cleaner.xml_cleaner import XMLCleaner
-from textwizard.wizard_cleaners.tw_csv_cleaner.csv_cleaner import CSVCleaner, CsvDialect
+from __future__ import annotations
+
 import csv
+import functools
+import threading
 from pathlib import Path
-from typing import Union, Optional,Iterable,List, Dict, Any
-from textwizard.wizard_extractors.extraction_text import TextExtractor
-from textwizard.utils.errors.errors_handle import handle_errors
-from textwizard.wizard_ner.wizard_ner import WizardNER, EntitiesResult
+from typing import TYPE_CHECKING, Union, Optional,Iterable,Iterator,List, Dict, Any, Tuple
 
+from textwizard.utils.errors.errors_handle import handle_errors
 
-from textwizard.wizard_analyze_text.wizard_correctness.correctness import CorrectnessAnalyzer
-from textwizard.wizard_analyze_text.wizard_lang_detect.model_io import load_model, Model
-from textwizard.wizard_analyze_text.wizard_lang_detect.detect_lang import detect_lang as _detect_lang
+# Readers, cleaners and analyzers are imported on first use: they pull in
+# fitz, pandas, lxml, marisa_trie, ahocorasick, ... and a process that only
+# calls one of them should not pay for the others at import time.
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from textwizard.wizard_cleaners.tw_csv_cleaner.csv_cleaner import CSVCleaner
+    from textwizard.wizard_cleaners.tw_html_cleaner.html_cleaner import HTMLCleaner
+    from textwizard.wizard_cleaners.tw_xml_cleaner.xml_cleaner import XMLCleaner
+    from textwizard.utils.tw_html_parser.html_document import HTMLDocument
+    from textwizard.utils.tw_html_parser.parser import ParserLimits
+    from textwizard.wizard_extractors.batch_extraction import BatchExtractionResult
+    from textwizard.wizard_extractors.ocr_service.azure_ocr import CloudExtractionResult
+    from textwizard.wizard_extractors.extraction_text import TextExtractor
+    from textwizard.wizard_extractors.utils.ocr_cache import OcrCache
+    from textwizard.wizard_analyze_text.wizard_lang_detect.model_io import Model
+    from textwizard.wizard_ner.wizard_ner import EntitiesResult
 
-from textwizard.wizard_analyze_text.statistical import StatisticalAnalyzer
-from textwizard.wizard_analyze_text.similarity import TextSimilarity
-import threading
 
 class TextWizard:
     def __init__(self):
-        self._text_extractor = TextExtractor()
-        self._html_cleaner = HTMLCleaner()
-        self._xml_cleaner = XMLCleaner()
-        self._csv_cleaner = CSVCleaner()
+        self._text_extractor_inst: TextExtractor | None = None
+        self._html_cleaner_inst: HTMLCleaner | None = None
+        self._xml_cleaner_inst: XMLCleaner | None = None
+        self._csv_cleaner_inst: CSVCleaner | None = None
         self._lang_model: Model | None = None
         self._lang_lock = threading.Lock()
 
-    
+    @property
+    def _text_extractor(self) -> TextExtractor:
+        if self._text_extractor_inst is None:
+            from textwizard.wizard_extractors.extraction_text import TextExtractor
+            self._text_extractor_inst = TextExtractor()
+        return self._text_extractor_inst
+
+    @property
+    def _html_cleaner(self) -> HTMLCleaner:
+        if self._html_cleaner_inst is None:
+            from textwizard.wizard_cleaners.tw_html_cleaner.html_cleaner import HTMLCleaner
+            self._html_cleaner_inst = HTMLCleaner()
+        return self._html_cleaner_inst
+
+    @property
+    def _xml_cleaner(self) -> XMLCleaner:
+        if self._xml_cleaner_inst is None:
+            from textwizard.wizard_cleaners.tw_xml_cleaner.xml_cleaner import XMLCleaner
+            self._xml_cleaner_inst = XMLCleaner()
+        return self._xml_cleaner_inst
+
+    @property
+    def _csv_cleaner(self) -> CSVCleaner:
+        if self._csv_cleaner_inst is None:
+            from textwizard.wizard_cleaners.tw_csv_cleaner.csv_cleaner import CSVCleaner
+            self._csv_cleaner_inst = CSVCleaner()
+        return self._csv_cleaner_inst
+
     # ----------------------------------------------------------------------
     # Text extraction
     # ----------------------------------------------------------------------
@@ -42,6 +78,12 @@ class TextWizard:
             pages: Optional[Union[int, str, List[Union[int, str]]]] = None,
             ocr: bool = False,
             language_ocr: str = "eng",    
+            ocr_workers: int = 1,
+            ocr_cache: Union[OcrCache, str, Path, bool, None] = None,
+            ocr_mode: str = "images",
+            ocr_dpi: Union[int, str, None] = None,
+            ocr_regions: bool = False,
+            xlsx_streaming: bool = False,
     ) -> str:
         """
         Extracts text from the provided input data based on its format and type.
@@ -49,6 +91,8 @@ class TextWizard:
         Args:
             input_data (Union[str, bytes, Path]):
                 The input for extraction: a filesystem path, raw bytes, or string content.
+                `bytearray` and `memoryview` are accepted like bytes. PDF and DOCX
+                paths are opened in place and PDF buffers are not copied.
             extension (Optional[str]):
                 File extension to use when `input_data` is bytes (e.g. 'pdf', 'xlsx').
             pages (Optional[int | str | list[int | str]]):
@@ -61,6 +105,33 @@ class TextWizard:
                 like PDF, DOCX, and image-based files.
             language_ocr (str):
                 Tesseract language code (default: 'eng').
+            ocr_workers (int):
+                PDF only: number of processes that OCR image pages concurrently
+                (default: 1, sequential). Page order is preserved.
+            ocr_cache (OcrCache | str | Path | bool | None):
+                Reuse OCR results for pages/images seen before, keyed by a hash of
+                the rendered pixels, DPI and `language_ocr`. Pass a directory for a
+                `DiskOcrCache` there, True for the per-user cache directory, or any
+                `OcrCache` implementation. None (default) disables caching.
+            ocr_mode (str):
+                PDF only: which pages `ocr=True` sends to Tesseract.
+                • "images" (default): every page that contains an image.
+                • "adaptive": only pages whose native text layer is missing or
+                  does not cover their large images; born-digital pages with
+                  logos or photos are read directly.
+            ocr_dpi (int | str | None):
+                PDF only: OCR render resolution. None (default) uses 300 DPI;
+                "auto" follows the native resolution of the page images,
+                clamped to 150–300 DPI.
+            ocr_regions (bool):
+                PDF only: OCR just the embedded image regions (clipped to their
+                bounding boxes) and keep the native text of the rest of the
+                page, instead of rasterizing the whole page (default: False).
+            xlsx_streaming (bool):
+                XLSX only: stream rows with openpyxl's read-only parser and emit
+                them tab-separated instead of loading each sheet into a pandas
+                DataFrame. Keeps memory flat on large workbooks; columns are not
+                aligned. Legacy XLS files are unaffected (default: False).
 
         Returns:
             str: The extracted text content.
@@ -81,6 +152,166 @@ class TextWizard:
             pages,
             ocr,
             language_ocr,
+            ocr_workers,
+            ocr_cache,
+            ocr_mode,
+            ocr_dpi,
+            ocr_regions,
+            xlsx_streaming,
+        )
+
+    @handle_errors
+    def extract_text_batch(
+            self,
+            inputs: Iterable[Union[str, bytes, Path, Tuple[Union[str, bytes, Path], Optional[str]]]],
+            extension: Optional[str] = None,
+            pages: Optional[Union[int, str, List[Union[int, str]]]] = None,
+            ocr: bool = False,
+            language_ocr: str = "eng",
+            workers: Optional[int] = None,
+            ordered: bool = True,
+            ocr_cache: Union[OcrCache, str, Path, bool, None] = None,
+            ocr_mode: str = "images",
+            ocr_dpi: Union[int, str, None] = None,
+            ocr_regions: bool = False,
+            xlsx_streaming: bool = False,
+    ) -> Iterator[BatchExtractionResult]:
+        """
+        Extracts text from many inputs in parallel using a process pool.
+
+        Args:
+            inputs (Iterable):
+                Items accepted by `extract_text` (path, `Path` or bytes), or
+                `(input_data, extension)` tuples for bytes of mixed types.
+            extension (Optional[str]):
+                Default extension for bytes items without their own.
+            pages (Optional[int | str | list[int | str]]):
+                Page/sheet selection applied to every item (see `extract_text`).
+            ocr (bool):
+                Enables Tesseract OCR (see `extract_text`).
+            language_ocr (str):
+                Tesseract language code (default: 'eng').
+            workers (Optional[int]):
+                Number of worker processes. None (default) uses `os.cpu_count()`;
+                1 runs in the current process without a pool.
+            ordered (bool):
+                If True (default), results are yielded in input order; otherwise
+                they are yielded as soon as each item completes.
+            ocr_cache (OcrCache | str | Path | bool | None):
+                OCR result cache shared by all workers (see `extract_text`).
+            ocr_mode (str):
+                PDF page selection for OCR, "images" or "adaptive" (see `extract_text`).
+            ocr_dpi (int | str | None):
+                PDF OCR resolution, or "auto" (see `extract_text`).
+            ocr_regions (bool):
+                OCR only PDF image regions (see `extract_text`).
+            xlsx_streaming (bool):
+                Stream XLSX rows instead of using pandas (see `extract_text`).
+
+        Returns:
+            Iterator[BatchExtractionResult]: One result per input with `index`,
+            `source`, `text` and, on failure, `error` / `error_type`. A failing
+            item never aborts the batch.
+
+        Raises:
+            ValidationError: If `workers` is not a positive integer.
+
+        Example:
+            ```python
+            import textwizard as tw
+
+            for res in tw.extract_text_batch(["a.pdf", "b.docx"], workers=8):
+                if res.ok:
+                    print(res.source, len(res.text))
+                else:
+                    print(res.source, res.error_type, res.error)
+            ```
+        """
+        from textwizard.wizard_extractors.batch_extraction import BatchExtractor
+
+        return BatchExtractor(self._text_extractor).run(
+            inputs,
+            extension,
+            pages,
+            ocr,
+            language_ocr,
+            workers=workers,
+            ordered=ordered,
+            ocr_cache=ocr_cache,
+            ocr_mode=ocr_mode,
+            ocr_dpi=ocr_dpi,
+            ocr_regions=ocr_regions,
+            xlsx_streaming=xlsx_streaming,
+        )
+
+    @handle_errors
+    def iter_pages(
+            self,
+            input_data: Union[str, bytes, Path],
+            pages: Optional[Union[int, str, List[Union[int, str]]]] = None,
+            ocr: bool = False,
+            language_ocr: str = "eng",
+            ocr_workers: int = 1,
+            ocr_cache: Union[OcrCache, str, Path, bool, None] = None,
+            ocr_mode: str = "images",
+            ocr_dpi: Union[int, str, None] = None,
+            ocr_regions: bool = False,
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Streams the text of a PDF one page at a time.
+
+        Unlike `extract_text`, pages are yielded as soon as they are decoded,
+        so downstream processing can start immediately and only one page of
+        text is held in memory.
+
+        Args:
+            input_data (Union[str, bytes, Path]):
+                Path to a `.pdf` file or raw PDF bytes.
+            pages (Optional[int | str | list[int | str]]):
+                One-based page selection (e.g. `1`, `"3-5"`, `[1, "7-9"]`).
+                If None (default), all pages are yielded.
+            ocr (bool):
+                OCR pages containing images with Tesseract.
+            language_ocr (str):
+                Tesseract language code (default: 'eng').
+            ocr_workers (int):
+                Number of processes that OCR image pages ahead of the consumer
+                (default: 1, sequential). Pages are still yielded in order.
+            ocr_cache (OcrCache | str | Path | bool | None):
+                OCR result cache (see `extract_text`).
+            ocr_mode (str):
+                "images" (default) or "adaptive" (see `extract_text`).
+            ocr_dpi (int | str | None):
+                OCR resolution, or "auto" (see `extract_text`).
+            ocr_regions (bool):
+                OCR only the image regions of each page (see `extract_text`).
+
+        Returns:
+            Iterator[tuple[int, str]]: `(page_number, text)` pairs, one-based.
+
+        Raises:
+            FileNotFoundCustomError: If the path does not exist.
+            UnsupportedExtensionError: If the path is not a PDF.
+            FileProcessingError: If the PDF cannot be opened or read.
+
+        Example:
+            ```python
+            import textwizard as tw
+
+            for page_no, text in tw.iter_pages("big.pdf"):
+                index(page_no, text)
+            ```
+        """
+        return self._text_extractor.pdf_pages(
+            input_data,
+            pages,
+            ocr,
+            language_ocr,
+            ocr_workers,
+            ocr_cache,
+            ocr_mode,
+            ocr_dpi,
+            ocr_regions,
         )
 
     def extract_text_azure(
@@ -163,10 +394,10 @@ class TextWizard:
         """
         try:
             from textwizard.wizard_extractors.ocr_service.azure_ocr import AzureOcr
+            client = AzureOcr(endpoint=azure_endpoint, key=azure_key)
         except ImportError:
             raise RuntimeError("To use Azure OCR, install: textwizard[azure]")
 
-        client = AzureOcr(endpoint=azure_endpoint, key=azure_key)
         return client.extract(
             input_data,
             model_id=azure_model_id,
@@ -176,13 +407,155 @@ class TextWizard:
             hybrid=hybrid
         )
 
+    # ----------------------------------------------------------------------
+    # Async variants
+    # ----------------------------------------------------------------------
+    async def aextract_text(
+            self,
+            input_data: Union[str, bytes, Path],
+            extension: Optional[str] = None,
+            pages: Optional[Union[int, str, List[Union[int, str]]]] = None,
+            ocr: bool = False,
+            language_ocr: str = "eng",
+            ocr_workers: int = 1,
+            ocr_cache: Union[OcrCache, str, Path, bool, None] = None,
+            ocr_mode: str = "images",
+            ocr_dpi: Union[int, str, None] = None,
+            ocr_regions: bool = False,
+            xlsx_streaming: bool = False,
+            executor: Optional[Executor] = None,
+    ) -> str:
+        """
+        Async version of `extract_text`.
+
+        The local readers are blocking (PyMuPDF, Tesseract, pandas), so the
+        extraction runs on an executor and the event loop stays responsive.
+
+        Args:
+            input_data, extension, pages, ocr, language_ocr, ocr_workers,
+            ocr_cache, ocr_mode, ocr_dpi, ocr_regions, xlsx_streaming:
+                Same as `extract_text`.
+            executor (Optional[concurrent.futures.Executor]):
+                Executor that runs the extraction. None (default) uses the
+                event loop's default thread pool.
+
+        Returns:
+            str: The extracted text content.
+
+        Example:
+            ```python
+            import asyncio
+            import textwizard as tw
+
+            async def main(paths):
+                return await asyncio.gather(*(tw.aextract_text(p) for p in paths))
+
+            texts = asyncio.run(main(["a.pdf", "b.docx"]))
+            ```
+        """
+        call = functools.partial(
+            self.extract_text,
+            input_data,
+            extension,
+            pages,
+            ocr,
+            language_ocr,
+            ocr_workers,
+            ocr_cache,
+            ocr_mode,
+            ocr_dpi,
+            ocr_regions,
+            xlsx_streaming,
+        )
+        import asyncio  # ~50 ms to import; only the async API needs it
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+    async def aextract_text_azure(
+            self,
+            input_data: Union[str, bytes, Path],
+            extension: Optional[str] = None,
+            language_ocr: str = "eng",
+            pages: Optional[Union[int, str, List[Union[int, str]]]] = None,
+            azure_endpoint: Optional[str] = None,
+            azure_key: Optional[str] = None,
+            azure_model_id: str = "prebuilt-read",
+            hybrid: bool = False,
+    ) -> CloudExtractionResult:
+        """
+        Async version of `extract_text_azure`.
+
+        Uses the asynchronous Azure Document Intelligence client, so waiting
+        on the service does not hold a thread; the embedded images of a DOCX
+        are analysed concurrently. Arguments, result and errors are the same
+        as `extract_text_azure`.
+
+        Example:
+            ```python
+            import asyncio
+            import textwizard as tw
+
+            res = asyncio.run(tw.aextract_text_azure(
+                "invoice.pdf",
+                azure_endpoint="https://myocr.cognitiveservices.azure.com/",
+                azure_key="xxxxxx",
+            ))
+            print(res.text)
+            ```
+        """
+        try:
+            from textwizard.wizard_extractors.ocr_service.azure_ocr import AsyncAzureOcr
+            client = AsyncAzureOcr(endpoint=azure_endpoint, key=azure_key)
+        except ImportError:
+            raise RuntimeError("To use Azure OCR, install: textwizard[azure]")
+
+        async with client:
+            return await client.extract(
+                input_data,
+                model_id=azure_model_id,
+                extension=extension,
+                language_ocr=language_ocr,
+                pages=pages,
+                hybrid=hybrid
+            )
+
+    # ----------------------------------------------------------------------
+    # HTML parsing
+    # ----------------------------------------------------------------------
+    @handle_errors
+    def parse_html(self, html: str, cache: bool = False, limits: ParserLimits | None = None) -> HTMLDocument:
+        """
+        Parse HTML once and return a reusable document handle.
+
+        The handle can be passed to ``clean_html``, ``beautiful_html`` and
+        ``html_to_markdown`` in place of the HTML string; none of them parses
+        it again, and none of them modifies it (structural cleaning works on a
+        copy of the tree).
+
+        Args:
+            html (str): The HTML text to parse.
+            cache (bool, optional): Keep the parsed document in a bounded LRU
+                keyed by a hash of the content, and return the cached document
+                when the same HTML is parsed again.
+            limits (ParserLimits, optional): Bounds on depth, node count, active
+                formatting elements and parse time, so an adversarial page
+                cannot stall the caller. When one is hit the document built so
+                far is returned with ``truncated=True`` and ``truncation_reason``
+                naming the limit.
+
+        Returns:
+            HTMLDocument: The parsed document (``.html`` is the source text).
+        """
+        from textwizard.utils.tw_html_parser.html_document import parse_html
+
+        return parse_html(html, cache=cache, limits=limits)
+
     # ----------------------------------------------------------------------
     # HTML cleaning
     # ----------------------------------------------------------------------
     @handle_errors
     def clean_html(
             self,
-            text: str,
+            text: Union[str, HTMLDocument],
             remove_script: bool = None,
             remove_metadata_tags: bool = None,
             remove_flow_tags: bool = None,
@@ -230,7 +603,7 @@ class TextWizard:
 
 
         Args:
-            text (str): The HTML text to be cleaned.
+            text (str | HTMLDocument): The HTML text to be cleaned, or a document returned by ``parse_html``.
             remove_script (bool, optional): Removes script tags containing executable code (e.g., <script>, <template>).
             remove_metadata_tags (bool, optional): Removes metadata tags (e.g., <link>, <meta>, <base>, <noscript>, <script>, <style>, <title>).
             remove_flow_tags (bool, optional): Removes flow content tags (e.g., <address>, <div>,<input>.).
@@ -439,6 +812,8 @@ class TextWizard:
         str
             The cleaned CSV data.
         """
+        from textwizard.wizard_cleaners.tw_csv_cleaner.csv_cleaner import CsvDialect
+
         dialect = CsvDialect(
             delimiter=delimiter,
             quotechar=quotechar,
@@ -531,6 +906,8 @@ class TextWizard:
         >>> tw.extract_entities(text, engine="spacy_stanza",
         ...                     language="en", device="gpu")
         """
+        from textwizard.wizard_ner.wizard_ner import WizardNER
+
         ner = WizardNER(
             engine=engine,
             model=model,
@@ -590,6 +967,8 @@ class TextWizard:
           >>> # Offline with local dictionaries + memory-mapping
           >>> tw.correctness_text("color colour", language="en", dict_dir="dictionaries", use_mmap=True)
           """       
+        from textwizard.wizard_analyze_text.wizard_correctness.correctness import CorrectnessAnalyzer
+
         analyzer = CorrectnessAnalyzer(
             language,
             _dict_dir=dict_dir,
@@ -638,10 +1017,14 @@ class TextWizard:
         - The model is loaded lazily on first call and cached on the instance.
         - Pass ``profiles_dir`` if you keep profiles outside the packaged defaults.
         """
+        from textwizard.wizard_analyze_text.wizard_lang_detect.detect_lang import detect_lang as _detect_lang
+
         # lazy-load + cache (thread-safe)
         if self._lang_model is None:
             with self._lang_lock:
                 if self._lang_model is None:
+                    from textwizard.wizard_analyze_text.wizard_lang_detect.model_io import load_model
+
                     if profiles_dir is not None:
                         profiles_dir = Path(profiles_dir)
                         self._lang_model = load_model(
@@ -741,6 +1124,8 @@ class TextWizard:
             - `"yule_k"` (`float`): Yule’s K measure of lexical concentration.
             - `"avg_word_length"` (`float`): average token length (characters).
         """
+        from textwizard.wizard_analyze_text.statistical import StatisticalAnalyzer
+
         return StatisticalAnalyzer().run(text)
     
 
@@ -766,12 +1151,13 @@ class TextWizard:
         float
             Score in the range *0.0 – 1.0* (1.0 ≡ identical).
         """
+        from textwizard.wizard_analyze_text.similarity import TextSimilarity
 
         return TextSimilarity(method)(a, b)
 
     def beautiful_html(
             self,
-            html: str,
+            html: Union[str, HTMLDocument],
             indent: int = 2,
             quote_attr_values: str = "spec",  # "legacy" | "spec" | "always"
             quote_char: str = '"',
@@ -799,8 +1185,8 @@ class TextWizard:
             
             Parameters
             ----------
-            html : str
-                The HTML string to format.
+            html : str or HTMLDocument
+                The HTML string to format, or a document returned by ``parse_html``.
             indent : int, default 2
                 Number of spaces per indentation level.
             quote_attr_values : {"always", "spec", "legacy"}, default "spec"
@@ -880,14 +1266,14 @@ class TextWizard:
     
 
 
-    def html_to_markdown(self, html: str) -> str:
+    def html_to_markdown(self, html: Union[str, HTMLDocument]) -> str:
         """
         Convert HTML to Markdown using TextWizard's internal HTML parser/renderer.
 
         Parameters
         ----------
-        html : str
-            Raw HTML string to convert.
+        html : str or HTMLDocument
+            Raw HTML string to convert, or a document returned by ``parse_html``.
 
         Returns
         -------
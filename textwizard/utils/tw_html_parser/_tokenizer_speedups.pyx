@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2024–2025 Mattia Rubino
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+"""
+Compiled DFA driver for :class:`TWHTMLTokenizer`.
+
+Same loop as ``TWHTMLTokenizer._tokenize_py``: the transition and action
+tables and the action callables are shared, only the per-character work
+(indexing, code lookup, table access) is done in C.
+"""
+
+from textwizard.utils.tw_html_parser.tokens import EOFToken, NEED_DATA
+
+cdef enum:
+    ALPHABET_SIZE = 128
+    EXTENDED_INDEX = ALPHABET_SIZE
+    EOF_INDEX = ALPHABET_SIZE + 1
+
+
+def tokenize(object tokenizer):
+    cdef str text = tokenizer.text
+    cdef Py_ssize_t length = tokenizer.length
+    cdef Py_ssize_t pos = tokenizer.position
+    cdef list next_state = tokenizer.next_state
+    cdef list actions = tokenizer.actions
+    cdef object tokens = tokenizer.tokens
+    cdef object state = tokenizer.state
+    cdef object old_state, ns, act, current_char
+    cdef Py_UCS4 c
+    cdef int code
+
+    while True:
+        if pos < length:
+            c = text[pos]
+            current_char = c
+            code = <int>c if c < ALPHABET_SIZE else EXTENDED_INDEX
+        elif not tokenizer.closed:
+            yield NEED_DATA
+            text = tokenizer.text
+            length = tokenizer.length
+            pos = tokenizer.position
+            continue
+        else:
+            current_char = None
+            code = EOF_INDEX
+
+        old_state = state
+        ns = (<list>next_state[state])[code]
+        act = (<list>actions[state])[code]
+
+        if act is not None:
+            act(tokenizer, current_char)
+            state = tokenizer.state
+            pos = tokenizer.position
+
+        if state == old_state:
+            state = ns
+
+        while tokens:
+            yield tokens.popleft()
+
+        if code == EOF_INDEX:
+            break
+
+        if tokenizer._reconsume_current_input:
+            tokenizer._reconsume_current_input = False
+            state = tokenizer.state
+
+        pos += 1
+        tokenizer.state = state
+        tokenizer.position = pos
+
+    tokenizer.emit_token_oef(EOFToken())
+    while tokens:
+        yield tokens.popleft()
@@ -3,6 +3,9 @@
 
 
 from __future__ import annotations
+from typing import Union
+
+from textwizard.utils.tw_html_parser.html_document import HTMLDocument
 from textwizard.utils.tw_html_parser.parser import TWHTMLParser
 from textwizard.utils.tw_html_parser.serializer_pretty import PrettyHTMLSerializer
 
@@ -11,7 +14,7 @@ __all__ = ["beautify_html"]
 
 def beautify_html(
     *,
-    html: str,
+    html: Union[str, HTMLDocument],
     indent: int = 2,
     quote_attr_values: str = "spec",
     quote_char: str = '"',
@@ -32,7 +35,10 @@ def beautify_html(
     Pretty-print raw HTML without changing semantics.
     """
     # Parser contract: TWHTMLParser(html).parse() -> Document
-    dom = TWHTMLParser(html).parse()
+    if isinstance(html, HTMLDocument):
+        dom = html.document
+    else:
+        dom = TWHTMLParser(html).parse()
 
     serializer = PrettyHTMLSerializer(
         indent=indent,
@@ -16,18 +16,30 @@ class NodeType(IntEnum):
     SHADOW_ROOT_NODE = 11
 
 class Node:
+    # Children form a doubly linked list (first/last child, previous/next
+    # sibling), so insertion, removal and neighbour lookup are O(1).
+    # ``child_nodes`` is a list view rebuilt on demand after a mutation other
+    # than an append or a removal of the last child.
     __slots__ = (
         "_node_type",
         "_owner_document",
         "_parent",
-        "_children",
+        "_first_child",
+        "_last_child",
+        "_prev_sibling",
+        "_next_sibling",
+        "_child_list",
     )
 
     def __init__(self, node_type: NodeType, owner_document: 'Document'):
         self._node_type = node_type
         self._owner_document = owner_document
         self._parent: Optional['Node'] = None
-        self._children: List['Node'] = []
+        self._first_child: Optional['Node'] = None
+        self._last_child: Optional['Node'] = None
+        self._prev_sibling: Optional['Node'] = None
+        self._next_sibling: Optional['Node'] = None
+        self._child_list: Optional[List['Node']] = []
 
     @property
     def node_type(self) -> NodeType:
@@ -43,37 +55,89 @@ class Node:
 
     @property
     def child_nodes(self) -> List['Node']:
-        return self._children
+        # Read-only: mutate the tree through the methods below.
+        children = self._child_list
+        if children is None:
+            children = []
+            node = self._first_child
+            while node is not None:
+                children.append(node)
+                node = node._next_sibling
+            self._child_list = children
+        return children
+
+    @property
+    def first_child(self) -> Optional['Node']:
+        return self._first_child
+
+    @property
+    def last_child(self) -> Optional['Node']:
+        return self._last_child
+
+    @property
+    def previous_sibling(self) -> Optional['Node']:
+        return self._prev_sibling
+
+    @property
+    def next_sibling(self) -> Optional['Node']:
+        return self._next_sibling
 
     def append_child(self, new_child: 'Node') -> 'Node':
         if new_child._parent is not None:
             new_child._parent.remove_child(new_child)
+        last = self._last_child
         new_child._parent = self
-        self._children.append(new_child)
+        new_child._prev_sibling = last
+        if last is None:
+            self._first_child = new_child
+        else:
+            last._next_sibling = new_child
+        self._last_child = new_child
+        children = self._child_list
+        if children is not None:
+            children.append(new_child)
         return new_child
 
     def remove_child(self, old_child: 'Node') -> 'Node':
-        if old_child._parent != self:
+        if old_child._parent is not self:
             raise ValueError("removeChild: old_child is not a child of this node")
 
-        idx = self._children.index(old_child)
-        self._children.pop(idx)
-        old_child._parent = None
+        prev, nxt = old_child._prev_sibling, old_child._next_sibling
+        if prev is None:
+            self._first_child = nxt
+        else:
+            prev._next_sibling = nxt
+        if nxt is None:
+            self._last_child = prev
+            children = self._child_list
+            if children is not None:
+                children.pop()
+        else:
+            nxt._prev_sibling = prev
+            self._child_list = None
+        old_child._parent = old_child._prev_sibling = old_child._next_sibling = None
         return old_child
 
     def insert_before(self, new_child: 'Node', ref_child: Optional['Node']) -> 'Node':
         if ref_child is None:
             return self.append_child(new_child)
 
-        if ref_child._parent != self:
+        if ref_child._parent is not self:
             raise ValueError("insert_before: refChild is not a child of this node")
 
         if new_child._parent is not None:
             new_child._parent.remove_child(new_child)
 
-        idx = self._children.index(ref_child)
-        self._children.insert(idx, new_child)
+        prev = ref_child._prev_sibling
         new_child._parent = self
+        new_child._prev_sibling = prev
+        new_child._next_sibling = ref_child
+        ref_child._prev_sibling = new_child
+        if prev is None:
+            self._first_child = new_child
+        else:
+            prev._next_sibling = new_child
+        self._child_list = None
         return new_child
 
     def replace_child(self, new_child: 'Node', old_child: 'Node') -> 'Node':
@@ -81,11 +145,52 @@ class Node:
         self.remove_child(old_child)
         return old_child
 
+    def replace_children(self, *new_children: 'Node') -> None:
+        node = self._first_child
+        while node is not None:
+            nxt = node._next_sibling
+            node._parent = node._prev_sibling = node._next_sibling = None
+            node = nxt
+        self._first_child = self._last_child = None
+        self._child_list = []
+        for child in new_children:
+            self.append_child(child)
+
     def has_child_nodes(self) -> bool:
-        return bool(self._children)
+        return self._first_child is not None
+
+    def clone_node(self, deep: bool = False) -> 'Node':
+        copy = self._shallow_copy(self._owner_document)
+        if deep:
+            owner = copy if isinstance(copy, Document) else self._owner_document
+            stack = [(self, copy)]
+            pop, push = stack.pop, stack.append
+            while stack:
+                src, dst = pop()
+                children = dst._child_list
+                prev = None
+                child = src._first_child
+                while child is not None:
+                    c = child._shallow_copy(owner)
+                    c._parent = dst
+                    c._prev_sibling = prev
+                    if prev is None:
+                        dst._first_child = c
+                    else:
+                        prev._next_sibling = c
+                    children.append(c)
+                    if child._first_child is not None:
+                        push((child, c))
+                    prev = c
+                    child = child._next_sibling
+                dst._last_child = prev
+        return copy
+
+    def _shallow_copy(self, owner_document: 'Document') -> 'Node':
+        raise TypeError(f"{type(self).__name__} cannot be cloned")
 
     def _descendant_elements_by_id(self, lookup_id: str) -> Optional['Element']:
-        for c in self._children:
+        for c in self.child_nodes:
             if c.node_type == NodeType.ELEMENT_NODE:
                 elem = c  # type: Element
                 if elem.get_attribute("id") == lookup_id:
@@ -109,6 +214,9 @@ class DocumentType(Node):
         self.public_id = public_id
         self.system_id = system_id
 
+    def _shallow_copy(self, owner_document: 'Document') -> 'DocumentType':
+        return DocumentType(self.name, self.public_id, self.system_id, owner_document)
+
     def __repr__(self):
         return f"<!DOCTYPE {self.name} PUBLIC '{self.public_id}' '{self.system_id}'>"
 
@@ -122,8 +230,11 @@ class DocumentFragment(Node):
     def __init__(self, owner_document: 'Document'):
         super().__init__(NodeType.DOCUMENT_NODE, owner_document)
 
+    def _shallow_copy(self, owner_document: 'Document') -> 'DocumentFragment':
+        return DocumentFragment(owner_document)
+
     def __repr__(self):
-        return f"<DocumentFragment with {len(self._children)} childNodes>"
+        return f"<DocumentFragment with {len(self.child_nodes)} childNodes>"
 
 # =============================================================================
 # Document
@@ -194,6 +305,21 @@ class Document(Node):
             return self._document_element._descendant_elements_by_id(element_id)
         return None
 
+    def clone_node(self, deep: bool = False) -> 'Document':
+        copy = super().clone_node(deep)
+        for src, dst in zip(self.child_nodes, copy.child_nodes):
+            if src is self._doctype:
+                copy._doctype = dst
+            elif src is self._document_element:
+                copy._document_element = dst
+        return copy
+
+    def _shallow_copy(self, owner_document: 'Document') -> 'Document':
+        copy = Document()
+        copy._quirks_mode = self._quirks_mode
+        copy.frameset_ok = self.frameset_ok
+        return copy
+
     def perform_microtask_checkpoint(self) -> None:
         while self.microtask_queue:
             task = self.microtask_queue.pop(0)
@@ -219,7 +345,7 @@ class Document(Node):
     def _to_string_tree(self, indent: int = 0) -> str:
         spc = "  " * indent
         result = f"{spc}Document:\n"
-        for child in self._children:
+        for child in self.child_nodes:
             result += self._node_to_string(child, indent + 1)
         return result
 
@@ -309,6 +435,17 @@ class Element(Node):
     def get_attributes(self) -> Dict[str, str]:
         return {attr.name: attr.value for attr in self._attr_map.values()}
 
+    def _shallow_copy(self, owner_document: Document) -> 'Element':
+        copy = Element(self._tag_name, owner_document, self.namespace)
+        copy._attr_map = {
+            name: Attribute(attr.name, attr.value, attr.namespace, attr.prefix)
+            for name, attr in self._attr_map.items()
+        }
+        copy.is_value = self.is_value
+        if self.template_contents is not None:
+            copy.template_contents = self.template_contents.clone_node(deep=True)
+        return copy
+
     def __repr__(self):
         return f"<Element {self._tag_name} at {hex(id(self))} ns={self.namespace}>"
 
@@ -317,25 +454,40 @@ class Element(Node):
 # =============================================================================
 
 class Text(Node):
-    __slots__ = ("_data",)
+    __slots__ = ("_data", "_chunks")
 
     def __init__(self, data: str, owner_document: Document):
         super().__init__(NodeType.TEXT_NODE, owner_document)
         self._data = data
+        self._chunks = None
 
     @property
     def data(self) -> str:
+        # Appended chunks are joined once, on first read.
+        chunks = self._chunks
+        if chunks is not None:
+            self._data = "".join(chunks)
+            self._chunks = None
         return self._data
 
     @data.setter
     def data(self, val: str):
         self._data = val
+        self._chunks = None
 
     def append_data(self, text: str):
-        self._data += text
+        chunks = self._chunks
+        if chunks is None:
+            self._chunks = [self._data, text]
+        else:
+            chunks.append(text)
+
+    def _shallow_copy(self, owner_document: Document) -> 'Text':
+        return Text(self.data, owner_document)
 
     def __repr__(self):
-        snippet = (self._data[:20] + "...") if len(self._data) > 20 else self._data
+        data = self.data
+        snippet = (data[:20] + "...") if len(data) > 20 else data
         return f"<Text '{snippet}'>"
 
 # =============================================================================
@@ -357,6 +509,9 @@ class Comment(Node):
     def data(self, val: str):
         self._data = val
 
+    def _shallow_copy(self, owner_document: Document) -> 'Comment':
+        return Comment(self._data, owner_document)
+
     def __repr__(self):
         snippet = (self._data[:20] + "...") if len(self._data) > 20 else self._data
         return f"<!-- {snippet} -->"
@@ -395,10 +550,3 @@ class ShadowRoot(Node):
         self.slot_type = slot_type
         self.declarative = False
         self.available_to_element_internals = False
-
-    def append_child(self, new_child: Node) -> Node:
-        if new_child._parent is not None:
-            new_child._parent.remove_child(new_child)
-        new_child._parent = self
-        self._children.append(new_child)
-        return new_child
@@ -1,8 +1,12 @@
 # SPDX-FileCopyrightText: 2024–2025 Mattia Rubino
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+# cython: language_level=3, boundscheck=False, wraparound=False
+
 from libc.stddef cimport size_t
 
+from textwizard.utils.tw_html_parser._utils import entitiesWindows1252
+
 cdef extern from "entities_hash.h":
     cdef struct Entity:
         const char* name
@@ -10,6 +14,17 @@ cdef extern from "entities_hash.h":
 
     Entity* lookup_entity(const char* key, size_t len)
 
+cdef enum:
+    MIN_LEN_ENTITY = 2
+    MAX_LEN_ENTITY = 32
+
+# Decoded entity values, keyed by the address of the static table entry.
+cdef dict _values = {}
+
+cdef Py_UCS4 _windows1252[32]
+for _code, _char in entitiesWindows1252.items():
+    _windows1252[_code - 0x80] = ord(_char)
+
 cpdef str lookup_entity_value_py(str key):
     """
     Python-accessible wrapper for the C function `lookup_entity`.
@@ -27,3 +42,217 @@ cdef inline const char* lookup_entity_value(const char* key, size_t len):
     if result:
         return result.value
     return NULL
+
+
+cdef str _entity_value(Entity* entity):
+    # Table values are stored escaped ("\\xA0"); decode each one once.
+    cdef object key = <size_t>entity
+    cdef str value = _values.get(key)
+    if value is None:
+        raw = entity.value.decode("utf-8")
+        if raw.endswith("\\"):
+            raw += "\\"
+        value = raw.encode("utf-8").decode("unicode-escape")
+        _values[key] = value
+    return value
+
+
+cdef inline bint _ascii_alnum(Py_UCS4 c):
+    return (u'0' <= c <= u'9') or (u'a' <= c <= u'z') or (u'A' <= c <= u'Z')
+
+
+cdef inline bint _hex_digit(Py_UCS4 c):
+    return (u'0' <= c <= u'9') or (u'a' <= c <= u'f') or (u'A' <= c <= u'F')
+
+
+cdef inline Py_ssize_t _back(Py_ssize_t pos, Py_ssize_t n):
+    return pos - n if pos > n else 0
+
+
+cdef Py_ssize_t _numeric_reference(str text, Py_ssize_t amp, Py_ssize_t pos, Py_ssize_t length,
+                                   list out, list errors) except -1:
+    # ``pos`` is just past "&#". Returns the index of the last consumed character.
+    cdef Py_UCS4 c = 0
+    cdef bint has_char = False
+    cdef bint hexadecimal = False
+    cdef long code = 0
+    cdef Py_UCS4 mapped
+
+    if pos < length:
+        c = text[pos]
+        pos += 1
+        has_char = True
+    if has_char and (c == u'x' or c == u'X'):
+        hexadecimal = True
+        if pos >= length:
+            out.append(text[amp:pos])
+            return pos
+        c = text[pos]
+        pos += 1
+        if not _hex_digit(c):
+            errors.append(("ABSENCE_OF_DIGITS_IN_NUMERIC_CHARACTER_REFERENCE", pos))
+            out.append(text[amp:amp + 3])
+            return _back(pos, 2)
+    elif not has_char:
+        errors.append(("ABSENCE_OF_DIGITS_IN_NUMERIC_CHARACTER_REFERENCE", pos))
+        out.append("&#")
+        return _back(pos, 1)
+    elif not c.isdigit():
+        errors.append(("ABSENCE_OF_DIGITS_IN_NUMERIC_CHARACTER_REFERENCE", pos))
+        out.append("&#")
+        return _back(pos, 2)
+    pos -= 1
+
+    has_char = False
+    while pos < length:
+        c = text[pos]
+        pos += 1
+        if hexadecimal and _hex_digit(c):
+            code = code * 16 + (<long>c - 48 if c <= u'9' else (<long>c | 0x20) - 87)
+        elif not hexadecimal and c.isdigit():
+            code = code * 10 + (<long>c - 48)
+        else:
+            has_char = True
+            break
+        if code > 0x10FFFF:
+            code = 0x110000
+
+    if code == 0:
+        errors.append(("NULL_CHARACTER_REFERENCE", pos))
+        code = 0xFFFD
+    elif code > 0x10FFFF:
+        errors.append(("CHARACTER_REFERENCE_OUTSIDE_UNICODE_RANGE", pos))
+        code = 0xFFFD
+    elif 0xD800 <= code <= 0xDFFF:
+        errors.append(("SURROGATE_CHARACTER_REFERENCE", pos))
+        code = 0xFFFD
+    elif 0x80 <= code <= 0x9F:
+        errors.append(("CONTROL_CHARACTER_REFERENCE", pos))
+        mapped = _windows1252[code - 0x80]
+        if mapped:
+            out.append(chr(mapped))
+            if not (has_char and c == u';'):
+                errors.append(("MISSING_SEMICOLON_AFTER_CHARACTER_REFERENCE", pos))
+                return _back(pos, 2)
+            return _back(pos, 1)
+
+    if 0xFDD0 <= code <= 0xFDEF or (code & 0xFFFF) in (0xFFFE, 0xFFFF):
+        errors.append(("NONCHARACTER_CHARACTER_REFERENCE", pos))
+    if (code < 0x20 and code not in (0x09, 0x0A, 0x0C, 0x0D)) or code == 0x7F:
+        errors.append(("CONTROL_CHARACTER_REFERENCE", pos))
+    out.append(chr(code))
+    if has_char and c != u';':
+        errors.append(("MISSING_SEMICOLON_AFTER_CHARACTER_REFERENCE", pos))
+        return _back(pos, 2)
+    return _back(pos, 1)
+
+
+cdef Py_ssize_t _character_reference(str text, Py_ssize_t amp, Py_ssize_t length, bint in_attribute,
+                                     list out, list errors) except -1:
+    # Resolves the reference whose "&" is at ``amp``; returns the index of the
+    # last consumed character, as the tokenizer's position after the reference.
+    cdef Py_ssize_t pos = amp + 1
+    cdef Py_ssize_t start, n, name_len
+    cdef Py_UCS4 c
+    cdef char name[MAX_LEN_ENTITY + 1]
+    cdef Entity* entity = NULL
+    cdef str value
+    cdef bint blocked
+
+    if pos >= length:
+        out.append("&")
+        return pos
+    c = text[pos]
+    if c == u'#':
+        return _numeric_reference(text, amp, pos + 1, length, out, errors)
+    if not c.isalnum():
+        out.append("&")
+        return amp
+
+    start = pos
+    n = 0
+    while n < MAX_LEN_ENTITY and pos < length:
+        c = text[pos]
+        pos += 1
+        if _ascii_alnum(c):
+            name[n] = <char>c
+            n += 1
+        elif c == u';':
+            name[n] = b';'
+            n += 1
+            break
+        else:
+            pos -= 1
+            break
+    name_len = n
+
+    if n >= MIN_LEN_ENTITY:
+        if 26 <= n <= 31:
+            n = 25
+        while n >= MIN_LEN_ENTITY:
+            name[n] = 0
+            entity = lookup_entity(name, n)
+            if entity != NULL:
+                break
+            n -= 1
+
+    if entity == NULL:
+        out.append(text[amp:start + name_len])
+        return start + name_len - 1
+
+    value = _entity_value(entity)
+    if name[n - 1] == b';':
+        out.append(value)
+        return start + n - 1
+
+    if in_attribute:
+        # Legacy rule: "&amp=" / "&ampx" inside attribute values stay literal.
+        blocked = False
+        if start + n < length:
+            c = text[start + n]
+            blocked = c == u'=' or _ascii_alnum(c)
+        out.append(text[amp:start + name_len] if blocked else value)
+        errors.append(("MISSING_SEMICOLON_AFTER_CHARACTER_REFERENCE", start + name_len - 1))
+        return start + name_len - 1
+
+    out.append(value)
+    errors.append(("MISSING_SEMICOLON_AFTER_CHARACTER_REFERENCE", pos))
+    return start + n - 1
+
+
+cpdef tuple decode_character_references(str text, Py_ssize_t start, Py_ssize_t end, bint in_attribute=False):
+    """
+    Decode every named and numeric character reference in ``text[start:end]``
+    in one pass (HTML5 rules: longest entity prefix, missing semicolons,
+    Windows-1252 remapping of C1 numeric references, attribute-value legacy
+    rule). A reference starting before ``end`` may read past it.
+
+    Returns ``(decoded, next_index, errors)`` where ``errors`` is a list of
+    ``(ParseError member name, index)``.
+    """
+    cdef Py_ssize_t length = len(text)
+    cdef Py_ssize_t i = start
+    cdef Py_ssize_t amp
+    cdef list out = []
+    cdef list errors = []
+
+    while i < end:
+        amp = text.find("&", i, end)
+        if amp < 0:
+            out.append(text[i:end])
+            i = end
+            break
+        if amp > i:
+            out.append(text[i:amp])
+        i = _character_reference(text, amp, length, in_attribute, out, errors) + 1
+
+    if len(out) == 1:
+        return out[0], i, errors
+    return "".join(out), i, errors
+
+
+cpdef str decode_entities(str text, bint in_attribute=False):
+    """Return ``text`` with all character references decoded."""
+    if "&" not in text:
+        return text
+    return decode_character_references(text, 0, len(text), in_attribute)[0]
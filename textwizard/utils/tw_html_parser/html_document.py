@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2024–2025 Mattia Rubino
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Parse once, reuse the tree: :func:`parse_html` returns an :class:`HTMLDocument`
+that ``clean_html``, ``beautiful_html`` and ``html_to_markdown`` accept in
+place of the HTML string.
+
+With ``cache=True`` documents are kept in a bounded LRU keyed by a hash of the
+HTML, so repeated calls on the same content skip the parse entirely.
+``limits`` bounds the parse (see :class:`ParserLimits`); a document cut short
+has ``truncated`` set, and one cut short by ``time_budget`` is never cached.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Optional, Union
+
+from textwizard.utils.tw_html_parser.dom import Document
+from textwizard.utils.tw_html_parser.parser import ParserLimits, TWHTMLParser
+
+__all__ = ["HTMLDocument", "ParserLimits", "parse_html", "clear_parse_cache", "set_parse_cache_size"]
+
+DEFAULT_PARSE_CACHE_SIZE = 32
+
+_cache: "OrderedDict[tuple, HTMLDocument]" = OrderedDict()
+_cache_size = DEFAULT_PARSE_CACHE_SIZE
+_cache_lock = threading.Lock()
+
+
+class HTMLDocument:
+    """
+    A parsed HTML document and the source it came from.
+
+    ``document`` is shared by every call that receives this handle (and by
+    every caller of a cached handle), so it must be treated as read-only;
+    operations that edit the tree work on :meth:`copy_document`.
+    """
+    __slots__ = ("html", "document", "truncated", "truncation_reason")
+
+    def __init__(self, html: str, document: Document, truncated: bool = False,
+                 truncation_reason: Optional[str] = None):
+        self.html = html
+        self.document = document
+        self.truncated = truncated
+        self.truncation_reason = truncation_reason
+
+    def copy_document(self) -> Document:
+        """Return a deep copy of the tree, safe to modify."""
+        return self.document.clone_node(deep=True)
+
+    def __repr__(self):
+        return f"<HTMLDocument {len(self.html)} chars>"
+
+
+def _content_key(html: str, limits: Optional[ParserLimits]) -> tuple:
+    # hashlib loads OpenSSL; only cached parses pay for it.
+    import hashlib
+    digest = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return digest, limits.key() if limits is not None else None
+
+
+def _parse(html: str, limits: Optional[ParserLimits]) -> HTMLDocument:
+    parser = TWHTMLParser(html, limits=limits)
+    document = parser.parse()
+    return HTMLDocument(html, document, parser.truncated, parser.truncation_reason)
+
+
+def parse_html(html: Union[str, HTMLDocument], cache: bool = False,
+               limits: Optional[ParserLimits] = None) -> HTMLDocument:
+    """
+    Parse ``html`` into a reusable :class:`HTMLDocument`.
+
+    With ``cache=True`` a document parsed earlier from the same content is
+    returned instead of parsing again; the cache holds the most recently used
+    documents, up to :func:`set_parse_cache_size` entries. ``limits`` bounds
+    the work spent on the parse; by default there is no bound.
+    """
+    if isinstance(html, HTMLDocument):
+        return html
+    if not isinstance(html, str):
+        raise TypeError(f"parse_html() expects str, got {type(html).__name__}")
+    if not cache or _cache_size <= 0:
+        return _parse(html, limits)
+
+    key = _content_key(html, limits)
+    with _cache_lock:
+        doc = _cache.get(key)
+        if doc is not None:
+            _cache.move_to_end(key)
+            return doc
+
+    doc = _parse(html, limits)
+    if doc.truncation_reason == "time_budget":
+        # Depends on how fast this parse ran, not on the content: not reused.
+        return doc
+    with _cache_lock:
+        # Another thread may have parsed the same content meanwhile; keep one.
+        doc = _cache.setdefault(key, doc)
+        _cache.move_to_end(key)
+        while len(_cache) > _cache_size:
+            _cache.popitem(last=False)
+    return doc
+
+
+def clear_parse_cache() -> None:
+    """Drop every cached document."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def set_parse_cache_size(size: int) -> None:
+    """Bound the parse cache to ``size`` documents (``0`` disables it)."""
+    global _cache_size
+    if size < 0:
+        raise ValueError("size must be >= 0")
+    with _cache_lock:
+        _cache_size = size
+        while len(_cache) > size:
+            _cache.popitem(last=False)
@@ -2,9 +2,10 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from __future__ import annotations
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from textwizard.utils.tw_html_parser.dom import NodeType  # type: ignore
+from textwizard.utils.tw_html_parser.html_document import HTMLDocument
 from textwizard.utils.tw_html_parser.parser import TWHTMLParser as _Parser  # type: ignore
 
 
@@ -432,10 +433,13 @@ def html_dom_to_markdown(dom: Any) -> str:
     md = _render_children_blocks(dom) if children else _render_block(dom)
     return _trim_blank_lines(md)
 
-def html_to_markdown_from_html(html: str) -> str:
+def html_to_markdown_from_html(html: Union[str, HTMLDocument]) -> str:
     """
     Convert HTML string to Markdown. If parsing fails, return the original HTML.
+    An :class:`HTMLDocument` is rendered from its already parsed tree.
     """
+    if isinstance(html, HTMLDocument):
+        return html_dom_to_markdown(html.document)
     try:
         dom = _parse_html(html)
     except Exception:
@@ -2,13 +2,15 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from textwizard.utils.tw_html_parser.tokenizer import TWHTMLTokenizer,TokenizerState
-from textwizard.utils.tw_html_parser.tokens import Token, CHARACTER, START_TAG, END_TAG, COMMENT, DOCTYPE, EOF ,Attribute
+from textwizard.utils.tw_html_parser.tokens import (Token, CharacterToken, StartTagToken, EndTagToken, CHARACTER, START_TAG, END_TAG,
+                                                    COMMENT, DOCTYPE, EOF, Attribute, NEED_DATA)
 from textwizard.utils.tw_html_parser.dom import Document, Element, Text, Comment, Node, NodeType
 from textwizard.utils.tw_html_parser._utils import (SVG_ATTRIBUTE_FIXES, MATHML_ATTRIBUTE_FIXES, NAMESPACED_ATTRIBUTE_FIXES, SPECIAL_ELEMENTS, IMPLIED_END_TAGS,
                     NO_OPEN_ELEMENTS, SVG_TAGNAME_FIXES, space_characters, SCOPE_SETS, namespaces, ascii_upper2lower,
                     BREAKOUT_ELEMENTS, html_integration_point_elements, mathml_integration_point_elements, table_insert_text, HEADING_TAGS)
 from textwizard.utils.tw_html_parser.error import ParseError
 from collections import deque
+from time import monotonic
 from typing import Callable, Optional, Union, Any, Dict, List
 
 
@@ -40,8 +42,49 @@ class InsertionMode:
 
 MARKER = object()
 
-def parse_fragment(doc, container="div", **kwargs):
-    parser = TWHTMLParser(doc)
+
+class ParserLimits:
+    """
+    Bounds on the work done for one document; ``None`` disables a bound.
+
+    - ``max_depth``: stack of open elements. Parsing stops when it is exceeded.
+    - ``max_nodes``: elements and text nodes created. Parsing stops when it is exceeded.
+    - ``max_formatting_elements``: list of active formatting elements; the
+      oldest entries are dropped (their content is kept, they are just no
+      longer reopened).
+    - ``time_budget``: seconds of tree construction. Parsing stops when it is spent.
+
+    A parser that stopped keeps everything built so far, sets ``truncated``
+    and names the limit in ``truncation_reason``.
+    """
+    __slots__ = ("max_depth", "max_nodes", "max_formatting_elements", "time_budget")
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = 512,
+        max_nodes: Optional[int] = 1_000_000,
+        max_formatting_elements: Optional[int] = 64,
+        time_budget: Optional[float] = None,
+    ):
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.max_formatting_elements = max_formatting_elements
+        self.time_budget = time_budget
+
+    def key(self) -> tuple:
+        return self.max_depth, self.max_nodes, self.max_formatting_elements, self.time_budget
+
+    def __repr__(self) -> str:
+        return (f"ParserLimits(max_depth={self.max_depth}, max_nodes={self.max_nodes}, "
+                f"max_formatting_elements={self.max_formatting_elements}, time_budget={self.time_budget})")
+
+
+# Tokens between two clock reads when a time budget is set.
+_CLOCK_INTERVAL = 256
+
+
+def parse_fragment(doc, container="div", limits: Optional[ParserLimits] = None, **kwargs):
+    parser = TWHTMLParser(doc, limits=limits)
     return parser.parse_fragment(container=container, **kwargs)
 
 
@@ -51,10 +94,11 @@ class TWHTMLParser:
         "is_fragment_parsing","original_mode", "errors", "head_element", "active_formatting_elements",
         "scripting_enabled", "frameset_ok","fragment_case","context_element",
         "pending_table_character_tokens", "insert_element_token", "_insert_from_table", "first_tag_html",
-        "default_name_spaces","_dispatch_cache")
+        "default_name_spaces","_dispatch_cache","_token_stream",
+        "limits", "truncated", "truncation_reason", "node_count", "_time_left", "_stopped")
 
 
-    def __init__(self, text: str):
+    def __init__(self, text: str = "", limits: Optional[ParserLimits] = None):
         self.text: str = text
         self.document: Document = Document()
         self.process_token=self._process_token
@@ -77,11 +121,19 @@ class TWHTMLParser:
 
         self._insert_from_table = False
         self.default_name_spaces=namespaces["html"]
+        self._token_stream = None
 
         self.pending_table_character_tokens = []
         self._dispatch_cache = {}
         self.errors = deque()
 
+        self.limits = limits
+        self.truncated = False
+        self.truncation_reason: Optional[str] = None
+        self.node_count = 0
+        self._time_left = limits.time_budget if limits is not None else None
+        self._stopped = False
+
     def log_error(self, error: Union[ParseError, tuple, str]) -> None:
         if isinstance(error, tuple):
             base_error, custom_message = error
@@ -125,36 +177,110 @@ class TWHTMLParser:
         self.scripting_enabled = scripting
         self.reset_insertion_mode_appropriately()
 
-        token_iter = iter(self.tokenizer)
-
-        while True:
-            token = next(token_iter, None)
-            if token is None:
-                break
-            if token.type == CHARACTER and token.data != "\uFFFD":
-                parts = [token.data]
-                while True:
-                    nxt = next(token_iter, None)
-                    if nxt is None or nxt.type != CHARACTER:
-                        break
-                    parts.append(nxt.data)
-                token.data = "".join(parts)
-            self.process_token(token)
+        if self.limits is None:
+            work_token = self.process_token
+            for token in self.tokenizer:
+                work_token(token)
+        else:
+            self._drain_limited(iter(self.tokenizer))
 
         self.finalize_parsing()
 
         fragment = self.document.create_document_fragment()
-        for child in self.context_element.child_nodes:
+        for child in list(self.context_element.child_nodes):
             fragment.append_child(child)
         return fragment
 
     def parse(self) -> Document:
-        work_token=self.process_token
-        for token in self.tokenizer:
-            work_token(token)
+        if self.limits is None:
+            work_token=self.process_token
+            for token in self.tokenizer:
+                work_token(token)
+        else:
+            self._drain_limited(iter(self.tokenizer))
         self.finalize_parsing()
         return self.document
 
+    def feed(self, data: str) -> None:
+        """
+        Push-parser entry point: tokenize and tree-build ``data`` now, keeping
+        the tokenizer and insertion-mode state for the next chunk. Any text
+        passed to the constructor is treated as the first chunk. Call
+        :meth:`close` after the last chunk to get the document. Chunks must be
+        ``str``: decode bytes before feeding them.
+        """
+        if not isinstance(data, str):
+            raise TypeError(f"feed() expects str, got {type(data).__name__}; decode bytes before feeding them")
+        if self._stopped:
+            return
+        if self._token_stream is None:
+            self.tokenizer = TWHTMLTokenizer(self.text, parser=self, incremental=True)
+            self._token_stream = iter(self.tokenizer)
+        self.tokenizer.feed(data)
+        self._drain(self._token_stream)
+
+    def close(self) -> Document:
+        """Signal end of input to a push parser and return the finished document."""
+        if self._token_stream is None:
+            if self._stopped:
+                return self.document
+            return self.parse()
+        self.tokenizer.close()
+        if not self._stopped:
+            self._drain(self._token_stream)
+        self._token_stream = None
+        self.finalize_parsing()
+        return self.document
+
+    def _drain(self, stream):
+        if self.limits is not None:
+            self._drain_limited(stream)
+            return
+        work_token = self.process_token
+        for token in stream:
+            if token is NEED_DATA:
+                return
+            work_token(token)
+
+    def _drain_limited(self, stream):
+        # Same loop as ``_drain``, checking ``limits`` after every token.
+        limits = self.limits
+        work_token = self.process_token
+        open_elements = self.open_elements
+        max_depth = limits.max_depth
+        max_nodes = limits.max_nodes
+        time_left = self._time_left
+        started = monotonic()
+        count = 0
+        reason = None
+        if time_left is not None and time_left <= 0:
+            # A push parser drains a few tokens per chunk, often fewer than
+            # _CLOCK_INTERVAL: the time spent in earlier chunks is checked here.
+            reason = "time_budget"
+        else:
+            for token in stream:
+                if token is NEED_DATA:
+                    break
+                work_token(token)
+                if max_depth is not None and len(open_elements) > max_depth:
+                    reason = "max_depth"
+                elif max_nodes is not None and self.node_count > max_nodes:
+                    reason = "max_nodes"
+                elif time_left is not None:
+                    count += 1
+                    if count % _CLOCK_INTERVAL or monotonic() - started <= time_left:
+                        continue
+                    reason = "time_budget"
+                else:
+                    continue
+                break
+        if time_left is not None:
+            self._time_left = time_left - (monotonic() - started)
+        if reason is not None:
+            self._stopped = self.truncated = True
+            self.truncation_reason = reason
+            self.log_error(f"Parse limit reached ({reason}): remaining input ignored")
+
     def finalize_parsing(self):
         self.open_elements.clear()
         self.pending_table_character_tokens.clear()
@@ -344,6 +470,7 @@ class TWHTMLParser:
             node_document.custom_element_reactions_stack.append([])
 
         element = node_document.create_element(local_name)
+        self.node_count += 1
         element.namespace = namespace
         element.is_value = is_value
 
@@ -487,6 +614,7 @@ class TWHTMLParser:
 
     def insert_text(self, data: str, override_target: Optional[Element] = None) -> None:
         text_node = self.document.create_text_node(data)
+        self.node_count += 1
         parent_node = override_target if override_target is not None else (self.open_elements[-1] if self.open_elements else self.document)
 
         if (not self.insert_from_table or
@@ -504,13 +632,14 @@ class TWHTMLParser:
         if parent_node.node_type == NodeType.DOCUMENT_NODE:
             return
 
-        if parent_node.child_nodes:
-            last_child = parent_node.child_nodes[-1]
+        last_child = parent_node.last_child
+        if last_child is not None:
             if last_child.node_type == NodeType.TEXT_NODE and hasattr(last_child, "data"):
-                last_child.data += data
+                last_child.append_data(data)
                 return
 
         text_node: Text = self.document.create_text_node(data)
+        self.node_count += 1
 
         if ref_node is not None:
             parent_node.insert_before(text_node, ref_node)
@@ -572,7 +701,7 @@ class TWHTMLParser:
             i += 1
             entry = active_formatting_elements[i]
             clone = self.clone_formatting_element(entry)
-            token = Token(START_TAG, clone.tag_name)
+            token = StartTagToken(clone.tag_name)
             token.attributes = [{"name": k, "value": v} for k, v in clone.get_attributes().items()]
             inserted_element = self.insert_element_token(token)
             active_formatting_elements[i] = inserted_element
@@ -595,6 +724,21 @@ class TWHTMLParser:
         if len(matching) == 3:
             self.active_formatting_elements.remove(matching[-1])
         self.active_formatting_elements.append(element)
+        if self.limits is not None:
+            self._limit_formatting_elements()
+
+    def _limit_formatting_elements(self) -> None:
+        limit = self.limits.max_formatting_elements
+        entries = self.active_formatting_elements
+        if limit is None or len(entries) - entries.count(MARKER) <= limit:
+            return
+        for i, entry in enumerate(entries):
+            if entry is not MARKER:
+                del entries[i]
+                break
+        if not self.truncated:
+            self.truncated = True
+            self.truncation_reason = "max_formatting_elements"
 
     def clone_formatting_element(self, element: Element) -> Element:
         new_element = self.document.create_element(element.tag_name)
@@ -822,14 +966,14 @@ def handle_initial_fallback(parser: "TWHTMLParser", token: Token) -> None:
 # ---------------------------
 
 def handle_before_html_html(parser: "TWHTMLParser", token: Token) -> None:
-    synthetic_head_token = Token(START_TAG, "html", attributes=[])
+    synthetic_head_token = StartTagToken("html", attributes=[])
     parser.insert_element_token(synthetic_head_token)
     parser.insertion_mode = InsertionMode.BEFORE_HEAD
     parser.first_tag_html=True
     parser.process_token(token)
 
 def handle_before_html_fallback(parser: "TWHTMLParser", token: Token) -> None:
-    synthetic_head_token = Token(START_TAG, "html", attributes=[])
+    synthetic_head_token = StartTagToken("html", attributes=[])
     parser.insert_element_token(synthetic_head_token)
     parser.insertion_mode = InsertionMode.BEFORE_HEAD
     parser.process_token(token)
@@ -844,7 +988,7 @@ def handle_before_head_head(parser: "TWHTMLParser", token: Token) -> None:
     parser.insertion_mode = InsertionMode.IN_HEAD
 
 def handle_before_head_anything_else(parser: "TWHTMLParser", token: Token) -> None:
-    synthetic_head_token = Token(START_TAG, "head", attributes=[])
+    synthetic_head_token = StartTagToken("head", attributes=[])
     head_elem = parser.insert_element_token(synthetic_head_token)
     parser.head_element = head_elem
     parser.insertion_mode = InsertionMode.IN_HEAD
@@ -942,7 +1086,7 @@ def handle_after_head_in_head_tags(parser: "TWHTMLParser", token: Token) -> None
         parser.open_elements.remove(parser.head_element)
 
 def handle_after_head_anything_else(parser: "TWHTMLParser", token: Token) -> None:
-    synthetic_token = Token(START_TAG, name="body", attributes=[])
+    synthetic_token = StartTagToken("body", attributes=[])
     parser.insert_element_token(synthetic_token)
     parser.frameset_ok = True
     parser.insertion_mode = InsertionMode.IN_BODY
@@ -1063,8 +1207,8 @@ def adoption_agency_algorithm(parser: "TWHTMLParser", token: Token) -> None:
 
         # STEP 11-13:
         new_clone = parser.clone_formatting_element(formatting_element)
-        while furthest_block.child_nodes:
-            child = furthest_block.child_nodes[0]
+        while furthest_block.first_child is not None:
+            child = furthest_block.first_child
             furthest_block.remove_child(child)
             new_clone.append_child(child)
         furthest_block.append_child(new_clone)
@@ -1110,7 +1254,7 @@ def handle_in_body_body(parser: "TWHTMLParser", token: Token) -> None:
             parser.open_elements[1].tag_name_lower != "body" or
             any(el.tag_name_lower == "template" for el in parser.open_elements)):
 
-        synthetic_body = Token(START_TAG, name="body", attributes=[])
+        synthetic_body = StartTagToken("body", attributes=[])
         parser.insert_element_token(synthetic_body)
         parser.insertion_mode = InsertionMode.IN_BODY
     else:
@@ -1212,7 +1356,7 @@ def handle_in_body_dd_dt_li(parser: "TWHTMLParser", token: Token) -> None:
     for node in reversed(parser.open_elements):
         tag = node.tag_name_lower
         if tag in to_close:
-            synthetic_token = Token(END_TAG, name=node.tag_name)
+            synthetic_token = EndTagToken(node.tag_name)
             parser.process_token(synthetic_token, override_mode=InsertionMode.IN_BODY)
             break
 
@@ -1220,14 +1364,14 @@ def handle_in_body_dd_dt_li(parser: "TWHTMLParser", token: Token) -> None:
             break
 
     if parser.has_element_in_scope("p", "button"):
-        synthetic_token = Token(END_TAG, "p")
+        synthetic_token = EndTagToken("p")
         parser.process_token(synthetic_token, override_mode=InsertionMode.IN_BODY)
 
     parser.insert_element_token(token)
 
 def handle_in_body_plaintext(parser: "TWHTMLParser", token: Token) -> None:
     if parser.has_element_in_scope("p", "button"):
-        synthetic_token = Token(END_TAG, name="p")
+        synthetic_token = EndTagToken("p")
         handle_in_body_endtag_p(parser,synthetic_token)
 
     parser.insert_and_change_state_tokenizer(token, new_state=TokenizerState.PLAINTEXT_STATE, appropriate_end_tag_name="plaintext", insertion_mode=parser.insertion_mode)
@@ -1284,7 +1428,7 @@ def handle_in_body_endtag_form(parser: "TWHTMLParser", token: Token) -> None:
 def handle_in_body_endtag_p(parser: "TWHTMLParser", token: Token) -> None:
     if not parser.has_element_in_scope("p", "button"):
         parser.log_error("Parse error: no <p> element in button scope when processing </p>; inserting a synthetic <p>.")
-        synthetic_token = Token(START_TAG, name="p", attributes=[])
+        synthetic_token = StartTagToken("p", attributes=[])
         parser.insert_element_token(synthetic_token)
     parser.close_p_element()
 
@@ -1334,7 +1478,7 @@ def handle_in_body_a(self, token: Token) -> None:
     afe_element = self.find_last_active_formatting_element("a")
     if afe_element is not None:
         self.log_error("Parse error: unexpected start_tag implies end_tag for <a>")
-        implied_end_token = Token(END_TAG, "a")
+        implied_end_token = EndTagToken("a")
         adoption_agency_algorithm(self, implied_end_token)
         if afe_element in self.open_elements:
             self.open_elements.remove(afe_element)
@@ -1388,7 +1532,7 @@ def handle_in_body_table(parser: "TWHTMLParser", token: Token) -> None:
 
 def handle_in_body_endtag_br(parser: "TWHTMLParser", token: Token) -> None:
     parser.log_error("Parse error: unexpected </br> end tag; treating as a <br> start tag with no attributes.")
-    synthetic_token = Token(START_TAG, name="br", attributes=[])
+    synthetic_token = StartTagToken("br", attributes=[])
     parser.process_token(synthetic_token)
 
 def handle_in_body_void_elements(parser: "TWHTMLParser", token: Token) -> None:
@@ -1592,7 +1736,7 @@ def handle_in_table_start_colgroup(parser: "TWHTMLParser", token: Token) -> None
 
 def handle_in_table_start_col(parser: "TWHTMLParser", token: Token) -> None:
     clear_stack_back_to_table_context(parser)
-    synthetic_colgroup = Token(START_TAG, "colgroup", attributes=[])
+    synthetic_colgroup = StartTagToken("colgroup", attributes=[])
     parser.insert_element_token(synthetic_colgroup)
     parser.insertion_mode = InsertionMode.IN_COLUMN_GROUP
     parser.process_token(token)
@@ -1604,7 +1748,7 @@ def handle_in_table_start_tbody_tfoot_thead(parser: "TWHTMLParser", token: Token
 
 def handle_in_table_start_td_th_tr(parser: "TWHTMLParser", token: Token) -> None:
     clear_stack_back_to_table_context(parser)
-    synthetic_tbody = Token(START_TAG, "tbody", attributes=[])
+    synthetic_tbody = StartTagToken("tbody", attributes=[])
     parser.insert_element_token(synthetic_tbody)
     parser.insertion_mode = InsertionMode.IN_TABLE_BODY
     parser.process_token(token)
@@ -1686,7 +1830,7 @@ def handle_in_table_text_char_other(parser: "TWHTMLParser", token: Token) -> Non
 def handle_in_table_text_anything_else(parser: "TWHTMLParser", token: Token) -> None:
     data = "".join([item.data for item in parser.pending_table_character_tokens])
     if any(ch not in space_characters for ch in data):
-        synthetic_token = Token(CHARACTER, data=data)
+        synthetic_token = CharacterToken(data)
         parser.insert_from_table  = True
         parser.process_token(synthetic_token, override_mode=InsertionMode.IN_BODY)
         parser.insert_from_table  = False
@@ -1739,7 +1883,7 @@ def handle_in_caption_start_caption_col_colgroup_tbody_td_tfoot_th_thead_tr_end_
 # ---------------------------
 
 def handle_in_column_group_character(parser: "TWHTMLParser", token: Token) -> None:
-    synthetic_token = Token(END_TAG, name="colgroup", attributes=[])
+    synthetic_token = EndTagToken("colgroup", attributes=[])
     handle_in_column_group_end_colgroup(parser,synthetic_token)
     if not (parser.current_node.tag_name_lower == "html"):
         parser.process_token(token)
@@ -1785,7 +1929,7 @@ def handle_in_table_body_start_tr(parser: "TWHTMLParser", token: Token) -> None:
 def handle_in_table_body_start_th_td(parser: "TWHTMLParser", token: Token) -> None:
     parser.log_error(f"Parse error: <{token.name}> start tag in 'in table body' mode.")
     parser.clear_stack_back_to_table_body_context()
-    synthetic_tr = Token(START_TAG, "tr", attributes=[])
+    synthetic_tr = StartTagToken("tr", attributes=[])
     parser.insert_element_token(synthetic_tr)
     parser.insertion_mode = InsertionMode.IN_ROW
     parser.process_token(token)
@@ -1804,7 +1948,7 @@ def handle_end_tag_table_row_group(parser: "TWHTMLParser", token: Token) -> None
        parser.has_element_in_scope("thead", "table") or
        parser.has_element_in_scope("tfoot", "table")):
         parser.clear_stack_back_to_table_body_context()
-        synthetic_tr = Token(END_TAG, parser.open_elements[-1].tag_name)
+        synthetic_tr = EndTagToken(parser.open_elements[-1].tag_name)
         handle_in_table_body_end_tbody_tfoot_thead(parser, synthetic_tr)
         parser.process_token(token)
     else:
@@ -1815,7 +1959,7 @@ def handle_end_tag_table(parser: "TWHTMLParser", token: Token) -> None:
         parser.has_element_in_scope("thead", "table") or
         parser.has_element_in_scope("tfoot", "table")):
         parser.clear_stack_back_to_table_body_context()
-        implied_token = Token(END_TAG, parser.current_node.tag_name)
+        implied_token = EndTagToken(parser.current_node.tag_name)
         handle_end_tag_table_row_group(parser, implied_token)
         parser.process_token(token)
     else:
@@ -1856,14 +2000,14 @@ def handle_end_tag_tr(parser: "TWHTMLParser", token: Token):
 
 def handle_in_row_start_the_table_stuff(parser: "TWHTMLParser", token: Token):
     ignore_tag=ignore_end_tag_tr(parser, token)
-    synthetic_tr = Token(END_TAG, "tr")
+    synthetic_tr = EndTagToken("tr")
     handle_in_row_end_tr(parser, synthetic_tr)
     if not ignore_tag:
         parser.process_token(token, override_mode=InsertionMode.IN_TABLE_BODY)
 
 def handle_in_row_end_table(parser: "TWHTMLParser", token: Token):
     ignore_tag = ignore_end_tag_tr(parser, token)
-    synthetic_tr = Token(END_TAG, "tr")
+    synthetic_tr = EndTagToken("tr")
     handle_in_row_end_tr(parser, synthetic_tr)
     if not ignore_tag:
         parser.process_token(token, override_mode=InsertionMode.IN_TABLE_BODY)
@@ -1877,7 +2021,7 @@ def handle_in_row_end_tbody_tfoot_thead(parser: "TWHTMLParser", token: Token) ->
         parser.log_error(f"Parse error: </{tag_lower_name}> but no <tr> in table scope => ignoring.")
         return
 
-    synthetic_tr = Token(END_TAG, "tr")
+    synthetic_tr = EndTagToken("tr")
     handle_end_tag_tr(parser, synthetic_tr)
     parser.process_token(token, override_mode=InsertionMode.IN_TABLE_BODY)
 
@@ -1911,10 +2055,10 @@ def handle_in_cell_end_td_th(parser: "TWHTMLParser", token: Token) -> None:
 def handle_in_cell_start_caption_col_colgroup_tbody_td_tfoot_th_thead_tr(parser: "TWHTMLParser", token: Token) -> None:
     if parser.has_element_in_scope("td", "table") or parser.has_element_in_scope("th", "table"):
         if parser.has_element_in_scope("td", "table"):
-            synthetic_head_token = Token(START_TAG, "td", attributes=[])
+            synthetic_head_token = StartTagToken("td", attributes=[])
             handle_in_cell_end_td_th(parser, synthetic_head_token)
         elif parser.has_element_in_scope("th", "table"):
-            synthetic_head_token = Token(START_TAG, "th", attributes=[])
+            synthetic_head_token = StartTagToken("th", attributes=[])
             handle_in_cell_end_td_th(parser, synthetic_head_token)
 
         parser.process_token(token)
@@ -1993,13 +2137,13 @@ def handle_in_select_end_select(parser: "TWHTMLParser", token: Token) -> None:
 
 def handle_in_select_start_select(parser: "TWHTMLParser", token: Token) -> None:
     parser.log_error("Parse error: <select> start tag in 'in select' mode.")
-    synthetic_token = Token(END_TAG, "select")
+    synthetic_token = EndTagToken("select")
     handle_in_select_end_select(parser,synthetic_token)
 
 def handle_in_select_start_input_keygen_textarea(parser: "TWHTMLParser", token: Token) -> None:
     parser.log_error(f"Parse error: <{token.name}> in 'in select' mode.")
     if parser.has_element_in_scope("select", "select"):
-        synthetic_token = Token(END_TAG, "select")
+        synthetic_token = EndTagToken("select")
         handle_in_select_end_select(parser, synthetic_token)
         parser.process_token(token)
 
@@ -2215,7 +2359,7 @@ def handle_end_tag_foreign_content(parser: "TWHTMLParser", token: Token) -> None
             if parser.insertion_mode == InsertionMode.IN_TABLE_TEXT:
                 data = "".join(item.data for item in parser.pending_table_character_tokens)
                 if any(ch not in space_characters for ch in data):
-                    synthetic_token = Token(CHARACTER, data=data)
+                    synthetic_token = CharacterToken(data)
                     parser.insert_from_table = True
                     handler = parser.get_dispatch_handler(synthetic_token, InsertionMode.IN_BODY)
                     if handler:
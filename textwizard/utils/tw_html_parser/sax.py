@@ -0,0 +1,517 @@
+# SPDX-FileCopyrightText: 2024–2025 Mattia Rubino
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Streaming (SAX-style) events on top of :class:`TWHTMLTokenizer`.
+
+No DOM is built. A stack of open elements follows the parts of tree
+construction that decide *where* elements start and end: void elements,
+implied end tags (``<p>``, ``<li>``, ``<dd>``/``<dt>``, ``<option>``, table
+cells, rows and sections), RCDATA/RAWTEXT/script/PLAINTEXT switching of the
+tokenizer, whitespace-only text dropped before ``<head>``, and SVG/MathML foreign content with its
+HTML integration points. Reparenting steps of the full algorithm (foster
+parenting, the adoption agency, the implied ``html``/``head``/``body``
+elements, framesets) are not replayed, so events follow source order. Every
+``start`` event has a matching ``end`` event.
+
+When the input reaches a construct whose tree-construction outcome the events
+do not replay (content foster-parented out of a table, rows and sections the
+tree builder implied, ``<select>``, ``<template>``, framesets, head content
+after ``</head>`` or ``<noscript>`` in the head, ``</form>`` around open
+elements, formatting elements misnested around blocks or foreign content), the parser
+sets ``approximate``: from there on, text may differ from the text of
+the tree :class:`TWHTMLParser` builds.
+
+Events are ``(kind, value, attrs)`` tuples:
+
+- ``("start", name, {attr: value})``
+- ``("end", name, None)``
+- ``("text", data, None)``
+- ``("comment", data, None)``
+- ``("doctype", name, None)``
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from textwizard.utils.tw_html_parser.parser import determine_quirks_mode
+from textwizard.utils.tw_html_parser.tokenizer import TWHTMLTokenizer, TokenizerState
+from textwizard.utils.tw_html_parser.tokens import CHARACTER, START_TAG, END_TAG, COMMENT, DOCTYPE, EOF, NEED_DATA
+from textwizard.utils.tw_html_parser._utils import (
+    BREAKOUT_ELEMENTS,
+    BUTTON_SCOPE_ELEMENTS,
+    HEADING_TAGS,
+    IMPLIED_END_TAGS,
+    LIST_ITEM_SCOPE_ELEMENTS,
+    PLAINTEXT_ELEMENT,
+    RAWTEXT_ELEMENTS,
+    RCDATA_ELEMENTS,
+    SCOPE_BOUNDARY_ELEMENTS,
+    SCRIPT_DATA_ELEMENTS,
+    SPECIAL_ELEMENTS,
+    SVG_TAGNAME_FIXES,
+    VOID_ELEMENTS,
+    ascii_upper2lower,
+    html_integration_point_elements,
+    mathml_integration_point_elements,
+    namespaces,
+)
+
+__all__ = ["START", "END", "TEXT", "COMMENT_EVENT", "DOCTYPE_EVENT", "ContentHandler", "TWHTMLEventParser", "iter_events", "sax_parse"]
+
+START = "start"
+END = "end"
+TEXT = "text"
+COMMENT_EVENT = "comment"
+DOCTYPE_EVENT = "doctype"
+
+Event = Tuple[str, str, Optional[Dict[str, str]]]
+
+_HTML = namespaces["html"]
+_SVG = namespaces["svg"]
+_MATHML = namespaces["mathml"]
+
+_VOID = VOID_ELEMENTS | frozenset(("wbr", "keygen", "basefont", "bgsound", "frame"))
+
+# Start tags that close an open <p> (in button scope).
+_CLOSES_P = frozenset((
+    "address", "article", "aside", "blockquote", "center", "details", "dialog", "dir", "div", "dl",
+    "fieldset", "figcaption", "figure", "footer", "form", "header", "hgroup", "hr", "listing", "main",
+    "menu", "nav", "ol", "p", "plaintext", "pre", "search", "section", "summary", "table", "ul", "xmp",
+)) | HEADING_TAGS
+
+_TABLE_SCOPE = frozenset(("html", "table", "template"))
+_HTML_SPACE = "\t\n\f\r "
+_FONT_BREAKOUT_ATTRS = frozenset(("color", "face", "size"))
+
+# start tag -> (elements it closes, elements that stop the search)
+_IMPLIED_CLOSE = {
+    "li": (frozenset(("li",)), LIST_ITEM_SCOPE_ELEMENTS),
+    "dd": (frozenset(("dd", "dt")), SCOPE_BOUNDARY_ELEMENTS | frozenset(("dl",))),
+    "dt": (frozenset(("dd", "dt")), SCOPE_BOUNDARY_ELEMENTS | frozenset(("dl",))),
+    "option": (frozenset(("option",)), frozenset(("select", "datalist", "optgroup")) | _TABLE_SCOPE),
+    "optgroup": (frozenset(("option", "optgroup")), frozenset(("select",)) | _TABLE_SCOPE),
+    "td": (frozenset(("td", "th")), frozenset(("tr",)) | _TABLE_SCOPE),
+    "th": (frozenset(("td", "th")), frozenset(("tr",)) | _TABLE_SCOPE),
+    "tr": (frozenset(("tr",)), frozenset(("thead", "tbody", "tfoot")) | _TABLE_SCOPE),
+    "thead": (frozenset(("thead", "tbody", "tfoot", "caption", "colgroup")), _TABLE_SCOPE),
+    "tbody": (frozenset(("thead", "tbody", "tfoot", "caption", "colgroup")), _TABLE_SCOPE),
+    "tfoot": (frozenset(("thead", "tbody", "tfoot", "caption", "colgroup")), _TABLE_SCOPE),
+    "caption": (frozenset(("caption",)), _TABLE_SCOPE),
+    "colgroup": (frozenset(("colgroup",)), _TABLE_SCOPE),
+}
+
+_TOKENIZER_STATE = {name: TokenizerState.RCDATA_STATE for name in RCDATA_ELEMENTS}
+_TOKENIZER_STATE.update({name: TokenizerState.RAWTEXT_STATE for name in RAWTEXT_ELEMENTS})
+_TOKENIZER_STATE.update({name: TokenizerState.SCRIPT_DATA_STATE for name in SCRIPT_DATA_ELEMENTS})
+# Elements whose text the tree builder inserts in "text" mode, NULs included.
+_TEXT_MODE = frozenset(_TOKENIZER_STATE)
+_TOKENIZER_STATE[PLAINTEXT_ELEMENT] = TokenizerState.PLAINTEXT_STATE
+# End tags the tree builder lets close these elements besides their own.
+_END_TAG_NAMES = {"style": ("noframes", "style"), "noembed": ("noembed", "noframes")}
+
+# Open elements under which text and most tags are foster-parented.
+_TABLE_CONTEXT = frozenset(("table", "tbody", "thead", "tfoot", "tr", "colgroup"))
+# Start and end tags the table insertion modes handle in place.
+_TABLE_CONTENT = frozenset((
+    "caption", "col", "colgroup", "tbody", "td", "tfoot", "th", "thead", "tr", "style", "script", "template",
+))
+_TABLE_END_TAGS = _TABLE_CONTENT | frozenset(("table",))
+# End tags that close open cells and table parts up to their element.
+_TABLE_SECTIONS = frozenset(("table", "tbody", "tfoot", "thead", "tr"))
+# Start tags the "in body" rules ignore outside tables and templates.
+_TABLE_ONLY = frozenset(("caption", "col", "colgroup", "tbody", "td", "tfoot", "th", "thead", "tr"))
+# Start tags handled by insertion modes the events do not follow.
+_UNREPLAYED = frozenset(("select", "frameset", "noframes", "template"))
+# Start tags that "after head" moves back into the head, behind earlier whitespace.
+_HEAD_CONTENT = frozenset((
+    "base", "basefont", "bgsound", "link", "meta", "noframes", "script", "style", "template", "title",
+))
+# End tags the cell and caption insertion modes handle while a table is open.
+_CELL_END_TAGS = frozenset(("caption", "td", "th"))
+# End tags the "in body" rules close up to a scope boundary; the other
+# special ones stop at the first special element like any other end tag.
+_SCOPED_END_TAGS = frozenset((
+    "address", "article", "aside", "blockquote", "button", "center", "details", "dialog", "dir", "div",
+    "dl", "fieldset", "figcaption", "figure", "footer", "header", "hgroup", "listing", "main", "menu",
+    "nav", "ol", "pre", "search", "section", "summary", "ul", "applet", "marquee", "object",
+    "form", "dd", "dt",
+)) | HEADING_TAGS
+_FORMATTING = frozenset((
+    "a", "b", "big", "code", "em", "font", "i", "nobr", "s", "small", "strike", "strong", "tt", "u",
+))
+
+
+class _OpenElement:
+    # Minimal stand-in for an element; the tokenizer reads ``namespace`` of
+    # the current node to decide on CDATA sections.
+    __slots__ = ("tag_name", "namespace", "html_integration")
+
+    def __init__(self, tag_name: str, namespace: str, attrs: Dict[str, str]):
+        self.tag_name = tag_name
+        self.namespace = namespace
+        if namespace == _MATHML and tag_name == "annotation-xml":
+            encoding = attrs.get("encoding", "").translate(ascii_upper2lower)
+            self.html_integration = encoding in ("text/html", "application/xhtml+xml")
+        else:
+            self.html_integration = (namespace, tag_name) in html_integration_point_elements
+
+
+class ContentHandler:
+    """Callback interface for :func:`sax_parse`; every method is a no-op by default."""
+
+    def start_element(self, name: str, attrs: Dict[str, str]) -> None:
+        pass
+
+    def end_element(self, name: str) -> None:
+        pass
+
+    def characters(self, data: str) -> None:
+        pass
+
+    def comment(self, data: str) -> None:
+        pass
+
+    def doctype(self, name: str) -> None:
+        pass
+
+
+class TWHTMLEventParser:
+    """
+    Pull parser producing the events described in the module docstring.
+    ``events()`` parses the whole text; ``feed()``/``close()`` return the
+    events available so far, for incremental input.
+    """
+    __slots__ = ("tokenizer", "open_elements", "approximate", "_prologue", "_after_head", "_quirks", "_stream")
+
+    def __init__(self, text: str = ""):
+        self.tokenizer = TWHTMLTokenizer(text, parser=self)
+        self.open_elements: List[_OpenElement] = []
+        self.approximate = False
+        self._prologue = True
+        self._after_head = False
+        self._quirks: Optional[bool] = None
+        self._stream = None
+
+    @property
+    def current_node(self) -> Optional[_OpenElement]:
+        return self.open_elements[-1] if self.open_elements else None
+
+    def events(self) -> Iterator[Event]:
+        return self._events(iter(self.tokenizer))
+
+    def feed(self, data: str) -> List[Event]:
+        if self._stream is None:
+            text = self.tokenizer.text
+            self.tokenizer = TWHTMLTokenizer(text, parser=self, incremental=True)
+            self._stream = self._events(iter(self.tokenizer))
+        self.tokenizer.feed(data)
+        return self._collect()
+
+    def close(self) -> List[Event]:
+        if self._stream is None:
+            return list(self.events())
+        self.tokenizer.close()
+        out = self._collect()
+        self._stream = None
+        return out
+
+    def _collect(self) -> List[Event]:
+        out = []
+        for event in self._stream:
+            if event is NEED_DATA:
+                break
+            out.append(event)
+        return out
+
+    def _pop_to(self, index: int) -> Iterator[Event]:
+        # Formatting elements popped on the way are reconstructed by the tree
+        # builder later on; over foreign content that changes how the
+        # tokenizer treats CDATA sections.
+        stack = self.open_elements
+        reopened = False
+        while len(stack) > index:
+            el = stack.pop()
+            reopened = reopened or (len(stack) > index and el.namespace == _HTML and el.tag_name in _FORMATTING)
+            yield END, el.tag_name, None
+        if reopened and stack and stack[-1].namespace != _HTML:
+            self.approximate = True
+
+    def _find(self, names, boundary) -> int:
+        stack = self.open_elements
+        for i in range(len(stack) - 1, -1, -1):
+            el = stack[i]
+            if el.namespace != _HTML:
+                # Scope boundaries match by name, as in the tree builder.
+                if el.tag_name in boundary:
+                    return -1
+                continue
+            if el.tag_name in names:
+                return i
+            if el.tag_name in boundary:
+                return -1
+        return -1
+
+    def _break_out(self) -> Iterator[Event]:
+        stack = self.open_elements
+        while stack and stack[-1].namespace != _HTML and not stack[-1].html_integration:
+            yield END, stack.pop().tag_name, None
+
+    def _table_start_ignored(self) -> bool:
+        # Table parts only count inside a table or template; a foreign
+        # element between the two leaves the insertion mode to the tree.
+        for el in reversed(self.open_elements):
+            if el.namespace != _HTML:
+                self.approximate = True
+                return False
+            if el.tag_name == "table" or el.tag_name == "template":
+                return False
+        return True
+
+    def _find_foreign(self, name: str) -> int:
+        stack = self.open_elements
+        for i in range(len(stack) - 1, -1, -1):
+            if stack[i].namespace == _HTML:
+                break
+            if stack[i].tag_name.lower() == name:
+                return i
+        return -1
+
+    def _end_tag(self, name: str) -> Iterator[Event]:
+        # In foreign content an end tag first closes the nearest foreign
+        # element of that name above the first HTML element. Formatting end
+        # tags run the adoption agency, which ignores them outside the current
+        # scope and which the events only follow when no foreign or special
+        # element (a furthest block) is in the way; other end tags are ignored
+        # when a special element (or, for special ones, a scope boundary) comes
+        # first, matched by name whatever its namespace, as in the tree builder.
+        stack = self.open_elements
+        i = self._find_foreign(name)
+        if i >= 0:
+            yield from self._pop_to(i)
+            return
+        formatting = name in _FORMATTING
+        names = HEADING_TAGS if name in HEADING_TAGS else (name,)
+        if name == "li":
+            stops = LIST_ITEM_SCOPE_ELEMENTS
+        elif name in _CELL_END_TAGS and any(el.namespace == _HTML and el.tag_name == "table" for el in stack):
+            stops = _TABLE_SCOPE
+        elif name in _SCOPED_END_TAGS:
+            stops = SCOPE_BOUNDARY_ELEMENTS
+        else:
+            stops = SPECIAL_ELEMENTS
+        crossed = False
+        for i in range(len(stack) - 1, -1, -1):
+            el = stack[i]
+            if el.tag_name.lower() in names:
+                if crossed:
+                    self.approximate = True
+                yield from self._pop_to(i)
+                return
+            if formatting:
+                if el.namespace == _HTML and el.tag_name in SCOPE_BOUNDARY_ELEMENTS:
+                    return
+                crossed = crossed or el.namespace != _HTML or el.tag_name in SPECIAL_ELEMENTS
+            elif el.tag_name in stops:
+                return
+
+    def _events(self, tokens) -> Iterator[Event]:
+        stack = self.open_elements
+        tokenizer = self.tokenizer
+        for token in tokens:
+            if token is NEED_DATA:
+                yield token
+                continue
+            kind = token.type
+            if self._quirks is None:
+                # Decided by the first token, as in the "initial" insertion mode.
+                if kind == DOCTYPE:
+                    self._quirks = determine_quirks_mode(token) != "no"
+                elif kind != COMMENT and not (kind == CHARACTER and not token.data.strip(_HTML_SPACE)):
+                    self._quirks = True
+
+            if kind == CHARACTER:
+                data = token.data
+                if self._prologue:
+                    if not data.strip(_HTML_SPACE):
+                        continue
+                    self._prologue = False
+                if self._after_head and data.strip(_HTML_SPACE):
+                    self._after_head = False
+                if stack:
+                    top = stack[-1]
+                    if top.namespace == _HTML:
+                        if top.tag_name in _TABLE_CONTEXT and (token.null_character or data.strip(_HTML_SPACE)):
+                            self.approximate = True
+                        keep_null = top.tag_name in _TEXT_MODE
+                    else:
+                        keep_null = not top.html_integration and \
+                            (top.namespace, top.tag_name) not in mathml_integration_point_elements
+                else:
+                    keep_null = False
+                if token.null_character and not keep_null:
+                    # Dropped by the HTML insertion modes; kept in raw text and foreign content.
+                    continue
+                if data:
+                    yield TEXT, data, None
+
+            elif kind == START_TAG:
+                name = token.lower_name
+                if name == "noscript" and (self._prologue or (stack and stack[-1].tag_name == "head")):
+                    # "in head noscript" closes itself and the head on body content.
+                    self.approximate = True
+                prologue = self._prologue
+                if name != "html":
+                    self._prologue = False
+                if self._after_head and name != "head":
+                    self._after_head = False
+                    if name in _HEAD_CONTENT:
+                        self.approximate = True
+                ns = stack[-1].namespace if stack else _HTML
+                if ns != _HTML:
+                    current = stack[-1]
+                    key = (ns, current.tag_name)
+                    if current.html_integration or (
+                            key in mathml_integration_point_elements and name not in ("mglyph", "malignmark")) or (
+                            key == (_MATHML, "annotation-xml") and name == "svg"):
+                        ns = _HTML
+                    elif name in BREAKOUT_ELEMENTS or (
+                            name == "font" and any(a.name in _FONT_BREAKOUT_ATTRS for a in token.attributes)):
+                        yield from self._break_out()
+                        ns = _HTML
+
+                if ns == _HTML:
+                    if name == "svg":
+                        ns = _SVG
+                    elif name == "math":
+                        ns = _MATHML
+                    elif name in _TABLE_ONLY and self._table_start_ignored():
+                        continue
+                    elif (name == "html" and stack) or (name == "body" and any(
+                            el.tag_name not in ("html", "head") for el in stack)):
+                        # Only merges attributes into the element already open.
+                        continue
+                    elif name == "head" and not prologue:
+                        continue
+                    else:
+                        if name in _CLOSES_P and not (name == "table" and self._quirks):
+                            i = self._find(("p",), BUTTON_SCOPE_ELEMENTS)
+                            if i >= 0:
+                                yield from self._pop_to(i)
+                            if name in HEADING_TAGS and stack and stack[-1].tag_name in HEADING_TAGS:
+                                yield END, stack.pop().tag_name, None
+                        if name in _TABLE_ONLY:
+                            # Table parts close the open cell or caption first.
+                            i = self._find(("td", "th", "caption"), _TABLE_SCOPE)
+                            if i >= 0:
+                                yield from self._pop_to(i)
+                        implied = _IMPLIED_CLOSE.get(name)
+                        if implied is not None:
+                            i = self._find(*implied)
+                            if i >= 0:
+                                yield from self._pop_to(i)
+                elif ns == _SVG:
+                    name = SVG_TAGNAME_FIXES.get(name, name)
+
+                if ns == _HTML and name in _UNREPLAYED:
+                    self.approximate = True
+                elif stack and stack[-1].namespace == _HTML and stack[-1].tag_name in _TABLE_CONTEXT and (
+                        ns != _HTML or name not in _TABLE_CONTENT):
+                    self.approximate = True
+
+                attrs: Dict[str, str] = {}
+                for attr in token.attributes:
+                    attrs.setdefault(attr.name, attr.value)
+                yield START, name, attrs
+
+                if (ns == _HTML and name in _VOID) or (ns != _HTML and token.self_closing):
+                    yield END, name, None
+                    continue
+                stack.append(_OpenElement(name, ns, attrs))
+                if ns == _HTML:
+                    state = _TOKENIZER_STATE.get(name)
+                    if state is not None:
+                        tokenizer.state = state
+                        tokenizer.appropriate_end_tag_name = _END_TAG_NAMES.get(name, name)
+                        tokenizer._reconsume_current_input = True
+
+            elif kind == END_TAG:
+                name = token.lower_name
+                if stack and stack[-1].namespace == _HTML and stack[-1].tag_name in _TEXT_MODE:
+                    # The tokenizer only emits end tags that close the text element.
+                    yield END, stack.pop().tag_name, None
+                    continue
+                if name == "head":
+                    if self._prologue or (stack and stack[-1].tag_name == "head"):
+                        self._after_head = True
+                    elif self._find(("head",), ()) >= 0:
+                        # Whatever is open inside the head left it implicitly.
+                        self.approximate = True
+                if name in ("head", "body", "html", "br"):
+                    self._prologue = False
+                if name == "br":
+                    # Handled as a <br> start tag, which breaks out of foreign content.
+                    if stack and (stack[-1].namespace, stack[-1].tag_name) not in mathml_integration_point_elements:
+                        yield from self._break_out()
+                    yield START, "br", {}
+                    yield END, "br", None
+                    continue
+                if (name == "body" or name == "html") and self._find_foreign(name) < 0:
+                    # Only switches insertion mode; the elements stay open until EOF.
+                    continue
+                if stack and stack[-1].namespace == _HTML and stack[-1].tag_name in _TABLE_CONTEXT \
+                        and name not in _TABLE_END_TAGS:
+                    self.approximate = True
+                if stack and stack[-1].tag_name == name:
+                    yield END, stack.pop().tag_name, None
+                    continue
+                if name == "p" and self._find(("p",), BUTTON_SCOPE_ELEMENTS) < 0:
+                    # A stray </p> inserts an empty paragraph.
+                    yield START, "p", {}
+                    yield END, "p", None
+                    continue
+                if name in _TABLE_SECTIONS:
+                    i = self._find((name,), _TABLE_SCOPE)
+                    if i >= 0:
+                        yield from self._pop_to(i)
+                    elif self._find(("table",), _TABLE_SCOPE) >= 0:
+                        # May close a row or section the tree builder implied.
+                        self.approximate = True
+                    continue
+                if name == "form":
+                    i = self._find(("form",), SCOPE_BOUNDARY_ELEMENTS)
+                    if i >= 0 and any(el.tag_name not in IMPLIED_END_TAGS for el in stack[i + 1:]):
+                        # Only the form itself leaves the stack; what it holds stays open.
+                        self.approximate = True
+                yield from self._end_tag(name)
+
+            elif kind == COMMENT:
+                yield COMMENT_EVENT, token.data, None
+
+            elif kind == DOCTYPE:
+                yield DOCTYPE_EVENT, token.name or "", None
+
+            elif kind == EOF:
+                yield from self._pop_to(0)
+
+
+def iter_events(text: str) -> Iterator[Event]:
+    """Yield the SAX events of ``text`` without building a DOM."""
+    return TWHTMLEventParser(text).events()
+
+
+def sax_parse(text: str, handler: ContentHandler) -> None:
+    """Parse ``text`` and report each event to the matching ``handler`` method."""
+    start, end, chars = handler.start_element, handler.end_element, handler.characters
+    for kind, value, attrs in iter_events(text):
+        if kind == TEXT:
+            chars(value)
+        elif kind == START:
+            start(value, attrs)
+        elif kind == END:
+            end(value)
+        elif kind == COMMENT_EVENT:
+            handler.comment(value)
+        else:
+            handler.doctype(value)
@@ -1,8 +1,10 @@
 # SPDX-FileCopyrightText: 2024–2025 Mattia Rubino
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import codecs
+import io
 import re
-from typing import Any, List
+from typing import IO, Any, Callable, List
 from textwizard.utils.tw_html_parser.dom import (
     DocumentType,
     Element,
@@ -18,6 +20,12 @@ _quote_attr_spec_chars = "".join(space_characters) + "\"'=<>`/"
 _quote_attr_spec = re.compile("[" + re.escape(_quote_attr_spec_chars) + "]")
 _quote_attr_legacy = re.compile("[" + re.escape(_quote_attr_spec_chars) + "\x00-\x1F]")
 
+# Characters the target encoding cannot represent become numeric references.
+_ENCODE_ERRORS = "xmlcharrefreplace"
+# Characters gathered before render_to() hands a chunk to the stream.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
 class HTMLSerializer:
     options = (
         "quote_attr_values", "quote_char", "use_best_quote_char",
@@ -84,7 +92,7 @@ class HTMLSerializer:
 
     def encode(self, s: str) -> str:
         if self.encoding:
-            return s.encode(self.encoding, errors="htmlentityreplace")
+            return s.encode(self.encoding, errors=_ENCODE_ERRORS)
         return s
 
     def encode_strict(self, s: str) -> bytes | str:
@@ -93,60 +101,109 @@ class HTMLSerializer:
         return s
 
     def render(self, node: Node, encoding: Any = None) -> str:
-        self.encoding = encoding
-        result = self.serialize_node(node)
+        parts: List[str] = []
+        self._write(node, parts.append)
+        result = "".join(parts)
         if encoding:
-            return result.encode(encoding, errors="htmlentityreplace")
+            return result.encode(encoding, errors=_ENCODE_ERRORS)
         return result
 
+    def render_to(self, node: Node, stream: IO, encoding: Any = None,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Serialize ``node`` into ``stream`` instead of returning a string.
+
+        Output is handed to ``stream.write`` in chunks of about ``chunk_size``
+        characters while the tree is walked, so memory stays bounded however
+        large the document is. Text streams receive ``str``; binary streams
+        receive bytes in ``encoding`` (UTF-8 by default).
+        """
+        binary = _is_binary_stream(stream, encoding)
+        if encoding and not binary:
+            raise ValueError("encoding is only valid for binary streams")
+        sink = _ChunkedSink(stream.write, (encoding or "utf-8") if binary else None, chunk_size)
+        self._write(node, sink.write)
+        sink.close()
+
     def serialize_node(self, node: Node) -> str:
         parts: List[str] = []
-        if node.node_type == NodeType.DOCUMENT_NODE:
-            for child in node.child_nodes:
-                parts.append(self.serialize_node(child))
-        elif node.node_type == NodeType.DOCUMENT_TYPE_NODE:
-            dt: DocumentType = node
-            public_id = dt.public_id.strip() if dt.public_id else ""
-            system_id = dt.system_id.strip() if dt.system_id else ""
-            if public_id or system_id:
-                parts.append(f'<!DOCTYPE {dt.name} PUBLIC "{public_id}" "{system_id}">')
-            else:
-                parts.append(f'<!DOCTYPE {dt.name}>')
-        elif node.node_type == NodeType.ELEMENT_NODE:
-            parts.append(self._serialize_element(node))
-        elif node.node_type == NodeType.TEXT_NODE:
-            parts.append(self._serialize_text(node))
-        elif node.node_type == NodeType.COMMENT_NODE:
-            parts.append(f"<!--{node.data}-->")
+        self._write_flat(node, parts.append)
         return "".join(parts)
 
-    def _serialize_element(self, elem: Element) -> str:
-        parts: List[str] = []
-        tag = self._get_tag(elem)
-        parts.append(f"<{tag}")
-        if getattr(elem, "is_value", None) is not None and "is" not in elem.get_attributes():
-            parts.append(f' is="{self._escape_attr(elem.is_value)}"')
+    def _write(self, node: Node, write: Callable[[str], Any]) -> None:
+        # Hook for render()/render_to(); subclasses replace the layout here.
+        self._write_flat(node, write)
+
+    def _write_flat(self, node: Node, write: Callable[[str], Any]) -> None:
+        # Iterative pre-order walk over the sibling links. The stack holds the
+        # next node to visit at each open level and the end tags still owed, so
+        # deep documents cost neither recursion nor per-element buffers.
+        stack: List[Any] = [node]
+        pop, push = stack.pop, stack.append
+        element, text = NodeType.ELEMENT_NODE, NodeType.TEXT_NODE
+        while stack:
+            item = pop()
+            if item.__class__ is str:
+                write(item)
+                continue
+            if item is not node:
+                nxt = item.next_sibling
+                if nxt is not None:
+                    push(nxt)
+            nt = item.node_type
+            if nt == element:
+                tag = self._get_tag(item)
+                write(self._start_tag(item, tag))
+                if tag in VOID_ELEMENTS:
+                    continue
+                push(f"</{tag}>")
+                if tag in rcdata_elements:
+                    push("".join(c.data if c.node_type == NodeType.TEXT_NODE else self.serialize_node(c)
+                                 for c in item.child_nodes))
+                else:
+                    first = item.first_child
+                    if first is not None:
+                        push(first)
+                if self._is_shadow_host(item):
+                    shadow = getattr(item, "shadowRoot", None)
+                    if shadow is not None:
+                        write(self._shadow_root_start(shadow))
+                        push("</template>")
+                        first = shadow.first_child
+                        if first is not None:
+                            push(first)
+            elif nt == text:
+                write(self._serialize_text(item))
+            elif nt == NodeType.DOCUMENT_NODE:
+                first = item.first_child
+                if first is not None:
+                    push(first)
+            elif nt == NodeType.DOCUMENT_TYPE_NODE:
+                write(self._serialize_doctype(item))
+            elif nt == NodeType.COMMENT_NODE:
+                write(f"<!--{item.data}-->")
+
+    def _serialize_doctype(self, dt: DocumentType) -> str:
+        public_id = dt.public_id.strip() if dt.public_id else ""
+        system_id = dt.system_id.strip() if dt.system_id else ""
+        if public_id or system_id:
+            return f'<!DOCTYPE {dt.name} PUBLIC "{public_id}" "{system_id}">'
+        return f'<!DOCTYPE {dt.name}>'
+
+    def _start_tag(self, elem: Element, tag: str) -> str:
+        parts: List[str] = [f"<{tag}"]
         attrs = elem.get_attributes()
-        attr_items = list(attrs.items())
-        if self.alphabetical_attributes:
-            attr_items.sort(key=lambda x: x[0])
-        for name, value in attr_items:
-            parts.append(" " + self._serialize_attribute(name, value, tag))
+        if getattr(elem, "is_value", None) is not None and "is" not in attrs:
+            parts.append(f' is="{self._escape_attr(elem.is_value)}"')
+        if attrs:
+            attr_items = list(attrs.items())
+            if self.alphabetical_attributes:
+                attr_items.sort(key=lambda x: x[0])
+            for name, value in attr_items:
+                parts.append(" " + self._serialize_attribute(name, value, tag))
         if tag in VOID_ELEMENTS and self.use_trailing_solidus:
             parts.append(" /" if self.space_before_trailing_solidus else "/")
         parts.append(">")
-        if tag in VOID_ELEMENTS:
-            return "".join(parts)
-        if self._is_shadow_host(elem):
-            shadow = getattr(elem, "shadowRoot", None)
-            if shadow is not None:
-                parts.append(self._serialize_shadow_root(shadow))
-        for child in elem.child_nodes:
-            if tag in rcdata_elements and child.node_type == NodeType.TEXT_NODE:
-                parts.append(child.data)
-            else:
-                parts.append(self.serialize_node(child))
-        parts.append(f"</{tag}>")
         return "".join(parts)
 
     def _serialize_attribute(self, name: str, value: str, element_tag: str) -> str:
@@ -215,7 +272,7 @@ class HTMLSerializer:
     def _is_shadow_host(self, elem: Element) -> bool:
         return hasattr(elem, "shadowRoot") and getattr(elem, "shadowRoot") is not None
 
-    def _serialize_shadow_root(self, shadow: ShadowRoot) -> str:
+    def _shadow_root_start(self, shadow: ShadowRoot) -> str:
         parts: List[str] = []
         parts.append('<template shadowrootmode="')
         mode = getattr(shadow, "mode", "open")
@@ -228,11 +285,62 @@ class HTMLSerializer:
         if getattr(shadow, "clonable", False):
             parts.append(' shadowrootclonable=""')
         parts.append(">")
+        return "".join(parts)
+
+    def _serialize_shadow_root(self, shadow: ShadowRoot) -> str:
+        parts: List[str] = [self._shadow_root_start(shadow)]
         for child in shadow.child_nodes:
-            parts.append(self.serialize_node(child))
+            self._write_flat(child, parts.append)
         parts.append("</template>")
         return "".join(parts)
 
+
+def _is_binary_stream(stream: IO, encoding: Any) -> bool:
+    if isinstance(stream, io.TextIOBase):
+        return False
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    mode = getattr(stream, "mode", None)
+    if isinstance(mode, str):
+        return "b" in mode
+    return bool(encoding)
+
+
+class _ChunkedSink:
+    """Buffers serializer output and forwards it to ``write`` in chunks."""
+
+    __slots__ = ("_write", "_encoder", "_parts", "_size", "_limit")
+
+    def __init__(self, write: Callable[[Any], Any], encoding: Any, limit: int) -> None:
+        self._write = write
+        # An incremental encoder keeps multi-chunk output free of repeated BOMs.
+        self._encoder = codecs.getincrementalencoder(encoding)(_ENCODE_ERRORS) if encoding else None
+        self._parts: List[str] = []
+        self._size = 0
+        self._limit = max(int(limit), 1)
+
+    def write(self, s: str) -> None:
+        self._parts.append(s)
+        self._size += len(s)
+        if self._size >= self._limit:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._parts:
+            return
+        data = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self._write(self._encoder.encode(data) if self._encoder is not None else data)
+
+    def close(self) -> None:
+        self.flush()
+        if self._encoder is not None:
+            tail = self._encoder.encode("", True)
+            if tail:
+                self._write(tail)
+
+
 class SerializeError(Exception):
     pass
 
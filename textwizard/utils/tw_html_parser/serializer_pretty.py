@@ -2,9 +2,9 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from __future__ import annotations
-from typing import Any, List, Dict
+from typing import Any, Callable, Dict, List
 
-from textwizard.utils.tw_html_parser.dom import DocumentType, Element, Node, NodeType, Text
+from textwizard.utils.tw_html_parser.dom import Element, Node, NodeType, Text
 from textwizard.utils.tw_html_parser.serializer import HTMLSerializer
 from textwizard.utils.tw_html_parser._utils import VOID_ELEMENTS, rcdata_elements
 
@@ -13,7 +13,8 @@ __all__ = ["PrettyHTMLSerializer"]
 
 class PrettyHTMLSerializer(HTMLSerializer):
     """
-    Pretty-printer on top of HTMLSerializer with a single output buffer.
+    Pretty-printer on top of HTMLSerializer; ``render`` and ``render_to`` come
+    from the base class and lay the tree out with indentation.
     """
 
     __slots__ = ("_indent", "expand_mixed_content", "expand_empty_elements", "_icache", "encoding")
@@ -32,16 +33,6 @@ class PrettyHTMLSerializer(HTMLSerializer):
         self.expand_empty_elements = bool(expand_empty_elements)
         self._icache: Dict[int, str] = {0: ""}
 
-    # ---------- public ----------
-    def render(self, node: Node, encoding: Any = None) -> str:  # type: ignore[override]
-        self.encoding = encoding
-        out_parts: List[str] = []
-        self._write_node(node, 0, out_parts)
-        out = "".join(out_parts)
-        if encoding:
-            return out.encode(encoding, errors="htmlentityreplace")
-        return out
-
     # ---------- internals ----------
     def _indent_str(self, depth: int) -> str:
         if self._indent <= 0:
@@ -52,110 +43,96 @@ class PrettyHTMLSerializer(HTMLSerializer):
             self._icache[depth] = s
         return s
 
-    def _write_node(self, node: Node, depth: int, out: List[str]) -> None:
-        nt = node.node_type
-
-        if nt == NodeType.DOCUMENT_NODE:
-            for ch in node.child_nodes:
-                self._write_node(ch, depth, out)
-            return
-
-        if nt == NodeType.DOCUMENT_TYPE_NODE:
-            dt: DocumentType = node
-            pub = dt.public_id.strip() if dt.public_id else ""
-            sys = dt.system_id.strip() if dt.system_id else ""
-            out.append(f'<!DOCTYPE {dt.name} PUBLIC "{pub}" "{sys}">' if (pub or sys) else f"<!DOCTYPE {dt.name}>")
-            return
-
-        if nt == NodeType.COMMENT_NODE:
-            out.append(f"<!--{node.data}-->")
-            return
-
-        if nt == NodeType.TEXT_NODE:
-            out.append(self._serialize_text(node))
-            return
-
-        # Element
-        elem: Element = node  # type: ignore[assignment]
-        tag = self._get_tag(elem)
-
-        out.append("<"); out.append(tag)
-
-        # preserve customized built-ins
-        is_val = getattr(elem, "is_value", None)
-        if is_val is not None and "is" not in elem.get_attributes():
-            out.append(' is="'); out.append(self._escape_attr(is_val)); out.append('"')
-
-        attrs = elem.get_attributes()
-        items = list(attrs.items())
-        if self.alphabetical_attributes:
-            items.sort(key=lambda kv: kv[0])
-        for name, value in items:
-            out.append(" "); out.append(self._serialize_attribute(name, value, tag))
-
-        if tag in VOID_ELEMENTS:
-            if self.use_trailing_solidus:
-                out.append(" /" if self.space_before_trailing_solidus else "/")
-            out.append(">")
-            return
-
-        out.append(">")
-
-        # flat if no indenting
-        if self._indent <= 0:
-            self._write_children_flat(elem, depth, out)
-            out.append("</"); out.append(tag); out.append(">")
-            return
-
-        # RCData stays flat
-        if tag in rcdata_elements:
-            self._write_children_flat(elem, depth, out)
-            out.append("</"); out.append(tag); out.append(">")
-            return
-
-        children = elem.child_nodes
-        if not children:
-            if self.expand_empty_elements:
-                out.append("\n"); out.append(self._indent_str(depth))
-            out.append("</"); out.append(tag); out.append(">")
-            return
-
-        # mixed content flat unless expansion requested
-        if (not self.expand_mixed_content) and self._has_mixed_content(elem):
-            self._write_children_flat(elem, depth, out)
-            out.append("</"); out.append(tag); out.append(">")
-            return
-
-        # pretty block
-        nl = "\n"
-        indent_child = self._indent_str(depth + 1)
-        indent_cur = self._indent_str(depth)
-
-        out.append(nl)
-        for ch in children:
-            out.append(indent_child)
-            self._write_node(ch, depth + 1, out)
-            out.append(nl)
-        out.append(indent_cur); out.append("</"); out.append(tag); out.append(">")
-
-    def _write_children_flat(self, elem: Element, depth: int, out: List[str]) -> None:
+    def _write(self, node: Node, write: Callable[[str], Any], depth: int = 0) -> None:
+        # Iterative like HTMLSerializer._write_flat. Stack entries are strings
+        # still owed or (node, depth, in_block) for the next node of a level;
+        # nodes inside a pretty block sit on their own indented line.
+        stack: List[Any] = [(node, depth, False)]
+        pop, push = stack.pop, stack.append
+        indent_str = self._indent_str
+        element, text = NodeType.ELEMENT_NODE, NodeType.TEXT_NODE
+        while stack:
+            item = pop()
+            if item.__class__ is str:
+                write(item)
+                continue
+            cur, depth, in_block = item
+            if cur is not node:
+                nxt = cur.next_sibling
+                if nxt is not None:
+                    push((nxt, depth, in_block))
+            if in_block:
+                write(indent_str(depth))
+                push("\n")
+
+            nt = cur.node_type
+            if nt == text:
+                write(self._serialize_text(cur))
+                continue
+            if nt == NodeType.DOCUMENT_NODE:
+                first = cur.first_child
+                if first is not None:
+                    push((first, depth, False))
+                continue
+            if nt == NodeType.DOCUMENT_TYPE_NODE:
+                write(self._serialize_doctype(cur))
+                continue
+            if nt == NodeType.COMMENT_NODE:
+                write(f"<!--{cur.data}-->")
+                continue
+            if nt != element:
+                continue
+
+            elem: Element = cur  # type: ignore[assignment]
+            tag = self._get_tag(elem)
+            write(self._start_tag(elem, tag))
+            if tag in VOID_ELEMENTS:
+                continue
+
+            # flat if no indenting; RCData stays flat
+            if self._indent <= 0 or tag in rcdata_elements:
+                self._push_children_flat(elem, tag, depth, write, push)
+                continue
+
+            first = elem.first_child
+            if first is None:
+                if self.expand_empty_elements:
+                    write("\n" + indent_str(depth))
+                write(f"</{tag}>")
+                continue
+
+            # mixed content flat unless expansion requested
+            if (not self.expand_mixed_content) and self._has_mixed_content(elem):
+                self._push_children_flat(elem, tag, depth, write, push)
+                continue
+
+            # pretty block
+            write("\n")
+            push(f"{indent_str(depth)}</{tag}>")
+            push((first, depth + 1, True))
+
+    def _push_children_flat(self, elem: Element, tag: str, depth: int, write: Callable[[str], Any],
+                            push: Callable[[Any], Any]) -> None:
         # shadow root first
         if self._is_shadow_host(elem):
             shadow = getattr(elem, "shadowRoot", None)
             if shadow is not None:
-                out.append(self._serialize_shadow_root(shadow))
+                write(self._serialize_shadow_root(shadow))
 
-        tag = self._get_tag(elem)
+        push(f"</{tag}>")
         if tag in rcdata_elements:
+            parts: List[str] = []
             for ch in elem.child_nodes:
                 if ch.node_type == NodeType.TEXT_NODE:
-                    out.append(ch.data)
+                    parts.append(ch.data)
                 else:
-                    self._write_node(ch, depth, out)
+                    self._write(ch, parts.append, depth)
+            push("".join(parts))
             return
 
-        for ch in elem.child_nodes:
-            self._write_node(ch, depth, out)
+        first = elem.first_child
+        if first is not None:
+            push((first, depth, False))
 
     @staticmethod
     def _has_mixed_content(elem: Element) -> bool:
@@ -2,13 +2,26 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from collections import deque
-from textwizard.utils.tw_html_parser.entities_wrapper import lookup_entity_value_py  # type: ignore
-from textwizard.utils.tw_html_parser._utils import ascii_letters, ascii_uppercase, space_characters, null_character ,entitiesWindows1252, namespaces,hex_digit
+from textwizard.utils.tw_html_parser.entities_wrapper import decode_character_references  # type: ignore
+from textwizard.utils.tw_html_parser._utils import ascii_letters, ascii_uppercase, space_characters, null_character , namespaces
 from textwizard.utils.tw_html_parser.error import  ParseError
-from textwizard.utils.tw_html_parser.tokens import Token, Attribute ,CHARACTER, START_TAG, END_TAG, COMMENT, DOCTYPE, EOF
+from textwizard.utils.tw_html_parser.tokens import (Token, Attribute, CharacterToken, TagToken, StartTagToken, EndTagToken, CommentToken,
+                                                    DoctypeToken, EOFToken, CHARACTER, START_TAG, END_TAG, COMMENT, DOCTYPE,
+                                                    EOF, NEED_DATA)
+from sys import intern
 from typing import Optional
+import os
 import re
 
+# Optional compiled DFA driver (_tokenizer_speedups.pyx). Without it, or with
+# TW_HTML_PURE_PYTHON=1, the pure-Python loop below is used.
+try:
+    if os.environ.get("TW_HTML_PURE_PYTHON"):
+        raise ImportError
+    from textwizard.utils.tw_html_parser._tokenizer_speedups import tokenize as _tokenize_c  # type: ignore
+except ImportError:
+    _tokenize_c = None
+
 
 class TokenizerState:
     DATA_STATE = 0
@@ -88,15 +101,23 @@ EOF_INDEX = ALPHABET_SIZE + 1
 NUM_INDICES = ALPHABET_SIZE + 2
 
 NUM_STATES = 68
-MIN_LEN_ENTITY = 2
-MAX_LEN_ENTITY = 32
+
+# Characters kept unread at the end of an incremental (feed) buffer until
+# more input or close() arrives, so that lookahead (named character references,
+# "DOCTYPE", "[CDATA[", "]]>") never sees a chunk boundary as end of input.
+# A character reference still open at the end of the buffer is held back
+# whole, since numeric ones have no length limit.
+FEED_LOOKAHEAD = 64
 
 
 
-_raw_chars_regex = re.compile(r'[^<&\x00]+')
+_text_run_regex = re.compile(r'[^<\x00]+')
+_double_quoted_value_regex = re.compile(r'[^"\x00]+')
+_single_quoted_value_regex = re.compile(r"[^'\x00]+")
 _read_tag_name_regex = re.compile(r'[^' + re.escape(''.join(sorted(space_characters | {'/', '>'})) + '\x00') + r']+')
 _chars_until_lt = re.compile(r'[^<&\x00]+')
 _chars_no_stop = re.compile(r'[^\x00]+')
+_char_ref_run = re.compile(r'[#0-9A-Za-z]*')
 
 SETUP_REGISTRY = []
 _CHAR_TO_INDEX_CACHE = {chr(i): i for i in range(ALPHABET_SIZE)}
@@ -117,7 +138,8 @@ class TWHTMLTokenizer:
         "appropriate_end_tag_name", "check_action_transition",
         "_reconsume_current_input", "drop_duplicate_attributes",
         "next_state", "actions", "eof_action","emit_character","emit_token",
-        "emit_token_oef", "reconsume_in_state","log_error"
+        "emit_token_oef", "reconsume_in_state","log_error",
+        "closed", "offset", "_pending_cr", "_char_chunks", "_char_space"
     )
 
 
@@ -141,13 +163,24 @@ class TWHTMLTokenizer:
             cls._actions_table = actions
             cls._dfa_built = True
 
-    def __init__(self, text, parser=None, initial_state=TokenizerState.DATA_STATE, position=0, drop_duplicate_attributes=False):
+    def __init__(self, text, parser=None, initial_state=TokenizerState.DATA_STATE, position=0, drop_duplicate_attributes=False,
+                 incremental=False):
         self.text = self.sanitize_input(text)
         self.parser = parser
         self.length = len(self.text)
         self.position = position
+        self.closed = True
+        self.offset = 0
+        self._pending_cr = False
+        if incremental:
+            self.closed = False
+            self.text = ""
+            self.length = 0
+            self.feed(text)
         self.state = initial_state
         self.tokens = deque()
+        self._char_chunks = []
+        self._char_space = True
         self.temp_buffer = []
         self.current_token = None
         self.errors = deque()
@@ -168,7 +201,42 @@ class TWHTMLTokenizer:
         self.reconsume_in_state = self._reconsume_in_state
         self.log_error = self._log_error
 
+    def feed(self, data: str) -> None:
+        """Append a chunk of input to an incremental tokenizer.
+
+        A CR at the end of a chunk is normalized together with an LF at the
+        start of the next one, so ``"\\r" + "\\n"`` still gives a single newline.
+        Chunks must be ``str``: decode bytes before feeding them.
+        """
+        if not isinstance(data, str):
+            raise TypeError(f"feed() expects str, got {type(data).__name__}; decode bytes before feeding them")
+        if self.closed:
+            raise ValueError("feed() called on a closed tokenizer")
+        if not data:
+            return
+        if self._pending_cr and data[0] == '\n':
+            data = data[1:]
+        self._pending_cr = data.endswith('\r')
+        pos = self.position
+        self.text = self.text[pos:] + self.sanitize_input(data)
+        self.offset += pos
+        self.position = 0
+        self.length = max(len(self.text) - FEED_LOOKAHEAD, 0)
+        amp = self.text.rfind('&')
+        if 0 <= amp < self.length and _char_ref_run.fullmatch(self.text, amp + 1):
+            self.length = amp
+
+    def close(self) -> None:
+        """Mark the end of input: the buffered tail is tokenized up to EOF."""
+        self.closed = True
+        self.length = len(self.text)
+
     def tokenize(self):
+        if _tokenize_c is not None:
+            return _tokenize_c(self)
+        return self._tokenize_py()
+
+    def _tokenize_py(self):
         text = self.text
         length = self.length
         char_cache = _CHAR_TO_INDEX_CACHE
@@ -181,6 +249,12 @@ class TWHTMLTokenizer:
             if pos < length:
                 current_char = text[pos]
                 code = char_cache.get(current_char, EXTENDED_INDEX)
+            elif not self.closed:
+                yield NEED_DATA
+                text = self.text
+                length = self.length
+                pos = self.position
+                continue
             else:
                 current_char = None
                 code = EOF_INDEX
@@ -211,7 +285,7 @@ class TWHTMLTokenizer:
             self.state = state
             self.position = pos
 
-        self.emit_token_oef(Token(type=EOF))
+        self.emit_token_oef(EOFToken())
         while self.tokens:
             yield self.tokens.popleft()
 
@@ -240,6 +314,7 @@ class TWHTMLTokenizer:
             raise ValueError("Invalid error code passed. Must be an instance of ParseError.")
         if position is None:
             position = self.position
+        position += self.offset
         self.errors.append(f"[Error at position {position}] {error_code.code()}: {error_code.description()}")
 
     @staticmethod
@@ -247,38 +322,45 @@ class TWHTMLTokenizer:
         tokenizer.emit_token(tokenizer.current_token)
 
     def _emit_token(self, token: Token):
+        if self._char_chunks:
+            self.flush_characters()
+        if isinstance(token, TagToken):
+            # Interned names make the tree builder's dispatch and tag-set lookups pointer compares.
+            token.name = intern(token.name)
         self.tokens.append(token)
 
     def _emit_character(self, char,is_space=False):
-        token = Token(
-            type=CHARACTER,
-            data=char,
-            space_character=is_space,
-            null_character=char in null_character
-        )
-        self.tokens.append(token)
+        # Character data is buffered and emitted as one token when the next
+        # non-character token (or EOF) is emitted. NULL/U+FFFD stay separate
+        # tokens because the tree builder handles them on their own.
+        if char in null_character:
+            if self._char_chunks:
+                self.flush_characters()
+            self.tokens.append(CharacterToken(char, space_character=is_space, null_character=True))
+            return
+        if not char:
+            return
+        chunks = self._char_chunks
+        self._char_space = (self._char_space or not chunks) and is_space
+        chunks.append(char)
+
+    def flush_characters(self):
+        chunks = self._char_chunks
+        if not chunks:
+            return
+        data = chunks[0] if len(chunks) == 1 else ''.join(chunks)
+        chunks.clear()
+        self.tokens.append(CharacterToken(data, space_character=self._char_space))
 
     def _emit_token_oef(self, token: Token):
+        if self._char_chunks:
+            self.flush_characters()
         self.tokens.append(token)
 
     @staticmethod
     def emit_and_reset_buffer(tokenizer, ch):
         if tokenizer.temp_buffer:
-            if tokenizer.temp_buffer:
-                text = ''.join(tokenizer.temp_buffer)
-                if text:
-                    if (tokenizer.current_token and
-                            tokenizer.current_token.type == CHARACTER):
-                        tokenizer.current_token.data += text
-                        tokenizer.temp_buffer = []
-                    elif (tokenizer.tokens and
-                          tokenizer.tokens[-1].type == CHARACTER):
-                        tokenizer.tokens[-1].data += text
-                        tokenizer.temp_buffer = []
-                    else:
-                        tokenizer.emit_character(text)
-
-                tokenizer.temp_buffer = []
+            tokenizer.emit_character(''.join(tokenizer.temp_buffer))
         tokenizer.temp_buffer = []
 
     @staticmethod
@@ -310,34 +392,30 @@ class TWHTMLTokenizer:
         length = tokenizer.length
         text = tokenizer.text
         buf = tokenizer.temp_buffer
-        pattern = _raw_chars_regex
+        pattern = _text_run_regex
 
         while pos < length:
-            m = pattern.match(text, pos)
+            m = pattern.match(text, pos, length)
             if m is not None:
-                block = m.group()
-                buf.append(block)
-                pos = m.end()
+                # Character references in the run are resolved in one C pass.
+                decoded, pos, errors = decode_character_references(text, pos, m.end())
+                buf.append(decoded)
+                if errors:
+                    tokenizer.log_reference_errors(errors)
             if pos >= length:
                 break
             c = text[pos]
             if c == '<':
-                pos -= 1
                 break
-            elif c == '&':
-                tokenizer.position = pos
-                tokenizer.handle_character_reference(tokenizer, c)
-                pos = tokenizer.position + 1
-                continue
             elif c == '\x00':
-                tokenizer.log_error(ParseError.UNEXPECTED_NULL_CHARACTER)
+                tokenizer.log_error(ParseError.UNEXPECTED_NULL_CHARACTER, position=pos)
                 buf.append("\uFFFD")
                 pos += 1
             else:
                 buf.append(c)
                 pos += 1
 
-        tokenizer.position = pos
+        tokenizer.position = pos - 1
         if buf:
             token_text = ''.join(buf)
             is_space = all(ch in space_characters for ch in token_text)
@@ -354,7 +432,7 @@ class TWHTMLTokenizer:
         regex = stop
 
         while pos < length:
-            m = regex.match(text, pos)
+            m = regex.match(text, pos, length)
             if m is not None:
                 block = m.group()
                 buf.append(block)
@@ -363,7 +441,6 @@ class TWHTMLTokenizer:
                 break
             c = text[pos]
             if c == '<':
-                pos -= 1
                 break
             elif c == '\x00':
                 tokenizer.log_error(ParseError.UNEXPECTED_NULL_CHARACTER)
@@ -373,7 +450,7 @@ class TWHTMLTokenizer:
                 buf.append(c)
                 pos += 1
 
-        tokenizer.position = pos
+        tokenizer.position = pos - 1
         if buf:
             token_text = ''.join(buf)
             is_space = all(ch in space_characters for ch in token_text)
@@ -381,6 +458,19 @@ class TWHTMLTokenizer:
             buf.clear()
 
 
+    @staticmethod
+    def read_attribute_value_in_blocks(tokenizer, pattern):
+        pos = tokenizer.position
+        m = pattern.match(tokenizer.text, pos, tokenizer.length)
+        if m is None:
+            return
+        decoded, end, errors = decode_character_references(tokenizer.text, pos, m.end(), True)
+        if errors:
+            tokenizer.log_reference_errors(errors)
+        if tokenizer.current_token and tokenizer.current_token.attributes:
+            tokenizer.current_token.attributes[-1].value += decoded
+        tokenizer.position = end - 1
+
     @staticmethod
     def read_chars_until_lt(tokenizer, ch):
         return tokenizer.read_characters_in_blocks(tokenizer, ch, _chars_until_lt)
@@ -474,7 +564,7 @@ class TWHTMLTokenizer:
             is_valid = False
 
         if is_valid:
-            tokenizer.current_token = Token(type=END_TAG, name=tokenizer.get_buffer())
+            tokenizer.current_token = EndTagToken(tokenizer.get_buffer())
             if emit:
                 tokenizer.emit_current_token(tokenizer, ch)
             tokenizer.reset_buffer(tokenizer, ch)
@@ -540,7 +630,7 @@ class TWHTMLTokenizer:
     @staticmethod
     def handle_eof_in_doctype_state(tokenizer, ch):
         tokenizer.log_error(ParseError.EOF_IN_DOCTYPE)
-        doctype_token = Token(type=DOCTYPE, quirks_mode=True)
+        doctype_token = DoctypeToken(quirks_mode=True)
         tokenizer.emit_token(doctype_token)
 
     @staticmethod
@@ -553,7 +643,7 @@ class TWHTMLTokenizer:
     @staticmethod
     def handle_eof_in_bogus(tokenizer, ch):
         if not tokenizer.current_token:
-            doctype_token = Token(type=DOCTYPE, quirks_mode=True)
+            doctype_token = DoctypeToken(quirks_mode=True)
             tokenizer.emit_token(doctype_token)
         else:
             tokenizer.emit_current_token(tokenizer, ch)
@@ -601,12 +691,17 @@ class TWHTMLTokenizer:
     def setup_tag_open_state(self):
 
         def handle_start_tag(tokenizer, ch):
-            tokenizer.current_token = Token(type=START_TAG, name='', attributes=[])
+            tokenizer.current_token = StartTagToken()
             tokenizer.reconsume_in_state(TokenizerState.TAG_NAME_STATE)
 
+        def handle_markup_declaration_open(tokenizer, ch):
+            # "<!" may open a CDATA section, whose handling depends on the tree
+            # builder's current node: deliver the pending text to it first.
+            tokenizer.flush_characters()
+
         def handle_unexpected_question_mark(tokenizer, ch):
             tokenizer.log_error(ParseError.UNEXPECTED_QUESTION_MARK_INSTEAD_OF_TAG_NAME)
-            tokenizer.current_token = Token(type=COMMENT, data="")
+            tokenizer.current_token = CommentToken()
             tokenizer.reconsume_in_state(TokenizerState.BOGUS_COMMENT_STATE)
 
         def handle_invalid_tag_open(tokenizer, ch):
@@ -614,7 +709,7 @@ class TWHTMLTokenizer:
             tokenizer.append_to_buffer("<")
             tokenizer.reconsume_in_state(TokenizerState.DATA_STATE)
 
-        self.set_transition(TokenizerState.TAG_OPEN_STATE, '!', TokenizerState.MARKUP_DECLARATION_OPEN_STATE)
+        self.set_transition(TokenizerState.TAG_OPEN_STATE, '!', TokenizerState.MARKUP_DECLARATION_OPEN_STATE, action=handle_markup_declaration_open)
         self.set_transition(TokenizerState.TAG_OPEN_STATE, '/', TokenizerState.END_TAG_OPEN_STATE)
 
         for char in ascii_letters:
@@ -628,7 +723,7 @@ class TWHTMLTokenizer:
     def setup_end_tag_open_state(self):
 
         def handle_end_tag_name_start(tokenizer, ch):
-            tokenizer.current_token = Token(type=END_TAG, name='', attributes=[])
+            tokenizer.current_token = EndTagToken()
             tokenizer.reconsume_in_state(TokenizerState.TAG_NAME_STATE)
 
         def handle_unexpected_greater_than(tokenizer, ch):
@@ -636,7 +731,7 @@ class TWHTMLTokenizer:
 
         def handle_invalid_end_tag(tokenizer, ch):
             tokenizer.log_error(ParseError.INVALID_FIRST_CHARACTER_OF_TAG_NAME)
-            tokenizer.current_token = Token(type=COMMENT, name='', attributes=[])
+            tokenizer.current_token = CommentToken()
             tokenizer.reconsume_in_state(TokenizerState.BOGUS_COMMENT_STATE)
 
         for char in ascii_letters:
@@ -657,7 +752,7 @@ class TWHTMLTokenizer:
             stops = space_characters | {'/', '>'}
 
             while pos < length:
-                m = _read_tag_name_regex.match(text, pos)
+                m = _read_tag_name_regex.match(text, pos, length)
                 if m:
                     part = m.group()
                     buf.append(part)
@@ -665,7 +760,6 @@ class TWHTMLTokenizer:
                     if pos < length:
                         c = text[pos]
                         if c in stops:
-                            pos -= 1
                             break
                         elif c == '\x00':
                             buf.append("\uFFFD")
@@ -675,7 +769,6 @@ class TWHTMLTokenizer:
                 else:
                     c = text[pos]
                     if c in stops:
-                        pos -= 1
                         break
                     elif c == '\x00':
                         buf.append("\uFFFD")
@@ -683,7 +776,7 @@ class TWHTMLTokenizer:
                         buf.append(c)
                     pos += 1
 
-            tokenizer.position = pos
+            tokenizer.position = pos - 1
             tokenizer.current_token.name += "".join(buf)
 
 
@@ -802,7 +895,7 @@ class TWHTMLTokenizer:
     @register_setup(priority=15)
     def setup_script_data_end_tag_open_state(self):
         def handle_alpha(tokenizer, ch):
-            tokenizer.current_token = Token(type=END_TAG, name='', attributes=[])
+            tokenizer.current_token = EndTagToken()
             tokenizer.reconsume_in_state(TokenizerState.SCRIPT_DATA_END_TAG_NAME_STATE)
 
         def handle_default(tokenizer, ch):
@@ -1135,44 +1228,36 @@ class TWHTMLTokenizer:
     @register_setup(priority=35)
     def setup_attribute_value_double_quoted_state(self):
 
-        def handle_ampersand_in_double_quote(tokenizer, ch):
-            tokenizer.handle_character_reference(tokenizer, ch, from_attribute=True)
+        def read_double_quoted_value(tokenizer, ch):
+            tokenizer.read_attribute_value_in_blocks(tokenizer, _double_quoted_value_regex)
 
         def handle_null_in_double_quote(tokenizer, ch):
             tokenizer.log_error(ParseError.UNEXPECTED_NULL_CHARACTER)
             if tokenizer.current_token and tokenizer.current_token.attributes:
                 tokenizer.current_token.attributes[-1].value += '\uFFFD'
 
-        def handle_append_char_to_value(tokenizer, ch):
-            if tokenizer.current_token and tokenizer.current_token.attributes:
-                tokenizer.current_token.attributes[-1].value += ch
-
         self.set_transition(TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE, '"',TokenizerState.AFTER_ATTRIBUTE_VALUE_STATE)
-        self.set_transition(TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE, '&',TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE,handle_ampersand_in_double_quote)
+        self.set_transition(TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE, '&',TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE,read_double_quoted_value)
         self.set_transition(TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE, '\x00',TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE,handle_null_in_double_quote)
-        self.set_default_transition(TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE,TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE,handle_append_char_to_value)
+        self.set_default_transition(TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE,TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE,read_double_quoted_value)
         self.set_transition(TokenizerState.ATTRIBUTE_VALUE_DOUBLE_QUOTED_STATE, EOF_STATE, action=TWHTMLTokenizer.handle_eof_in_tag)
 
     @register_setup(priority=36)
     def setup_attribute_value_single_quoted_state(self):
 
-        def handle_ampersand_in_single_quote(tokenizer, ch):
-            tokenizer.handle_character_reference(tokenizer, ch, from_attribute=True)
+        def read_single_quoted_value(tokenizer, ch):
+            tokenizer.read_attribute_value_in_blocks(tokenizer, _single_quoted_value_regex)
 
         def handle_null_in_single_quote(tokenizer, ch):
             tokenizer.log_error(ParseError.UNEXPECTED_NULL_CHARACTER)
             if tokenizer.current_token and tokenizer.current_token.attributes:
                 tokenizer.current_token.attributes[-1].value += '\uFFFD'
 
-        def handle_append_char(tokenizer, ch):
-            if tokenizer.current_token and tokenizer.current_token.attributes:
-                tokenizer.current_token.attributes[-1].value += ch
-
         self.set_transition(TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE, "'", TokenizerState.AFTER_ATTRIBUTE_VALUE_STATE)
-        self.set_transition(TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE, '&',TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE,handle_ampersand_in_single_quote)
+        self.set_transition(TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE, '&',TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE,read_single_quoted_value)
         self.set_transition(TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE, '\x00',TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE, handle_null_in_single_quote)
 
-        self.set_default_transition(TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE,TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE, handle_append_char)
+        self.set_default_transition(TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE,TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE, read_single_quoted_value)
         self.set_transition(TokenizerState.ATTRIBUTE_VALUE_SINGLE_QUOTED_STATE, EOF_STATE, action=TWHTMLTokenizer.handle_eof_in_tag)
 
     @register_setup(priority=37)
@@ -1264,13 +1349,13 @@ class TWHTMLTokenizer:
 
         def handle_anything_else_markup_declaration_open_state(tokenizer, ch):
             tokenizer.log_error(ParseError.INCORRECTLY_OPENED_COMMENT)
-            tokenizer.current_token = Token(type=COMMENT, data='')
+            tokenizer.current_token = CommentToken()
             tokenizer.reconsume_in_state(TokenizerState.BOGUS_COMMENT_STATE)
 
         def handle_markup_declaration_dash(tokenizer, ch):
-            if tokenizer.position + 1 < tokenizer.length and tokenizer.text[tokenizer.position + 1] == '-':
+            if tokenizer.position + 1 < len(tokenizer.text) and tokenizer.text[tokenizer.position + 1] == '-':
                 tokenizer.position += 1  # Consuma il secondo '-'
-                tokenizer.current_token = Token(type=COMMENT, data="")
+                tokenizer.current_token = CommentToken()
                 tokenizer.state = TokenizerState.COMMENT_START_STATE
             else:
                 handle_anything_else_markup_declaration_open_state(tokenizer, ch)
@@ -1279,13 +1364,12 @@ class TWHTMLTokenizer:
         def handle_start_doctype(tokenizer, ch):
             expected = "DOCTYPE"
             end_pos = tokenizer.position + len(expected)
-            if end_pos <= tokenizer.length and tokenizer.text[tokenizer.position:end_pos].upper() == expected:
+            if end_pos <= len(tokenizer.text) and tokenizer.text[tokenizer.position:end_pos].upper() == expected:
                 tokenizer.position += len(expected) - 1
-                tokenizer.current_token = Token(type=DOCTYPE,
-                                                name='',
-                                                public_id=None,
-                                                system_id=None,
-                                                quirks_mode=False)
+                tokenizer.current_token = DoctypeToken(name='',
+                                                       public_id=None,
+                                                       system_id=None,
+                                                       quirks_mode=False)
 
                 tokenizer.state = TokenizerState.DOCTYPE_STATE
             else:
@@ -1300,7 +1384,7 @@ class TWHTMLTokenizer:
                 tokenizer.state = TokenizerState.CDATA_SECTION_STATE
             else:
                 tokenizer.log_error(ParseError.CDATA_IN_HTML_CONTENT)
-                tokenizer.current_token = Token(COMMENT, data=expected)
+                tokenizer.current_token = CommentToken(expected)
                 tokenizer.state = TokenizerState.BOGUS_COMMENT_STATE
 
             tokenizer.position += len(expected) - 1
@@ -1466,32 +1550,29 @@ class TWHTMLTokenizer:
     def setup_before_doctype_name_state(self):
 
         def handle_upper_alpha_doctype_name(tokenizer, ch):
-            tokenizer.current_token = Token(type=DOCTYPE,
-                                            name=ch.lower(),
-                                            public_id=None,
-                                            system_id=None,
-                                            quirks_mode=False)
+            tokenizer.current_token = DoctypeToken(name=ch.lower(),
+                                                   public_id=None,
+                                                   system_id=None,
+                                                   quirks_mode=False)
 
         def handle_null_in_before_name(tokenizer, ch):
             tokenizer.log_error(ParseError.UNEXPECTED_NULL_CHARACTER)
-            tokenizer.current_token = Token(type=DOCTYPE,
-                                            name='\uFFFD',
-                                            public_id=None,
-                                            system_id=None,
-                                            quirks_mode=False)
+            tokenizer.current_token = DoctypeToken(name='\uFFFD',
+                                                   public_id=None,
+                                                   system_id=None,
+                                                   quirks_mode=False)
 
         def handle_gt_missing_name(tokenizer, ch):
             tokenizer.log_error(ParseError.MISSING_DOCTYPE_NAME)
-            doctype = Token(type=DOCTYPE, quirks_mode=True,
-                            name=None, public_id=None, system_id=None)
+            doctype = DoctypeToken(quirks_mode=True,
+                                   name=None, public_id=None, system_id=None)
             tokenizer.emit_token(doctype)
 
         def handle_default_in_before_name(tokenizer, ch):
-            tokenizer.current_token = Token(type=DOCTYPE,
-                                            name=ch,
-                                            public_id=None,
-                                            system_id=None,
-                                            quirks_mode=False)
+            tokenizer.current_token = DoctypeToken(name=ch,
+                                                   public_id=None,
+                                                   system_id=None,
+                                                   quirks_mode=False)
         for sp in space_characters:
             self.set_transition(TokenizerState.BEFORE_DOCTYPE_NAME_STATE, sp, TokenizerState.BEFORE_DOCTYPE_NAME_STATE)
 
@@ -1536,7 +1617,7 @@ class TWHTMLTokenizer:
 
         def handle_start_keyword(tokenizer, ch, expected, next_state):
             end_pos = tokenizer.position + len(expected)
-            if end_pos <= tokenizer.length and tokenizer.text[tokenizer.position:end_pos].upper() == expected:
+            if end_pos <= len(tokenizer.text) and tokenizer.text[tokenizer.position:end_pos].upper() == expected:
                 tokenizer.position += len(expected) - 1
                 tokenizer.state = next_state
             else:
@@ -1838,8 +1919,9 @@ class TWHTMLTokenizer:
 
             while pos < length:
                 if text[pos] == ']':
-                    if pos + 2 < length and text[pos:pos + 3] == "]]>":
+                    if text.startswith("]]>", pos):
                         pos += 3
+                        tokenizer.state = TokenizerState.DATA_STATE
                         break
                     else:
                         data_parts.append(']')
@@ -1851,6 +1933,10 @@ class TWHTMLTokenizer:
                 else:
                     data_parts.append(text[pos])
                 pos += 1
+            else:
+                # Ran out of input: stay in the CDATA section unless it is the real end.
+                if tokenizer.closed:
+                    tokenizer.state = TokenizerState.DATA_STATE
 
             tokenizer.position = pos
             if data_parts:
@@ -1858,326 +1944,22 @@ class TWHTMLTokenizer:
                 tokenizer.append_to_buffer(token_text)
             tokenizer.read_raw_characters_in_blocks(tokenizer, ch)
 
-        self.set_default_transition(TokenizerState.CDATA_SECTION_STATE,TokenizerState.DATA_STATE, default_action=read_cdata)
+        self.set_default_transition(TokenizerState.CDATA_SECTION_STATE,TokenizerState.CDATA_SECTION_STATE, default_action=read_cdata)
         self.set_transition(TokenizerState.CDATA_SECTION_STATE,EOF_STATE, action=TWHTMLTokenizer.handle_eof_in_cdata)
 
     @staticmethod
     def handle_character_reference(tokenizer, ch, from_attribute=False):
-        pos = tokenizer.position+1
-        length = tokenizer.length
-        temp_buf = []
-        char_ref_code = 0
-
-        class SubState:
-            CHAR_REF = "CHAR_REF"
-            NAMED_CHAR_REF = "NAMED_CHAR_REF"
-            NUMERIC_CHAR_REF = "NUMERIC_CHAR_REF"
-            HEX_CHAR_REF_START = "HEX_CHAR_REF_START"
-            DEC_CHAR_REF_START = "DEC_CHAR_REF_START"
-            HEX_CHAR_REF = "HEX_CHAR_REF"
-            DEC_CHAR_REF = "DEC_CHAR_REF"
-            NUMERIC_CHAR_REF_END = "NUMERIC_CHAR_REF_END"
-            DONE = "DONE"
-
-        sub_state = SubState.CHAR_REF
-        ch=''
-        name_buf = []
-
-        def is_ascii_alnum(ch):
-            return ch.isalnum() and ch.isascii()
-
-        def flush_temp_buf():
-            nonlocal temp_buf
-            flush_str = ''.join(temp_buf)
-            if from_attribute:
-                if tokenizer.current_token and tokenizer.current_token.attributes:
-                    tokenizer.current_token.attributes[-1].value += flush_str
-
-            else:
-                tokenizer.append_to_buffer(flush_str)
-            temp_buf = []
-
-        def next_char():
-            nonlocal pos
-            if pos < length:
-                ch = tokenizer.text[pos]
-                pos += 1
-                return ch
-            return None  # EOF_STATE sentinel
-
-        def next_char_check(pos):
-            if pos < length:
-                ch = tokenizer.text[pos+1]
-                return ch
-            return None
-
-        def reconsume(x=1):
-            nonlocal pos
-            pos = max(0, pos - x)
-
-        def set_position(new_pos):
-            nonlocal pos
-            pos = new_pos
-
-        while sub_state != SubState.DONE:
-            if sub_state == SubState.CHAR_REF:
-
-                ch = next_char()
-                if ch is None:
-                    temp_buf.append("&")
-                    flush_temp_buf()
-                    sub_state = SubState.DONE
-                    break
-
-                if not temp_buf:
-                    temp_buf.append("&")
-
-                if ch.isalnum():
-                    reconsume()
-                    sub_state = SubState.NAMED_CHAR_REF
-
-                elif ch == '#':
-                    temp_buf.append("#")
-                    sub_state = SubState.NUMERIC_CHAR_REF
-
-                else:
-                    flush_temp_buf()
-                    reconsume(2)
-                    sub_state = SubState.DONE
-
-
-            elif sub_state == SubState.NAMED_CHAR_REF:
-                """
-                Named character reference state.
-                """
-                name_buf.clear()
-                semicolon_found = False
-                start_pos=pos
-                best_cand=''
-
-
-                for i in range(MAX_LEN_ENTITY):
-                    c = next_char()
-                    if c is None:
-                        break
-                    if is_ascii_alnum(c):
-                        name_buf.append(c)
-                    elif c == ';':
-                        name_buf.append(c)
-                        break
-                    else:
-                        reconsume()
-                        break
-
-                n = len(name_buf)
-                if n < MIN_LEN_ENTITY:
-                    if name_buf:
-                        temp_buf.append("".join(name_buf))
-
-                    set_position(start_pos + len(name_buf) - 1)
-                    flush_temp_buf()
-                    sub_state = SubState.DONE
-                    continue
-
-                if 26 <= n <= 31:
-                    n = 25
-
-                best_value = None
-
-                for cand_len in range(n, MIN_LEN_ENTITY - 1, -1):
-                    lookup_key = "".join(name_buf[:cand_len])
-                    val = lookup_entity_value_py(lookup_key)
-                    if val is not None:
-                        best_value = val
-                        best_cand=lookup_key
-                        break
-
-                if best_value is None:
-                    temp_buf.append("".join(name_buf))
-                    set_position(start_pos + len(name_buf) - 1)
-                    flush_temp_buf()
-                    sub_state = SubState.DONE
-                    continue
-
-
-                if best_value.endswith('\\'):
-                    best_value += '\\'
-                entity_value = best_value.encode("utf-8").decode("unicode-escape")
-
-                if best_cand[-1]==";":
-                    semicolon_found=True
-
-                if from_attribute and not semicolon_found:
-                    next_ch_check = next_char_check((start_pos + len(best_cand) -1))
-                    if entity_value and not (next_ch_check == "=" or is_ascii_alnum(next_ch_check)):
-                        temp_buf.clear()
-                        temp_buf.append(entity_value)
-                    else:
-                        temp_buf.append("".join(name_buf))
-
-                    set_position(start_pos + len(name_buf) - 1)
-
-                    flush_temp_buf()
-                    sub_state = SubState.DONE
-                    if not semicolon_found:
-                        tokenizer.log_error(ParseError.MISSING_SEMICOLON_AFTER_CHARACTER_REFERENCE, position=pos)
-                    continue
-
-                temp_buf.clear()
-                temp_buf.append(entity_value)
-                flush_temp_buf()
-
-                if not semicolon_found:
-                    tokenizer.log_error(ParseError.MISSING_SEMICOLON_AFTER_CHARACTER_REFERENCE, position=pos)
-
-                set_position(start_pos+len(best_cand)-1)
-                sub_state = SubState.DONE
-
-            elif sub_state == SubState.NUMERIC_CHAR_REF:
-                """
-                Numeric character reference state
-                """
-                char_ref_code = 0
-                ch = next_char()
-                if ch in ('x', 'X'):
-                    temp_buf.append(ch)
-                    sub_state = SubState.HEX_CHAR_REF_START
-                else:
-                    reconsume()
-                    sub_state = SubState.DEC_CHAR_REF_START
-
-            elif sub_state == SubState.HEX_CHAR_REF_START:
-                """
-                Hexadecimal character reference start state
-                """
-
-                ch = next_char()
-                if ch is None:
-                    flush_temp_buf()
-                    sub_state = SubState.DONE
-                elif ch and ch in hex_digit:
-                    reconsume()
-                    sub_state = SubState.HEX_CHAR_REF
-                else:
-                    tokenizer.log_error(ParseError.ABSENCE_OF_DIGITS_IN_NUMERIC_CHARACTER_REFERENCE, position=pos)
-                    flush_temp_buf()
-                    reconsume(2)
-                    sub_state = SubState.DONE
-
-            elif sub_state == SubState.DEC_CHAR_REF_START:
-                """
-                Decimal character reference start state
-                """
-                ch = next_char()
-                if ch is None:
-                    flush_temp_buf()
-                    sub_state = SubState.DONE
-                elif ch.isdigit():
-                    reconsume()
-                    sub_state = SubState.DEC_CHAR_REF
-                else:
-                    tokenizer.log_error(ParseError.ABSENCE_OF_DIGITS_IN_NUMERIC_CHARACTER_REFERENCE, position=pos)
-                    if ch != "#":
-                        temp_buf.append(ch)
-                    flush_temp_buf()
-                    reconsume()
-                    sub_state = SubState.DONE
-
-            elif sub_state == SubState.HEX_CHAR_REF:
-                """
-                Hexadecimal character reference state
-                """
-                ch = next_char()
-                if ch is None:
-                    sub_state = SubState.NUMERIC_CHAR_REF_END
-                elif ch in hex_digit:
-                    if ch.isdigit():
-                        val = ord(ch) - ord('0')
-                    elif 'a' <= ch <= 'f':
-                        val = ord(ch) - ord('a') + 10
-                    else:
-                        val = ord(ch) - ord('A') + 10
-                    char_ref_code = (char_ref_code * 16) + val
-                elif ch == ';':
-                    sub_state = SubState.NUMERIC_CHAR_REF_END
-                else:
-                    sub_state = SubState.NUMERIC_CHAR_REF_END
-
-            elif sub_state == SubState.DEC_CHAR_REF:
-                """
-                Decimal character reference state
-                """
-                ch = next_char()
-
-                if ch is None:
-                    sub_state = SubState.NUMERIC_CHAR_REF_END
-
-                elif ch.isdigit():
-                    temp_buf.append(ch)
-                    val = ord(ch) - ord('0')
-                    char_ref_code = (char_ref_code * 10) + val
-                elif ch == ';':
-                    sub_state = SubState.NUMERIC_CHAR_REF_END
-                else:
-                    sub_state = SubState.NUMERIC_CHAR_REF_END
-
-
-            elif sub_state == SubState.NUMERIC_CHAR_REF_END:
-                """
-                Numeric character reference end state
-                """
-                code = char_ref_code
-
-                if code == 0x00:
-                    tokenizer.log_error(ParseError.NULL_CHARACTER_REFERENCE, position=pos)
-                    code = 0xFFFD
-
-                elif code > 0x10FFFF:
-                    tokenizer.log_error(ParseError.CHARACTER_REFERENCE_OUTSIDE_UNICODE_RANGE, position=pos)
-                    code = 0xFFFD
-
-                elif 0xD800 <= code <= 0xDFFF:
-                    tokenizer.log_error(ParseError.SURROGATE_CHARACTER_REFERENCE, position=pos)
-                    code = 0xFFFD
-
-                # 4) Windows-1252 check (0x80..0x9F)
-                elif 0x80 <= code <= 0x9F:
-                    mapped = entitiesWindows1252.get(code)
-                    if mapped is not None:
-                        tokenizer.log_error(ParseError.CONTROL_CHARACTER_REFERENCE, position=pos)
-                        temp_buf.clear()
-                        temp_buf.append(mapped)
-                        flush_temp_buf()
-                        sub_state = SubState.DONE
-                        if ch != ";":
-                            tokenizer.log_error(ParseError.MISSING_SEMICOLON_AFTER_CHARACTER_REFERENCE, position=pos)
-                            reconsume(2)
-                        else:
-                            reconsume()
-                        continue
-                    else:
-                        tokenizer.log_error(ParseError.CONTROL_CHARACTER_REFERENCE, position=pos)
-
-                if (0xFDD0 <= code <= 0xFDEF) or ((code & 0xFFFF) in (0xFFFE, 0xFFFF)):
-                    tokenizer.log_error(ParseError.NONCHARACTER_CHARACTER_REFERENCE, position=pos)
-
-                if ((code < 0x20 and code not in (0x09, 0x0A, 0x0C, 0x0D, 0x20))
-                        or (code == 0x7F)):
-                    tokenizer.log_error(ParseError.CONTROL_CHARACTER_REFERENCE, position=pos)
-
-                try:
-                    decoded = chr(code)
-                except ValueError:
-                    tokenizer.log_error(ParseError.SURROGATE_CHARACTER_REFERENCE, position=pos)
-                    decoded = '\uFFFD'
-                temp_buf.clear()
-                temp_buf.append(decoded)
-                flush_temp_buf()
-                if ch != ";" and ch is not None:
-                    tokenizer.log_error(ParseError.MISSING_SEMICOLON_AFTER_CHARACTER_REFERENCE, position=pos)
-                    reconsume(2)
-                else:
-                    reconsume()
-                sub_state = SubState.DONE
+        pos = tokenizer.position
+        decoded, end, errors = decode_character_references(tokenizer.text, pos, pos + 1, from_attribute)
+        if errors:
+            tokenizer.log_reference_errors(errors)
+        if from_attribute:
+            if tokenizer.current_token and tokenizer.current_token.attributes:
+                tokenizer.current_token.attributes[-1].value += decoded
+        else:
+            tokenizer.append_to_buffer(decoded)
+        tokenizer.position = end - 1
 
-        tokenizer.position = pos
\ No newline at end of file
+    def log_reference_errors(self, errors):
+        for name, position in errors:
+            self._log_error(ParseError[name], position=position)
@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from __future__ import annotations
-from dataclasses import dataclass, field
 from typing import List, Optional
 
 
@@ -13,6 +12,10 @@ COMMENT    = 4
 DOCTYPE    = 5
 EOF        = 6
 
+# Yielded by an incremental tokenizer when it has consumed all the input fed
+# so far and is waiting for more (see TWHTMLTokenizer.feed/close).
+NEED_DATA = object()
+
 TOKEN_TYPE_STR = {
     CHARACTER:  "Characters",
     START_TAG:  "StartTag",
@@ -31,12 +34,28 @@ _TOKEN_FIELDS = {
     EOF:       [],
 }
 
-@dataclass(slots=True)
 class Attribute:
-    name: str
-    value: str
-    namespace: Optional[str] = None
-    prefix: Optional[str] = None
+    # Plain __slots__ record rather than a dataclass: importing ``dataclasses``
+    # (and ``inspect`` behind it) would double the parser's import time.
+    __slots__ = ("name", "value", "namespace", "prefix")
+
+    def __init__(self, name: str, value: str, namespace: Optional[str] = None, prefix: Optional[str] = None):
+        self.name = name
+        self.value = value
+        self.namespace = namespace
+        self.prefix = prefix
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.name, self.value, self.namespace, self.prefix) == \
+            (other.name, other.value, other.namespace, other.prefix)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Attribute(name={self.name!r}, value={self.value!r}, "
+                f"namespace={self.namespace!r}, prefix={self.prefix!r})")
 
     def to_dict(self) -> dict:
         return {
@@ -47,12 +66,19 @@ class Attribute:
         }
 
 
-@dataclass(slots=True)
 class Token:
-    type: int
+    """
+    Base of the token classes. Each token type is its own ``__slots__`` class
+    holding only the fields it uses; the fields it does not have read as the
+    class-level defaults below, so the tree builder can look at
+    ``token.name`` or ``token.data`` without checking the type first.
+    """
+    __slots__ = ()
+
+    type: int = 0
     name: Optional[str] = ''
     data: Optional[str] = ''
-    attributes: List[Attribute] = field(default_factory=list)
+    attributes: List[Attribute] = ()
     public_id: Optional[str] = ''
     system_id: Optional[str] = ''
     quirks_mode: Optional[bool] = None
@@ -88,9 +114,70 @@ class Token:
     def acknowledge_self_closing(self) -> None:
         self.self_closing = True
 
-def __repr__(self) -> str:
-    return (f"<Token type={TOKEN_TYPE_STR[self.type]!r} "
-            f"name={self.name!r} "
-            f"data={self.data!r} "
-            f"attrs={len(self.attributes)} "
-            f"self_closing={self.self_closing}>")
\ No newline at end of file
+    def __repr__(self) -> str:
+        return (f"<Token type={TOKEN_TYPE_STR[self.type]!r} "
+                f"name={self.name!r} "
+                f"data={self.data!r} "
+                f"attrs={len(self.attributes)} "
+                f"self_closing={self.self_closing}>")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Token):
+            return NotImplemented
+        return self.type == other.type and self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+
+class CharacterToken(Token):
+    __slots__ = ("data", "space_character", "null_character")
+    type = CHARACTER
+
+    def __init__(self, data: str, space_character: bool = False, null_character: bool = False):
+        self.data = data
+        self.space_character = space_character
+        self.null_character = null_character
+
+
+class TagToken(Token):
+    __slots__ = ("name", "attributes", "self_closing")
+
+    def __init__(self, name: str = '', attributes: Optional[List[Attribute]] = None, self_closing: bool = False):
+        self.name = name
+        self.attributes = [] if attributes is None else attributes
+        self.self_closing = self_closing
+
+
+class StartTagToken(TagToken):
+    __slots__ = ()
+    type = START_TAG
+
+
+class EndTagToken(TagToken):
+    __slots__ = ()
+    type = END_TAG
+
+
+class CommentToken(Token):
+    __slots__ = ("data",)
+    type = COMMENT
+
+    def __init__(self, data: str = ''):
+        self.data = data
+
+
+class DoctypeToken(Token):
+    __slots__ = ("name", "public_id", "system_id", "quirks_mode")
+    type = DOCTYPE
+
+    def __init__(self, name: Optional[str] = '', public_id: Optional[str] = '', system_id: Optional[str] = '',
+                 quirks_mode: Optional[bool] = None):
+        self.name = name
+        self.public_id = public_id
+        self.system_id = system_id
+        self.quirks_mode = quirks_mode
+
+
+class EOFToken(Token):
+    __slots__ = ()
+    type = EOF
@@ -47,7 +47,7 @@ Example
 """
 import re
 from functools import lru_cache
-from typing import Iterable, List, Set, Tuple
+from typing import Callable, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import ahocorasick as _ahoc          # type: ignore
 import marisa_trie                   # type: ignore
@@ -360,4 +360,29 @@ def process_wildcard_words(
         result.extend(ws.search(None, wc_patterns, ignore_case=ignore_case))
 
     result.extend(plain)
-    return _dedup_preserve(result)
\ No newline at end of file
+    return _dedup_preserve(result)
+
+def compile_wildcards(
+    patterns,
+    *,
+    ignore_case: bool = True,
+) -> Tuple[FrozenSet[str], Optional[Callable[[str], object]]]:
+    """Split *patterns* into literal names and one matcher for the wildcards.
+
+    Unlike `process_wildcard_words`, nothing is searched here: the matcher is
+    applied to candidate names (tags, attributes) later, as often as needed.
+    Returns ``(literals, match)``; ``match`` is ``None`` without wildcards.
+    """
+    if isinstance(patterns, (str, int)):
+        patterns = [patterns]
+    patterns = [str(p) for p in patterns]
+
+    wc_patterns = [p for p in patterns if any(ch in p for ch in _WC_CHARS)]
+    literals = frozenset(p for p in patterns if p not in wc_patterns)
+    # Full-tag patterns ("<div*>") only ever select whole tags, never a name.
+    if not wc_patterns or any(p.startswith("<") and p.endswith(">") for p in wc_patterns):
+        return literals, None
+
+    flags = _re.IGNORECASE if ignore_case else 0
+    rx = _compile_rx("|".join(f"(?:{_wildcard_to_regex(p)})" for p in wc_patterns), flags)
+    return literals, rx.search
@@ -64,13 +64,27 @@ class CsvDialect:
 # --------------------------------------------------------------------------- #
 # Cleaner                                                                     #
 # --------------------------------------------------------------------------- #
+class _CSVCleanContext:
+    """State of one ``CSVCleaner.clean`` call: the CSV text as each step leaves it."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: str) -> None:
+        self.data = data
+
+
 class CSVCleaner:
+    """
+    Cleans CSV text according to ``clean_csv`` options.
+
+    Only the default dialect lives on the instance; each ``clean`` call works
+    on its own _CSVCleanContext, so concurrent calls do not interfere.
+    """
 
     VALID_DELIMITERS = [",", ";", "|", "\t"]
 
     def __init__(self, dialect: CsvDialect | None = None) -> None:
         self._dialect = dialect or CsvDialect()
-        self._data: str = ""
 
     @property
     def dialect(self) -> CsvDialect:
@@ -111,25 +125,25 @@ class CSVCleaner:
 
         self._validate_csv(csv_data, d)
 
-        self._data = csv_data
+        ctx = _CSVCleanContext(csv_data)
         p = {k: v for k, v in flags.items() if v is not None}
 
         if p.get("csv.trim_whitespace"):
-            self._trim_whitespace(d)
+            self._trim_whitespace(ctx, d)
         if "csv.remove_columns" in p:
-            self._remove_columns(p["csv.remove_columns"], d)
+            self._remove_columns(ctx, p["csv.remove_columns"], d)
         if "csv.remove_row_index" in p:
-            self._remove_row(p["csv.remove_row_index"], d)
+            self._remove_row(p["csv.remove_row_index"], ctx, d)
         if "csv.remove_values" in p:
-            self._remove_values(p["csv.remove_values"], d)
+            self._remove_values(ctx, p["csv.remove_values"], d)
         if p.get("csv.remove_duplicates_rows"):
-            self._remove_duplicate_rows()
+            self._remove_duplicate_rows(ctx)
         if p.get("csv.remove_empty_columns"):
-            self._remove_empty_columns(d)
+            self._remove_empty_columns(ctx, d)
         if p.get("csv.remove_empty_rows"):
-            self._remove_empty_rows(d)
+            self._remove_empty_rows(ctx, d)
 
-        return self._data
+        return ctx.data
 
 
     def _check_delim(self, d: str) -> str:
@@ -168,8 +182,9 @@ class CSVCleaner:
                     f"Row {idx} has {len(row)} columns; expected {ncols}"
                 )
 
-    def _rw(self, dialect: CsvDialect) -> Tuple[csv.reader, csv.writer, io.StringIO]:
-        buf = io.StringIO(self._data)
+    @staticmethod
+    def _rw(ctx: _CSVCleanContext, dialect: CsvDialect) -> Tuple[csv.reader, csv.writer, io.StringIO]:
+        buf = io.StringIO(ctx.data)
         rdr = csv.reader(buf, **dialect._kwargs())
         out = io.StringIO()
         wtr = csv.writer(out, **dialect._kwargs())
@@ -178,17 +193,18 @@ class CSVCleaner:
 
     def _remove_columns(
         self,
+        ctx: _CSVCleanContext,
         cols: Union[str, int, Iterable[Union[str, int]]],
         dialect: CsvDialect,
     ) -> None:
         if isinstance(cols, (str, int)):
             cols = [cols]
 
-        rdr, wtr, out = self._rw(dialect)
+        rdr, wtr, out = self._rw(ctx, dialect)
         try:
             header = next(rdr)
         except StopIteration:
-            self._data = ""
+            ctx.data = ""
             return
 
         n = len(header)
@@ -207,7 +223,7 @@ class CSVCleaner:
 
         keep = [i for i in range(n) if i not in removed]
         if not keep:
-            self._data = ""
+            ctx.data = ""
             return
 
         wtr.writerow([header[i] for i in keep])
@@ -218,42 +234,42 @@ class CSVCleaner:
 
         first = out.getvalue().splitlines()[0].split(dialect.delimiter)
         blank = all(c.strip().strip('"').strip("'") == "" for c in first)
-        self._data = "" if blank else out.getvalue()
+        ctx.data = "" if blank else out.getvalue()
 
     # rows -------------------------------------------------------------------
     @singledispatchmethod
-    def _remove_row(self, index, dialect: CsvDialect) -> None:  # noqa: D401
+    def _remove_row(self, index, ctx: _CSVCleanContext, dialect: CsvDialect) -> None:  # noqa: D401
         raise TypeError("Unsupported type for csv.remove_row_index")
 
     @_remove_row.register
-    def _(self, index: int, dialect: CsvDialect) -> None:
-        self._remove_rows_core([index], dialect)
+    def _(self, index: int, ctx: _CSVCleanContext, dialect: CsvDialect) -> None:
+        self._remove_rows_core(ctx, [index], dialect)
 
     @_remove_row.register
-    def _(self, index: Iterable, dialect: CsvDialect) -> None:
-        self._remove_rows_core([i for i in index if isinstance(i, int)], dialect)
+    def _(self, index: Iterable, ctx: _CSVCleanContext, dialect: CsvDialect) -> None:
+        self._remove_rows_core(ctx, [i for i in index if isinstance(i, int)], dialect)
 
-    def _remove_rows_core(self, indices: List[int], dialect: CsvDialect) -> None:
+    def _remove_rows_core(self, ctx: _CSVCleanContext, indices: List[int], dialect: CsvDialect) -> None:
         to_remove = sorted(set(indices), reverse=True)
-        rdr, wtr, buf = self._rw(dialect)
+        rdr, wtr, buf = self._rw(ctx, dialect)
         for i, row in enumerate(rdr):
             if i not in to_remove:
                 wtr.writerow(row)
-        self._data = buf.getvalue()
+        ctx.data = buf.getvalue()
 
     # values -----------------------------------------------------------------
-    def _remove_values(self, vals, dialect: CsvDialect) -> None:
+    def _remove_values(self, ctx: _CSVCleanContext, vals, dialect: CsvDialect) -> None:
         pats = self._coerce_patterns(vals)
         if not any(ch in p for p in pats for ch in "*?[]"):
             to_remove = set(pats)
         else:
             to_remove = process_wildcard_words(
-                self._data, pats, csv_delimiter=dialect.delimiter
+                ctx.data, pats, csv_delimiter=dialect.delimiter
             )
 
         delim = dialect.delimiter
         out = []
-        for rec in self._data.splitlines():
+        for rec in ctx.data.splitlines():
             buf, cells, in_q, i = [], [], False, 0
             while i < len(rec):
                 ch = rec[i]
@@ -269,11 +285,11 @@ class CSVCleaner:
             raw = "".join(buf)
             cells.append("" if raw in to_remove else raw)
             out.append(delim.join(cells))
-        self._data = "\n".join(out) + ("\n" if out else "")
+        ctx.data = "\n".join(out) + ("\n" if out else "")
 
     # duplicates --------------------------------------------------------------
-    def _remove_duplicate_rows(self) -> None:
-        lines = self._data.splitlines(keepends=True)
+    def _remove_duplicate_rows(self, ctx: _CSVCleanContext) -> None:
+        lines = ctx.data.splitlines(keepends=True)
         seen, out = set(), []
         for line in lines:
             h = hashlib.blake2b(
@@ -282,13 +298,13 @@ class CSVCleaner:
             if h not in seen:
                 seen.add(h)
                 out.append(line)
-        self._data = "".join(out)
+        ctx.data = "".join(out)
 
     # whitespace --------------------------------------------------------------
-    def _trim_whitespace(self, dialect: CsvDialect) -> None:
+    def _trim_whitespace(self, ctx: _CSVCleanContext, dialect: CsvDialect) -> None:
         delim, quote = dialect.delimiter, dialect.quotechar
         records, buf, in_q = [], [], False
-        for ch in self._data:
+        for ch in ctx.data:
             if ch == quote and (not buf or buf[-1] != "\\"):
                 in_q = not in_q
             if ch == "\n" and not in_q:
@@ -318,22 +334,22 @@ class CSVCleaner:
             cells.append("".join(buf).strip(" \t"))
             out.append(delim.join(cells))
 
-        self._data = "\n".join(out) + ("\n" if out else "")
+        ctx.data = "\n".join(out) + ("\n" if out else "")
 
     # empty columns -----------------------------------------------------------
-    def _remove_empty_columns(self, dialect: CsvDialect) -> None:
-        rdr, wtr, out = self._rw(dialect)
+    def _remove_empty_columns(self, ctx: _CSVCleanContext, dialect: CsvDialect) -> None:
+        rdr, wtr, out = self._rw(ctx, dialect)
         rows = list(rdr)
         if not rows:
             return
         keep = [any(cell.strip() for cell in col) for col in zip(*rows)]
         for row in rows:
             wtr.writerow([cell for i, cell in enumerate(row) if keep[i]])
-        self._data = out.getvalue()
+        ctx.data = out.getvalue()
 
     # empty rows --------------------------------------------------------------
-    def _remove_empty_rows(self, dialect: CsvDialect) -> None:
-        lines, new = self._data.splitlines(keepends=True), []
+    def _remove_empty_rows(self, ctx: _CSVCleanContext, dialect: CsvDialect) -> None:
+        lines, new = ctx.data.splitlines(keepends=True), []
         for line in lines:
             raw = line.rstrip("\r\n")
             if not raw:
@@ -344,6 +360,6 @@ class CSVCleaner:
             row = next(csv.reader([raw], **dialect._kwargs()))
             if any(cell.strip() for cell in row):
                 new.append(line)
-        self._data = "".join(new)
-        if self._data and not self._data.endswith("\n"):
-            self._data += "\n"
+        ctx.data = "".join(new)
+        if ctx.data and not ctx.data.endswith("\n"):
+            ctx.data += "\n"
@@ -4,12 +4,14 @@
 
 from __future__ import annotations
 from collections import deque
-from typing import Callable, Deque, FrozenSet, Iterable, List, Set, Tuple, Dict, Protocol
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from textwizard.utils.tw_html_parser.dom import Element, Node, NodeType
+from textwizard.utils.tw_html_parser.html_document import HTMLDocument
 from textwizard.utils.tw_html_parser.parser import TWHTMLParser
+from textwizard.utils.tw_html_parser.sax import END, START, TEXT, TWHTMLEventParser
 from textwizard.utils.tw_html_parser.serializer import HTMLSerializer
-from textwizard.utils.wildcard import process_wildcard_words
+from textwizard.utils.tw_html_parser._utils import RAWTEXT_ELEMENTS, RCDATA_ELEMENTS, SCRIPT_DATA_ELEMENTS, namespaces
 from textwizard.wizard_cleaners.tw_html_cleaner.constants import (
     EMBEDDED_CONTENT,
     FLOW_CONTENT,
@@ -23,6 +25,10 @@ from textwizard.wizard_cleaners.tw_html_cleaner.constants import (
 )
 
 
+_HTML_NS = namespaces["html"]
+# Elements whose text the tree builder keeps in one node.
+_RAW_TEXT_ELEMENTS = RCDATA_ELEMENTS | RAWTEXT_ELEMENTS | SCRIPT_DATA_ELEMENTS
+
 if not hasattr(Element, "tag_lower"):
     Element.tag_lower = Element.tag_name_lower
 
@@ -39,143 +45,333 @@ _TAG_GROUPS: Dict[str, FrozenSet[str]] = {
     "html.remove_palpable": PALPABLE_CONTENT,
 }
 
-# ===================== traversal =========================== #
-def iter_nodes(
-    root: Node, predicate: Callable[[Node], bool] | None = None, *, include_root: bool = False
-) -> Iterable[Tuple[Node, Node | None]]:
-    dq: Deque[Tuple[Node, Node | None]] = deque([(root, None)])
-    append, pop = dq.append, dq.pop
-    while dq:
-        node, parent = pop()
-        if include_root or parent is not None:
-            if predicate is None or predicate(node):
-                yield node, parent
-        for child in reversed(node.child_nodes):
-            append((child, node))
+# Element operations of the fused engine. When a tag is targeted by several
+# options the first applicable one in this order wins. _DROP (tag groups) and
+# _REMOVE (remove_tags_and_contents) both delete the subtree, at different
+# points of HTMLCleaner._edit_children.
+_DROP, _UNWRAP, _REMOVE, _CLEAR = 1, 2, 3, 4
 
 
-def _siblings(container: Node, target: Node) -> Tuple[Node | None, Node | None]:
-    sibs = container.child_nodes
-    idx = sibs.index(target)
-    return sibs[idx - 1] if idx else None, sibs[idx + 1] if idx < len(sibs) - 1 else None
+_NAME_OPTIONS = ("html.remove_content_tags", "html.remove_tags_and_contents",
+                 "html.remove_specific_tags", "html.remove_specific_attributes")
+# Distinct names remembered per table; beyond this they are matched every time.
+_NAME_MEMO_LIMIT = 4096
 
 
-class Action(Protocol):
-    def __call__(self, node: Node, parent: Node | None) -> bool: ...
+class _NameRules(dict):
+    """
+    Lowercase name -> value of the first rule that selects it (``None`` if
+    none does), resolved on first lookup and remembered.
 
+    A rule is ``(names, match, value)``: a set of literal names and an
+    optional wildcard matcher. Concurrent lookups of a new name may both
+    resolve it; they store the same value.
+    """
+    __slots__ = ("rules",)
 
-class HTMLCleaner:
-    __slots__ = ("doc", "_preserve_set", "html_text")
+    def __init__(self, rules: List[Tuple[FrozenSet[str], Callable[[str], object] | None, object]]) -> None:
+        super().__init__()
+        self.rules = tuple(rule for rule in rules if rule[0] or rule[1] is not None)
 
-    def __init__(self) -> None:
-        self.doc: Node | None = None
-        self._preserve_set: Set[str] = set()
-        self.html_text: str = ""
+    def __missing__(self, name: str):
+        for names, match, value in self.rules:
+            if name in names or (match is not None and match(name)):
+                break
+        else:
+            value = None
+        if len(self) < _NAME_MEMO_LIMIT:
+            self[name] = value
+        return value
+
+
+class _CleanPlan:
+    """
+    Every requested structural operation, compiled into per-node lookups.
+
+    With ``html_text`` the wildcard patterns are resolved against the words of
+    that document, as ``clean_html`` always has; without it they are compiled
+    into name matchers and the plan serves any document (HtmlCleanProfile).
+    """
+    __slots__ = ("tag_ops", "drop_comments", "drop_doctype", "attributes", "prune_empty",
+                 "drops", "unwraps", "removes", "strips_attributes")
+
+    def __init__(self, params: dict, html_text: str | None = None) -> None:
+        wanted = [key for key in _NAME_OPTIONS if key in params]
+        selectors: Dict[str, Tuple[FrozenSet[str], Callable[[str], object] | None]] = {}
+        if wanted:
+            # wildcard pulls in regex and marisa_trie; plain cleaning never needs it.
+            from textwizard.utils.wildcard import compile_wildcards, process_wildcard_words
+
+            for key in wanted:
+                if html_text is None:
+                    literals, match = compile_wildcards(params[key])
+                else:
+                    literals, match = process_wildcard_words(html_text, params[key]), None
+                selectors[key] = (frozenset(n.lower() for n in literals), match)
+
+        none = (frozenset(), None)
+        groups = frozenset().union(*(tag_set for key, tag_set in _TAG_GROUPS.items() if params.get(key)))
+        # Highest precedence first.
+        self.tag_ops = _NameRules([
+            (groups, None, _DROP),
+            (*selectors.get("html.remove_specific_tags", none), _UNWRAP),
+            (*selectors.get("html.remove_tags_and_contents", none), _REMOVE),
+            (*selectors.get("html.remove_content_tags", none), _CLEAR),
+        ])
+        self.attributes = _NameRules([(*selectors.get("html.remove_specific_attributes", none), True)])
+        self.drop_comments = bool(params.get("html.remove_comments"))
+        self.drop_doctype = bool(params.get("html.remove_doctype"))
+        self.prune_empty = bool(params.get("html.remove_empty_tags"))
+        ops = {rule[2] for rule in self.tag_ops.rules}
+        self.drops = self.drop_comments or self.drop_doctype or _DROP in ops
+        self.unwraps = _UNWRAP in ops
+        self.removes = _REMOVE in ops
+        self.strips_attributes = bool(self.attributes.rules)
+
+    def dropped(self, node: Node) -> bool:
+        """True for nodes removed outright: tag groups, comments, doctype."""
+        nt = node.node_type
+        if nt is NodeType.ELEMENT_NODE:
+            return self.tag_ops[node.tag_lower] is _DROP
+        if nt is NodeType.COMMENT_NODE:
+            return self.drop_comments
+        return nt is NodeType.DOCUMENT_TYPE_NODE and self.drop_doctype
+
+
+def _preserved_tags(params: dict) -> FrozenSet[str]:
+    # Mode C: the tag groups explicitly set to False are kept as markup.
+    return frozenset().union(*(tag_set for key, tag_set in _TAG_GROUPS.items() if params.get(key) is False))
+
+
+def _join_blocks(pieces: List[str]) -> str:
+    out: List[str] = []
+    append_out = out.append
+    for blk in pieces:
+        if not blk:
+            continue
+        if out and not out[-1][-1].isspace() and not blk[0].isspace():
+            append_out(" ")
+        append_out(blk)
+    return "".join(out)
+
+
+class _CleanContext:
+    """State of one ``HTMLCleaner.clean`` call: the tree being edited and the plan."""
+    __slots__ = ("doc", "plan")
+
+    def __init__(self, doc: Node, plan: _CleanPlan) -> None:
+        self.doc = doc
+        self.plan = plan
 
-    def clean(self, html_text: str, **kwargs) -> str:
-        self.html_text = html_text
-        self.doc = TWHTMLParser(html_text).parse()
 
-        params = {k: v for k, v in kwargs.items() if v is not None}
+class HTMLCleaner:
+    """
+    Cleans HTML according to ``clean_html`` options.
+
+    The cleaner holds no per-call state (each call works on its own
+    _CleanContext), so one instance may serve concurrent calls.
+    """
+    __slots__ = ()
+
+    def clean(self, html_text: str | HTMLDocument, profile: HtmlCleanProfile | None = None, **kwargs) -> str:
+        parsed = html_text if isinstance(html_text, HTMLDocument) else None
+        if parsed is not None:
+            html_text = parsed.html
+        if profile is not None:
+            params = profile.params
+        else:
+            params = {k: v for k, v in kwargs.items() if v is not None}
         if not params:
-            return self._extract_text(self.doc)
+            return self._default_text(html_text, parsed)
 
-        if any(params.values()):
-            actions = self._build_actions(params)
-            self._apply_actions_once(actions)
-            self._apply_extra_true_params(params)
+        if parsed is None:
+            doc = TWHTMLParser(html_text).parse()
+        elif any(params.values()):
+            # Structural cleaning edits the tree; the handle's tree stays intact.
+            doc = parsed.copy_document()
         else:
-            self._apply_false_params({k: v for k, v in params.items() if v is False})
+            doc = parsed.document
+
+        if not any(params.values()):
             return self._extract_text_preserving(
-                self.doc,
-                self._preserve_set,
+                doc,
+                profile._preserved if profile is not None else _preserved_tags(params),
                 preserve_comments=params.get("html.remove_comments") is False,
                 preserve_doctype=params.get("html.remove_doctype") is False,
             )
 
-        if not self.doc.child_nodes:
+        plan = profile._plan if profile is not None else _CleanPlan(params, html_text)
+        self._apply_plan(_CleanContext(doc, plan))
+        if not doc.child_nodes:
             return ""
-        return HTMLSerializer(quote_attr_values="always").render(self.doc)
-
-    def _build_actions(self, params: dict) -> List[Action]:
-        actions: List[Action] = []
-        doc = self.doc
-        sibs = _siblings
-
-        for key, tag_set in _TAG_GROUPS.items():
-            if params.get(key):
-                ts = tag_set
-
-                def remove_group(n: Node, p: Node | None, ts=ts, d=doc) -> bool:
-                    if p and n.node_type == NodeType.ELEMENT_NODE and n.tag_lower in ts:
-                        prev, nxt = sibs(p, n)
-                        if (
-                                prev and nxt
-                                and prev.node_type == nxt.node_type == NodeType.TEXT_NODE
-                                and not prev.data.endswith(" ")
-                                and not nxt.data.startswith(" ")
-                        ):
-                            p.insert_before(d.create_text_node(" "), n)
-                        p.remove_child(n)
-                        return True
-                    return False
-
-                actions.append(remove_group)
-
-        if params.get("html.remove_doctype"):
-            actions.append(
-                lambda n, p: (
-                    p is not None
-                    and n.node_type == NodeType.DOCUMENT_TYPE_NODE
-                    and p.remove_child(n) is None
-                )
-            )
-
-        if params.get("html.remove_comments"):
-            actions.append(
-                lambda n, p: (
-                    p is not None
-                    and n.node_type == NodeType.COMMENT_NODE
-                    and p.remove_child(n) is None
-                )
-            )
-
-        return actions
-
-    def _apply_actions_once(self, actions: List[Action]) -> None:
-        doc = self.doc
-        it = iter_nodes
-        for node, parent in it(doc, include_root=False):
-            for act in actions:
-                if act(node, parent):
-                    break
-
-    def _apply_extra_true_params(self, params: dict) -> None:
-        if "html.remove_specific_tags" in params:
-            self._unwrap_elements_by_tag_names(
-                set(process_wildcard_words(self.html_text, params["html.remove_specific_tags"]))
-            )
-        if "html.remove_tags_and_contents" in params:
-            self._remove_tags_and_contents(
-                set(process_wildcard_words(self.html_text, params["html.remove_tags_and_contents"]))
-            )
-        if "html.remove_content_tags" in params:
-            self._remove_content_from_elements_by_tag_names(
-                set(process_wildcard_words(self.html_text, params["html.remove_content_tags"]))
-            )
-        if "html.remove_specific_attributes" in params:
-            self._remove_specific_attributes(
-                process_wildcard_words(self.html_text, params["html.remove_specific_attributes"])
-            )
-        if params.get("html.remove_empty_tags"):
-            self._remove_empty_tags(self.doc)
+        serializer = profile._serializer if profile is not None else HTMLSerializer(quote_attr_values="always")
+        return serializer.render(doc)
+
+    def _apply_plan(self, ctx: _CleanContext) -> None:
+        # One pre-order walk over the sibling links. Entering a node settles
+        # its child list first (see _edit_children), so the walk itself only
+        # clears, strips attributes and descends; empty elements are found
+        # bottom-up when the walk leaves them.
+        doc, plan = ctx.doc, ctx.plan
+        tag_ops = plan.tag_ops
+        attributes, strips_attributes = plan.attributes, plan.strips_attributes
+        edit_children = self._edit_children if plan.drops or plan.unwraps or plan.removes else None
+        leave = self._empty_pruner() if plan.prune_empty else None
+        element = NodeType.ELEMENT_NODE
+
+        if edit_children is not None:
+            edit_children(ctx, doc)
+        node = doc.first_child
+        while node is not None:
+            if node.node_type is element:
+                if tag_ops[node.tag_lower] is _CLEAR:
+                    node.replace_children()
+                if strips_attributes:
+                    for attr in [a for a in node.get_attributes() if attributes[a.lower()]]:
+                        node.remove_attribute(attr)
+                if edit_children is not None:
+                    edit_children(ctx, node)
+                first = node.first_child
+                if first is not None:
+                    node = first
+                    continue
+                if leave is not None:
+                    leave(node)
+
+            nxt, parent = node.next_sibling, node.parent_node
+            while nxt is None and parent is not doc:
+                if leave is not None:
+                    leave(parent)
+                nxt, parent = parent.next_sibling, parent.parent_node
+            node = nxt
+
+        if leave is not None:
+            leave(doc)
+
+    def _edit_children(self, ctx: _CleanContext, container: Node) -> None:
+        # Three scans over one child list, in the order the options have
+        # always applied: outright drops, then unwrapping, then
+        # remove_tags_and_contents. Each decides its separating spaces against
+        # the siblings the previous one left. Unwrapping repeats its scan
+        # until nothing changes and leaves spliced children to the next scan,
+        # as the former whole-tree unwrap passes did: the spaces depend on it.
+        if container.first_child is None:
+            return
+        plan = ctx.plan
+        if plan.drops:
+            self._drop_children(ctx, container)
+        tag_ops = plan.tag_ops
+        element = NodeType.ELEMENT_NODE
+
+        changed = plan.unwraps
+        while changed:
+            changed = False
+            child = container.first_child
+            while child is not None:
+                nxt = child.next_sibling
+                if child.node_type is element and tag_ops[child.tag_lower] is _UNWRAP:
+                    self._unwrap(ctx, container, child)
+                    changed = True
+                child = nxt
+
+        if plan.removes:
+            child = container.first_child
+            while child is not None:
+                nxt = child.next_sibling
+                if child.node_type is element and tag_ops[child.tag_lower] is _REMOVE:
+                    self._remove_spaced(ctx, container, child)
+                child = nxt
 
-    def _apply_false_params(self, params: dict) -> None:
-        keep: Set[str] = set()
-        for key, tag_set in _TAG_GROUPS.items():
-            if params.get(key) is False:
-                keep |= tag_set
-        self._preserve_set = keep
+    @staticmethod
+    def _empty_pruner() -> Callable[[Node], None]:
+        # An element is empty when it only holds whitespace text and empty
+        # elements. Empty children are detached when their parent turns out
+        # not to be empty, so each element is inspected exactly once and the
+        # topmost empty element goes with its whole subtree.
+        empty: Set[Node] = set()
+        text = NodeType.TEXT_NODE
+
+        def leave(el: Node) -> None:
+            marked: List[Node] = []
+            is_empty = el.node_type is NodeType.ELEMENT_NODE
+            c = el.first_child
+            while c is not None:
+                if c in empty:
+                    marked.append(c)
+                elif c.node_type is not text or c.data.strip():
+                    is_empty = False
+                c = c.next_sibling
+            if is_empty:
+                empty.add(el)
+            else:
+                for c in marked:
+                    el.remove_child(c)
+
+        return leave
+
+    def _drop_children(self, ctx: _CleanContext, container: Node) -> None:
+        dropped = ctx.plan.dropped
+        child = container.first_child
+        while child is not None:
+            nxt = child.next_sibling
+            if dropped(child):
+                if child.node_type is NodeType.ELEMENT_NODE:
+                    self._remove_spaced(ctx, container, child)
+                else:
+                    container.remove_child(child)
+            child = nxt
+
+    def _remove_spaced(self, ctx: _CleanContext, parent: Node, node: Node) -> None:
+        prev_sib, next_sib = node.previous_sibling, node.next_sibling
+        if (
+            prev_sib
+            and next_sib
+            and prev_sib.node_type == next_sib.node_type == NodeType.TEXT_NODE
+            and not prev_sib.data.endswith(" ")
+            and not next_sib.data.startswith(" ")
+        ):
+            parent.insert_before(ctx.doc.create_text_node(" "), node)
+        parent.remove_child(node)
+
+    def _unwrap(self, ctx: _CleanContext, parent: Node, elem: Node) -> None:
+        """Replace ``elem`` by its children."""
+        if ctx.plan.drops:
+            self._drop_children(ctx, elem)
+        first = elem.first_child
+        for g in list(elem.child_nodes):
+            parent.insert_before(g, elem)
+            prev = g.previous_sibling
+            if (
+                prev is not None
+                and prev.node_type == g.node_type == NodeType.TEXT_NODE
+                and not prev.data.endswith(" ")
+                and not g.data.startswith(" ")
+            ):
+                prev.data += " "
+
+        last_g = elem.previous_sibling if first is not None else None
+        next_sib = elem.next_sibling
+        parent.remove_child(elem)
+        if (
+            last_g is not None
+            and last_g.node_type == NodeType.TEXT_NODE
+            and next_sib
+            and next_sib.node_type == NodeType.TEXT_NODE
+            and not last_g.data.endswith(" ")
+            and not next_sib.data.startswith(" ")
+        ):
+            last_g.data += " "
+
+    @classmethod
+    def _default_text(cls, html_text: str, parsed: HTMLDocument | None) -> str:
+        # Text-only mode is defined on the tree; a handle already has one,
+        # strings skip building it whenever the SAX events give the same text.
+        if parsed is not None:
+            return cls._extract_text(parsed.document)
+        text = cls._extract_text_streaming(html_text)
+        if text is None:
+            text = cls._extract_text(TWHTMLParser(html_text).parse())
+        return text
 
     @staticmethod
     def _extract_text(root: Node) -> str:
@@ -200,15 +396,45 @@ class HTMLCleaner:
                 for c in reversed(node.child_nodes):
                     push((c, in_skip))
 
-        out: List[str] = []
-        append_out = out.append
-        for blk in pieces:
-            if not blk:
+        return _join_blocks(pieces)
+
+    @staticmethod
+    def _extract_text_streaming(html_text: str) -> Optional[str]:
+        # Same result as ``_extract_text`` on the parsed tree, from SAX events:
+        # no DOM is built, each text event is one block like a text node, but
+        # the events of one raw-text element join like the tree builder's
+        # single node. Returns None when the input needs tree construction
+        # the events do not replay (see TWHTMLEventParser.approximate).
+        pieces: List[str] = []
+        append = pieces.append
+        skip = 0
+        skip_tags = SCRIPT_SUPPORTING
+        joining = False
+
+        parser = TWHTMLEventParser(html_text)
+        open_elements = parser.open_elements
+        for kind, value, _ in parser.events():
+            if parser.approximate:
+                return None
+            if kind == TEXT:
+                if not skip:
+                    if joining:
+                        pieces[-1] += value
+                    else:
+                        append(value)
+                        top = open_elements[-1] if open_elements else None
+                        joining = top is not None and top.namespace == _HTML_NS and top.tag_name in _RAW_TEXT_ELEMENTS
                 continue
-            if out and not out[-1][-1].isspace() and not blk[0].isspace():
-                append_out(" ")
-            append_out(blk)
-        return "".join(out)
+            joining = False
+            if kind == START:
+                if skip or value in skip_tags:
+                    skip += 1
+            elif kind == END and skip:
+                skip -= 1
+        if parser.approximate:
+            return None
+
+        return _join_blocks(pieces)
 
 
     def _extract_preserved_sectioning(self, node: Node, preserve_set: Set[str]) -> str:
@@ -281,137 +507,55 @@ class HTMLCleaner:
         )
 
 
-    def _remove_elements_by_tag_names(self, tag_names: FrozenSet[str]) -> None:
-        pred = lambda n: n.node_type == NodeType.ELEMENT_NODE and n.tag_lower in tag_names  # noqa: E731
-        for node, parent in iter_nodes(self.doc, pred):
-            if parent is None:
-                continue
-            prev_sib, next_sib = _siblings(parent, node)
-            if (
-                prev_sib
-                and next_sib
-                and prev_sib.node_type == next_sib.node_type == NodeType.TEXT_NODE
-                and not prev_sib.data.endswith(" ")
-                and not next_sib.data.startswith(" ")
-            ):
-                parent.insert_before(self.doc.create_text_node(" "), node)
-            parent.remove_child(node)
-
-    def _unwrap_elements_by_tag_names(self, tag_names: Set[str]) -> None:
-        changed = True
-        while changed:
-            changed = self._unwrap_pass(tag_names)
+class HtmlCleanProfile:
+    """
+    A ``clean_html`` configuration compiled once, for cleaning many documents.
 
-    def _unwrap_pass(self, tag_names: Set[str]) -> bool:
-        changed = False
-        tag_lower = {t.lower() for t in tag_names}
-        stack = [self.doc]
+    Takes the same options as ``clean_html``. Tag groups, tag and attribute
+    names and wildcard patterns are resolved here, so :meth:`clean` only
+    parses, edits and serializes. Wildcards are matched against the tag and
+    attribute names of each document (``clean_html`` matches them against
+    the words of the source text instead, so a tag the parser adds, such as
+    an implied ``<tbody>``, can match here and not there).
 
-        while stack:
-            cur = stack.pop()
-            for child in list(cur.child_nodes):
-                if child.node_type == NodeType.ELEMENT_NODE:
-                    elem = child
-                    if elem.tag_lower in tag_lower:
-                        changed = True
-                        idx = cur.child_nodes.index(elem)
-                        cur.remove_child(elem)
-
-                        grand = list(elem.child_nodes)
-                        for g in grand:
-                            cur.insert_before(
-                                g, cur.child_nodes[idx] if idx < len(cur.child_nodes) else None
-                            )
-                            if (
-                                idx > 0
-                                and cur.child_nodes[idx - 1].node_type == g.node_type == NodeType.TEXT_NODE
-                                and not cur.child_nodes[idx - 1].data.endswith(" ")
-                                and not g.data.startswith(" ")
-                            ):
-                                cur.child_nodes[idx - 1].data += " "
-                            idx += 1
-
-                        if grand:
-                            last_g = grand[-1]
-                            next_sib = cur.child_nodes[idx] if idx < len(cur.child_nodes) else None
-                            if (
-                                last_g.node_type == NodeType.TEXT_NODE
-                                and next_sib
-                                and next_sib.node_type == NodeType.TEXT_NODE
-                                and not last_g.data.endswith(" ")
-                                and not next_sib.data.startswith(" ")
-                            ):
-                                last_g.data += " "
-                        continue
-                    stack.append(child)
-                else:
-                    stack.append(child)
-        return changed
-
-    @staticmethod
-    def _remove_comments(root: Node) -> None:
-        for node, parent in iter_nodes(
-            root, lambda n: n.node_type == NodeType.COMMENT_NODE, include_root=False
-        ):
-            parent.remove_child(node)  # type: ignore[arg-type]
-
-    def _remove_doctype(self) -> None:
-        if self.doc is not None and hasattr(self.doc, "child_nodes"):
-            for child in list(self.doc.child_nodes):
-                if child.node_type == NodeType.DOCUMENT_TYPE_NODE:
-                    self.doc.remove_child(child)
-
-    def _remove_content_from_elements_by_tag_names(self, tag_names: Set[str]) -> None:
-        tag_names_lower = {t.lower() for t in tag_names}
-        pred = lambda n: n.node_type == NodeType.ELEMENT_NODE and n.tag_lower in tag_names_lower  # noqa: E731
-        for node, _ in iter_nodes(self.doc, pred):
-            node._children = []  # type: ignore[attr-defined]
-
-    def _remove_tags_and_contents(self, tag_names: Set[str]) -> None:
-        names = {t.lower() for t in tag_names}
-        pred = lambda n: n.node_type == NodeType.ELEMENT_NODE and n.tag_lower in names  # noqa: E731
-        for node, parent in iter_nodes(self.doc, pred):
-            if parent is None:
-                continue
-            prev_sib, next_sib = _siblings(parent, node)
-            if (
-                prev_sib
-                and next_sib
-                and prev_sib.node_type == next_sib.node_type == NodeType.TEXT_NODE
-                and not prev_sib.data.endswith(" ")
-                and not next_sib.data.startswith(" ")
-            ):
-                parent.insert_before(self.doc.create_text_node(" "), node)
-            parent.remove_child(node)
-
-    def _remove_specific_attributes(self, attributes: List[str]) -> None:
-        attr_set = {a.lower() for a in attributes}
-        pred = lambda n: n.node_type == NodeType.ELEMENT_NODE  # noqa: E731
-        for node, _ in iter_nodes(self.doc, pred, include_root=True):
-            if node.node_type == NodeType.ELEMENT_NODE:
-                for attr in list(node.get_attributes().keys()):
-                    if attr.lower() in attr_set:
-                        node.remove_attribute(attr)
-
-    @staticmethod
-    def _remove_empty_tags(root: Node) -> None:
-        changed = True
-        while changed:
-            changed = False
-            for node, parent in iter_nodes(root, include_root=False):
-                if parent is None:
-                    continue
-                if node.node_type == NodeType.ELEMENT_NODE:
-                    if (
-                        not node.child_nodes
-                        or all(
-                            c.node_type == NodeType.TEXT_NODE and not c.data.strip()
-                            for c in node.child_nodes
-                        )
-                    ):
-                        parent.remove_child(node)  # type: ignore[arg-type]
-                        changed = True
-
-        if root and not root.child_nodes:
-            root._children.clear()  # type: ignore[attr-defined]
+    A profile never changes after construction and may be shared by threads.
+    """
+    __slots__ = ("params", "_plan", "_preserved", "_serializer")
 
+    def __init__(
+        self,
+        *,
+        remove_script: bool | None = None,
+        remove_metadata_tags: bool | None = None,
+        remove_flow_tags: bool | None = None,
+        remove_sectioning_tags: bool | None = None,
+        remove_heading_tags: bool | None = None,
+        remove_phrasing_tags: bool | None = None,
+        remove_embedded_tags: bool | None = None,
+        remove_interactive_tags: bool | None = None,
+        remove_palpable: bool | None = None,
+        remove_doctype: bool | None = None,
+        remove_comments: bool | None = None,
+        remove_specific_attributes: str | List[str] | None = None,
+        remove_specific_tags: str | List[str] | None = None,
+        remove_empty_tags: bool | None = None,
+        remove_content_tags: str | List[str] | None = None,
+        remove_tags_and_contents: str | List[str] | None = None,
+    ) -> None:
+        options = dict(locals())
+        del options["self"]
+        self.params = {f"html.{k}": v for k, v in options.items() if v is not None}
+        structural = any(self.params.values())
+        self._plan = _CleanPlan(self.params) if structural else None
+        self._preserved = _preserved_tags(self.params) if self.params and not structural else frozenset()
+        self._serializer = HTMLSerializer(quote_attr_values="always")
+
+    def clean(self, html: str | HTMLDocument) -> str:
+        """Clean ``html`` (a string or a parsed document) with this profile."""
+        if not isinstance(html, (str, HTMLDocument)):
+            raise TypeError(f"HtmlCleanProfile.clean() expects str or HTMLDocument, got {type(html).__name__}")
+        return HTMLCleaner().clean(html, profile=self)
+
+    def __repr__(self) -> str:
+        options = ", ".join(f"{k[5:]}={v!r}" for k, v in self.params.items())
+        return f"HtmlCleanProfile({options})"
@@ -64,16 +64,31 @@ def _all_text(xml_text: str) -> str:
 
 def _needs_root(method):  # type: ignore[override]
     @wraps(method)
-    def wrapper(self: "XMLCleaner", *args, **kwargs):
-        if self.root is None:
+    def wrapper(self: "XMLCleaner", ctx: "_XMLCleanContext", *args, **kwargs):
+        if ctx.root is None:
             raise RuntimeError("Call clean() first")
-        return method(self, *args, **kwargs)
+        return method(self, ctx, *args, **kwargs)
 
     return wrapper
 
 
+def _new_parser() -> etree.XMLParser:
+    # lxml parsers must not be shared between threads; each call gets its own.
+    return etree.XMLParser(remove_blank_text=True, strip_cdata=False, recover=True)
+
+
+class _XMLCleanContext:
+    """State of one ``XMLCleaner.clean`` call."""
+    __slots__ = ("root", "xml_text", "parser")
+
+    def __init__(self, xml_text: str) -> None:
+        self.root: etree._Element | None = None
+        self.xml_text = xml_text
+        self.parser = _new_parser()
+
+
 class XMLCleaner:  # noqa: D101
-    __slots__ = ("root", "_parser", "_xml_text")
+    __slots__ = ()
 
     _PIPE: Mapping[str, str] = {
         "xml.remove_comments": "_remove_comments",
@@ -88,85 +103,80 @@ class XMLCleaner:  # noqa: D101
         "xml.remove_empty_tags": "_remove_empty_tags",
     }
 
-    def __init__(self) -> None:
-        self._parser = etree.XMLParser(remove_blank_text=True, strip_cdata=False, recover=True)
-        self.root: etree._Element | None = None
-        self._xml_text: str | None = None
-
     # ------------------------------------------------------------------ #
     def clean(self, xml: str | bytes, /, **flags) -> str:
         xml_text = xml.decode("utf-8", "replace") if isinstance(xml, bytes) else str(xml)
         xml_bytes = xml if isinstance(xml, bytes) else xml_text.encode()
-        self._xml_text = xml_text
         active = {k: v for k, v in flags.items() if v is not None}
 
         if not active:
             return _all_text(xml_text)
 
-        self.root = etree.fromstring(xml_bytes, self._parser)
+        ctx = _XMLCleanContext(xml_text)
+        ctx.root = etree.fromstring(xml_bytes, ctx.parser)
 
         if active.get("xml.remove_comments") or active.get("xml.remove_processing_instructions"):
             cleaned = _strip_nodes_dom(
-                etree.tostring(self.root, encoding="unicode", with_tail=False),
+                etree.tostring(ctx.root, encoding="unicode", with_tail=False),
                 remove_comments=bool(active.get("xml.remove_comments")),
                 remove_processing=bool(active.get("xml.remove_processing_instructions")),
             )
-            self.root = etree.fromstring(cleaned.encode(), self._parser)
+            ctx.root = etree.fromstring(cleaned.encode(), ctx.parser)
 
         for flag, helper in self._PIPE.items():
             if flag in active and flag not in (
                 "xml.remove_comments",
                 "xml.remove_processing_instructions",
             ):
-                getattr(self, helper)(active[flag])
+                getattr(self, helper)(ctx, active[flag])
 
         if (
             "xml.remove_empty_tags" in active
-            and len(self.root) == 0
-            and not (self.root.text or "").strip()
+            and len(ctx.root) == 0
+            and not (ctx.root.text or "").strip()
         ):
             return ""
 
-        return etree.tostring(self.root, encoding="unicode", pretty_print=False, xml_declaration=False)
+        return etree.tostring(ctx.root, encoding="unicode", pretty_print=False, xml_declaration=False)
 
     @_needs_root
-    def _remove_comments(self, _):
+    def _remove_comments(self, ctx, _):
         pass
 
     @_needs_root
-    def _remove_processing(self, _):
+    def _remove_processing(self, ctx, _):
         pass
 
     @_needs_root
-    def _strip_namespaces(self, _):
-        for el in self.root.iter():
+    def _strip_namespaces(self, ctx, _):
+        for el in ctx.root.iter():
             if isinstance(el.tag, str) and "}" in el.tag:
                 el.tag = el.tag.split("}", 1)[1]
             for attr in list(el.attrib):
                 if "}" in attr:
                     el.attrib[attr.split("}", 1)[1]] = el.attrib.pop(attr)
-        etree.cleanup_namespaces(self.root)
+        etree.cleanup_namespaces(ctx.root)
 
 
     @_needs_root
-    def _remove_content_tags(self, patterns):
-        patterns = self._prepare_patterns(patterns)
+    def _remove_content_tags(self, ctx, patterns):
+        patterns = self._prepare_patterns(ctx, patterns)
         for tag in patterns:
             local = tag.split(":", 1)[1] if ":" in tag else tag
             xpath = f".//*[local-name()='{local}' or name()='{tag}']"
-            for el in list(self.root.xpath(xpath)):
+            for el in list(ctx.root.xpath(xpath)):
                 for child in list(el):
                     child.tail = None
                     el.remove(child)
                 el.text = None
 
     @_needs_root
-    def _remove_specific_tags(self, patterns):
-        patterns = self._prepare_patterns(patterns)
+    def _remove_specific_tags(self, ctx, patterns):
+        patterns = self._prepare_patterns(ctx, patterns)
         for tag in patterns:
             local = tag.split(":", 1)[1] if ":" in tag else tag
             xpath = f".//*[local-name()='{local}' or name()='{tag}']"
-            for el in list(self.root.xpath(xpath)):
+            for el in list(ctx.root.xpath(xpath)):
                 parent = el.getparent()
                 if parent is None:
                     continue
@@ -180,15 +190,15 @@ class XMLCleaner:  # noqa: D101
                         parent.text = (parent.text or "") + tail
 
     @_needs_root
-    def _remove_attributes(self, patterns):
-        patterns = self._prepare_patterns(patterns)
+    def _remove_attributes(self, ctx, patterns):
+        patterns = self._prepare_patterns(ctx, patterns)
         plain: Set[str] = {p for p in patterns if "*" not in p and "?" not in p}
         wild = [p for p in patterns if p not in plain]
         wild_compiled: Sequence[Tuple[bool, re.Pattern[str]]] = [(":" in p, re.compile(fnmatch.translate(p)).fullmatch) for p in wild]
-        nsmap = {k: v for k, v in self.root.nsmap.items() if k}
+        nsmap = {k: v for k, v in ctx.root.nsmap.items() if k}
         nsmap.setdefault("xml", "http://www.w3.org/XML/1998/namespace")
 
-        for el in self.root.iter():
+        for el in ctx.root.iter():
             for attr_key in list(el.attrib):
                 local, prefix = self._split_qname(attr_key, nsmap)
                 qname = f"{prefix}:{local}" if prefix else local
@@ -201,16 +211,16 @@ class XMLCleaner:  # noqa: D101
                         break
 
     @_needs_root
-    def _remove_cdata(self, _):
-        for el in self.root.iter():
+    def _remove_cdata(self, ctx, _):
+        for el in ctx.root.iter():
             if el.text is not None:
                 el.text = html.unescape(str(el.text))
             if el.tail is not None:
                 el.tail = html.unescape(str(el.tail))
 
     @_needs_root
-    def _collapse_whitespace(self, _):
-        for txt in self.root.xpath("//text()"):
+    def _collapse_whitespace(self, ctx, _):
+        for txt in ctx.root.xpath("//text()"):
             new = _normalize_ws(str(txt))
             if new != str(txt):
                 parent = txt.getparent()
@@ -220,8 +230,8 @@ class XMLCleaner:  # noqa: D101
                     parent.text = new
 
     @_needs_root
-    def _remove_duplicate_siblings(self, _):
-        for parent in self.root.iter():
+    def _remove_duplicate_siblings(self, ctx, _):
+        for parent in ctx.root.iter():
             seen: Set[str] = set()
             for child in list(parent):
                 rep = etree.tostring(child, encoding="unicode")
@@ -231,13 +241,13 @@ class XMLCleaner:  # noqa: D101
                     seen.add(rep)
 
     @_needs_root
-    def _remove_empty_tags(self, _):
-        self._strip_blank_text_nodes(self.root)
+    def _remove_empty_tags(self, ctx, _):
+        self._strip_blank_text_nodes(ctx.root)
         while True:
             empty = [
                 el
-                for el in self.root.iter()
-                if len(el) == 0 and not (el.text or "").strip() and el is not self.root
+                for el in ctx.root.iter()
+                if len(el) == 0 and not (el.text or "").strip() and el is not ctx.root
             ]
             if not empty:
                 break
@@ -253,7 +263,7 @@ class XMLCleaner:  # noqa: D101
                         prev.tail = (prev.tail or "") + tail
                     else:
                         parent.text = (parent.text or "") + tail
-            self._strip_blank_text_nodes(self.root)
+            self._strip_blank_text_nodes(ctx.root)
 
 
     @staticmethod
@@ -273,5 +283,6 @@ class XMLCleaner:  # noqa: D101
         return attr_key, None
 
 
-    def _prepare_patterns(self, raw) -> Tuple[str, ...]:
-        return tuple(process_wildcard_words(self._xml_text or "", raw))
+    @staticmethod
+    def _prepare_patterns(ctx: _XMLCleanContext, raw) -> Tuple[str, ...]:
+        return tuple(process_wildcard_words(ctx.xml_text or "", raw))
@@ -0,0 +1,261 @@
+# SPDX-FileCopyrightText: 2024–2025 Mattia Rubino
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from textwizard.utils.errors.errors import ValidationError
+from textwizard.wizard_extractors.extraction_text import TextExtractor
+from textwizard.wizard_extractors.utils.ocr_cache import OcrCache, resolve_ocr_cache
+
+__all__ = ["BatchExtractionResult", "BatchExtractor"]
+
+InputLike = Union[str, bytes, Path]
+BatchItem = Union[InputLike, Tuple[InputLike, Optional[str]]]
+_Task = Tuple[int, InputLike, Optional[str]]
+
+# How many tasks may be queued per worker before we stop submitting.
+# Keeps memory bounded when `inputs` is a long generator of byte blobs.
+_INFLIGHT_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class BatchExtractionResult:
+    """
+    Outcome of a single batch item.
+
+    Attributes
+    ----------
+    index : int
+        Position of the item in the input iterable (0-based).
+    source : str | None
+        Path of the item, or ``None`` for in-memory inputs.
+    text : str | None
+        Extracted text, ``None`` if extraction failed.
+    error : str | None
+        Error message if extraction failed.
+    error_type : str | None
+        Exception class name if extraction failed.
+    """
+    index: int
+    source: Optional[str]
+    text: Optional[str] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# Per-process extractor, created once by the pool initializer so every
+# worker keeps its own reader instances across tasks.
+_WORKER_EXTRACTOR: Optional[TextExtractor] = None
+
+
+def _init_worker() -> None:
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = TextExtractor()
+
+
+def _new_pool(workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+
+def _failed(task: _Task, exc: BaseException) -> BatchExtractionResult:
+    index, data, _ = task
+    source = str(data) if isinstance(data, (str, Path)) else None
+    return BatchExtractionResult(index, source, error=str(exc), error_type=type(exc).__name__)
+
+
+def _collect(fut: Future, task: _Task, ready: List[BatchExtractionResult], suspects: List[_Task]) -> None:
+    try:
+        ready.append(fut.result())
+    except BrokenProcessPool:
+        suspects.append(task)
+    except Exception as exc:
+        ready.append(_failed(task, exc))
+
+
+def _run_isolated(tasks: List[_Task], options: Dict[str, Any]) -> List[BatchExtractionResult]:
+    # Runs each task alone in a single-worker pool, so a crash can only be
+    # blamed on the task that caused it.
+    results: List[BatchExtractionResult] = []
+    pool: Optional[ProcessPoolExecutor] = None
+    try:
+        for task in tasks:
+            if pool is None:
+                pool = _new_pool(1)
+            try:
+                results.append(pool.submit(_worker_task, *task, options).result())
+            except BrokenProcessPool as exc:
+                results.append(_failed(task, exc))
+                pool.shutdown(wait=True)
+                pool = None
+            except Exception as exc:
+                results.append(_failed(task, exc))
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+    return results
+
+
+def _run_one(
+    extractor: TextExtractor,
+    index: int,
+    input_data: InputLike,
+    extension: Optional[str],
+    options: Dict[str, Any],
+) -> BatchExtractionResult:
+    source = str(input_data) if isinstance(input_data, (str, Path)) else None
+    try:
+        text = extractor.data_extractor(input_data, extension, **options)
+    except Exception as exc:
+        # Exceptions are flattened to strings: several TextWizard errors
+        # have custom __init__ signatures and do not survive pickling.
+        return BatchExtractionResult(index, source, error=str(exc), error_type=type(exc).__name__)
+    return BatchExtractionResult(index, source, text=text)
+
+
+def _worker_task(
+    index: int,
+    input_data: InputLike,
+    extension: Optional[str],
+    options: Dict[str, Any],
+) -> BatchExtractionResult:
+    extractor = _WORKER_EXTRACTOR
+    if extractor is None:
+        _init_worker()
+        extractor = _WORKER_EXTRACTOR
+    return _run_one(extractor, index, input_data, extension, options)
+
+
+class BatchExtractor:
+    """
+    Fan-out of :meth:`TextExtractor.data_extractor` over a process pool.
+
+    Each worker process owns one ``TextExtractor``; failures are reported
+    per item through :class:`BatchExtractionResult` and never abort the batch.
+    If a worker dies, the pool is rebuilt and the items it may have taken down
+    are retried one at a time, so only the item that crashes is reported.
+    """
+
+    __slots__ = ("_local",)
+
+    def __init__(self, local: Optional[TextExtractor] = None) -> None:
+        self._local = local
+
+    @staticmethod
+    def _split_item(item: BatchItem, default_ext: Optional[str]) -> Tuple[InputLike, Optional[str]]:
+        if isinstance(item, tuple):
+            if len(item) != 2:
+                raise ValidationError("inputs", "tuple items must be (input_data, extension)", item)
+            data, ext = item
+            return data, ext if ext is not None else default_ext
+        return item, default_ext
+
+    def run(
+        self,
+        inputs: Iterable[BatchItem],
+        extension: Optional[str] = None,
+        pages_or_sheets: Optional[Union[int, str, List[Union[int, str]]]] = None,
+        ocr: bool = False,
+        language_ocr: str = "eng",
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        ocr_cache: Union[OcrCache, str, Path, bool, None] = None,
+        ocr_mode: str = "images",
+        ocr_dpi: Union[int, str, None] = None,
+        ocr_regions: bool = False,
+        xlsx_streaming: bool = False,
+    ) -> Iterator[BatchExtractionResult]:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if not isinstance(workers, int) or workers < 1:
+            raise ValidationError("workers", "must be a positive integer", workers)
+
+        options = {
+            "pages_or_sheets": pages_or_sheets,
+            "ocr": ocr,
+            "language_ocr": language_ocr,
+            "ocr_cache": resolve_ocr_cache(ocr_cache),
+            "ocr_mode": ocr_mode,
+            "ocr_dpi": ocr_dpi,
+            "ocr_regions": ocr_regions,
+            "xlsx_streaming": xlsx_streaming,
+        }
+        items = ((i, *self._split_item(item, extension)) for i, item in enumerate(inputs))
+
+        if workers == 1:
+            return self._run_serial(items, options)
+        return self._run_pool(items, options, workers, ordered)
+
+    def _run_serial(self, items, options) -> Iterator[BatchExtractionResult]:
+        extractor = self._local or TextExtractor()
+        for index, data, ext in items:
+            yield _run_one(extractor, index, data, ext, options)
+
+    @staticmethod
+    def _run_pool(items, options, workers: int, ordered: bool) -> Iterator[BatchExtractionResult]:
+        max_inflight = workers * _INFLIGHT_PER_WORKER
+        pending: Dict[Future, _Task] = {}
+        done_buf: Dict[int, BatchExtractionResult] = {}
+        next_index = 0
+        exhausted = False
+
+        pool = _new_pool(workers)
+        try:
+            while True:
+                ready: List[BatchExtractionResult] = []
+                suspects: List[_Task] = []
+                # Buffered results waiting for a slow earlier item count
+                # against the window too, so ordered mode stays bounded.
+                while not exhausted and len(pending) + len(done_buf) < max_inflight:
+                    try:
+                        task = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    try:
+                        fut = pool.submit(_worker_task, *task, options)
+                    except BrokenProcessPool:
+                        suspects.append(task)
+                        break
+                    pending[fut] = task
+
+                if not pending and not suspects:
+                    break
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    _collect(fut, pending.pop(fut), ready, suspects)
+
+                if suspects:
+                    # A worker died (e.g. segfault or OOM in a native reader)
+                    # and took the pool with it: every unfinished task fails
+                    # alike. Collect the rest, start over with a fresh pool and
+                    # retry the suspects one by one to find the culprit.
+                    wait(pending)
+                    for fut, task in pending.items():
+                        _collect(fut, task, ready, suspects)
+                    pending.clear()
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    ready.extend(_run_isolated(sorted(suspects, key=lambda t: t[0]), options))
+                    pool = _new_pool(workers)
+
+                for res in ready:
+                    if not ordered:
+                        yield res
+                    else:
+                        done_buf[res.index] = res
+                while next_index in done_buf:
+                    yield done_buf.pop(next_index)
+                    next_index += 1
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
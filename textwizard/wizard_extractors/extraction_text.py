@@ -1,9 +1,10 @@
 # SPDX-FileCopyrightText: 2024–2025 Mattia Rubino
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import importlib
 import io
 from pathlib import Path
-from typing import Union, Optional, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from textwizard.utils.errors.errors import (
     FileNotFoundCustomError,
@@ -11,15 +12,25 @@ from textwizard.utils.errors.errors import (
     DocFileAsBytesError,
     InvalidPagesError,
 )
-from textwizard.wizard_extractors.tool.docx_reader import DocxReader
-from textwizard.wizard_extractors.tool.txt_reader import TxtReader
-from textwizard.wizard_extractors.tool.doc_reader import DocReader
-from textwizard.wizard_extractors.tool.pdf_reader import PdfReader
-from textwizard.wizard_extractors.tool.image_format_reader import ImgReader
-from textwizard.wizard_extractors.tool.xlsx_xls_reader import XlsxReader
-from textwizard.wizard_extractors.tool.csv_reader import CsvReader
-from textwizard.wizard_extractors.tool.html_reader import HtmlReader
-from textwizard.wizard_extractors.tool.json_reader import JsonReader
+from textwizard.wizard_extractors.utils.ocr_cache import OcrCache, resolve_ocr_cache
+
+# Reader name → (module, class). Modules are imported on first use, so
+# extracting a CSV never loads fitz and extracting a PDF never loads pandas.
+_READERS: Dict[str, Tuple[str, str]] = {
+    "pdf": ("textwizard.wizard_extractors.tool.pdf_reader", "PdfReader"),
+    "doc": ("textwizard.wizard_extractors.tool.doc_reader", "DocReader"),
+    "docx": ("textwizard.wizard_extractors.tool.docx_reader", "DocxReader"),
+    "xlsx": ("textwizard.wizard_extractors.tool.xlsx_xls_reader", "XlsxReader"),
+    "txt": ("textwizard.wizard_extractors.tool.txt_reader", "TxtReader"),
+    "img": ("textwizard.wizard_extractors.tool.image_format_reader", "ImgReader"),
+    "csv": ("textwizard.wizard_extractors.tool.csv_reader", "CsvReader"),
+    "html": ("textwizard.wizard_extractors.tool.html_reader", "HtmlReader"),
+    "json": ("textwizard.wizard_extractors.tool.json_reader", "JsonReader"),
+}
+
+# Readers that open a filesystem path themselves instead of needing the
+# whole file in memory.
+_PATH_READERS = frozenset({"pdf", "docx", "xlsx", "xls"})
 
 
 class TextExtractor:
@@ -28,15 +39,15 @@ class TextExtractor:
     """
 
     def __init__(self) -> None:
-        self._pdf = PdfReader()
-        self._doc = DocReader()
-        self._docx = DocxReader()
-        self._xlsx = XlsxReader()
-        self._txt = TxtReader()
-        self._img = ImgReader()
-        self._csv = CsvReader()
-        self._html = HtmlReader()
-        self._json = JsonReader()
+        self._readers: Dict[str, Any] = {}
+
+    def _reader(self, name: str) -> Any:
+        reader = self._readers.get(name)
+        if reader is None:
+            module, cls = _READERS[name]
+            reader = getattr(importlib.import_module(module), cls)()
+            self._readers[name] = reader
+        return reader
 
     @staticmethod
     def _validate_selector(sel):
@@ -56,12 +67,19 @@ class TextExtractor:
             List[Union[int, str]]]] = None,
             ocr: bool = False,
             language_ocr: str = "eng",
+            ocr_workers: int = 1,
+            ocr_cache: Union[OcrCache, str, Path, bool, None] = None,
+            ocr_mode: str = "images",
+            ocr_dpi: Union[int, str, None] = None,
+            ocr_regions: bool = False,
+            xlsx_streaming: bool = False,
     ) -> str:
 
         # 1) Validate & canonicalize pages
         selector = self._validate_selector(pages_or_sheets)
+        cache = resolve_ocr_cache(ocr_cache)
 
-        # 2) Normalize input_data → always bytes (or path for .doc)
+        # 2) Normalize input_data → bytes-like (or path for .doc/.pdf/.docx)
         if isinstance(input_data, (str, Path)):
             path = Path(input_data)
             if not path.exists():
@@ -70,11 +88,13 @@ class TextExtractor:
             if ext == "doc":
                 # .doc reader needs a file path
                 raw = str(path)
+            elif ext in _PATH_READERS:
+                raw = path
             else:
                 raw = path.read_bytes()
             extension = ext
         else:
-            # input is bytes
+            # input is bytes / bytearray / memoryview
             if extension is None:
                 raise UnsupportedExtensionError(None)
             extension = extension.lower()
@@ -84,24 +104,24 @@ class TextExtractor:
 
         # 3) Dispatch
         reader_map = {
-            "pdf": lambda: self._pdf.pdf_reader(io.BytesIO(raw), pages_list=selector, ocr=ocr, language_ocr=language_ocr),
-            "doc": lambda: self._doc.doc_reader(raw),
-            "docx": lambda: self._docx.docx_reader(io.BytesIO(raw), pages_list=selector, ocr=ocr, language_ocr=language_ocr),
-            "xlsx": lambda: self._xlsx.xlsx_reader(io.BytesIO(raw), sheets=selector),
-            "xls": lambda: self._xlsx.xlsx_reader(io.BytesIO(raw), sheets=selector),
-            "txt": lambda: self._txt.txt_reader(io.BytesIO(raw), pages=selector),
+            "pdf": lambda: self._reader("pdf").pdf_reader(raw, pages_list=selector, ocr=ocr, language_ocr=language_ocr, ocr_workers=ocr_workers, ocr_cache=cache, ocr_mode=ocr_mode, ocr_dpi=ocr_dpi, ocr_regions=ocr_regions),
+            "doc": lambda: self._reader("doc").doc_reader(raw),
+            "docx": lambda: self._reader("docx").docx_reader(raw, pages_list=selector, ocr=ocr, language_ocr=language_ocr, ocr_cache=cache),
+            "xlsx": lambda: self._reader("xlsx").xlsx_reader(raw, sheets=selector, streaming=xlsx_streaming),
+            "xls": lambda: self._reader("xlsx").xlsx_reader(raw, sheets=selector, streaming=xlsx_streaming),
+            "txt": lambda: self._reader("txt").txt_reader(io.BytesIO(raw), pages=selector),
             # images: OCR only
-            "tif": lambda: self._img.image_format_reader(io.BytesIO(raw), pages=selector, language_ocr=language_ocr),
-            "tiff": lambda: self._img.image_format_reader(io.BytesIO(raw), pages=selector, language_ocr=language_ocr),
-            "jpg": lambda: self._img.image_format_reader(io.BytesIO(raw), language_ocr=language_ocr),
-            "jpeg": lambda: self._img.image_format_reader(io.BytesIO(raw), language_ocr=language_ocr),
-            "png": lambda: self._img.image_format_reader(io.BytesIO(raw), language_ocr=language_ocr),
-            "gif": lambda: self._img.image_format_reader(io.BytesIO(raw), language_ocr=language_ocr),
+            "tif": lambda: self._reader("img").image_format_reader(io.BytesIO(raw), pages=selector, language_ocr=language_ocr, ocr_cache=cache),
+            "tiff": lambda: self._reader("img").image_format_reader(io.BytesIO(raw), pages=selector, language_ocr=language_ocr, ocr_cache=cache),
+            "jpg": lambda: self._reader("img").image_format_reader(io.BytesIO(raw), language_ocr=language_ocr, ocr_cache=cache),
+            "jpeg": lambda: self._reader("img").image_format_reader(io.BytesIO(raw), language_ocr=language_ocr, ocr_cache=cache),
+            "png": lambda: self._reader("img").image_format_reader(io.BytesIO(raw), language_ocr=language_ocr, ocr_cache=cache),
+            "gif": lambda: self._reader("img").image_format_reader(io.BytesIO(raw), language_ocr=language_ocr, ocr_cache=cache),
             # text‐only readers ignore pages/ocr
-            "csv": lambda: self._csv.csv_reader(io.BytesIO(raw)),
-            "html": lambda: self._html.html_reader(io.BytesIO(raw)),
-            "htm": lambda: self._html.html_reader(io.BytesIO(raw)),
-            "json": lambda: self._json.json_reader(io.BytesIO(raw)),
+            "csv": lambda: self._reader("csv").csv_reader(io.BytesIO(raw)),
+            "html": lambda: self._reader("html").html_reader(io.BytesIO(raw)),
+            "htm": lambda: self._reader("html").html_reader(io.BytesIO(raw)),
+            "json": lambda: self._reader("json").json_reader(io.BytesIO(raw)),
         }
 
         if extension not in reader_map:
@@ -109,3 +129,35 @@ class TextExtractor:
 
         return reader_map[extension]()
 
+    def pdf_pages(
+            self,
+            input_data: Union[str, bytes, Path],
+            pages: Optional[Union[int, str, List[Union[int, str]]]] = None,
+            ocr: bool = False,
+            language_ocr: str = "eng",
+            ocr_workers: int = 1,
+            ocr_cache: Union[OcrCache, str, Path, bool, None] = None,
+            ocr_mode: str = "images",
+            ocr_dpi: Union[int, str, None] = None,
+            ocr_regions: bool = False,
+    ) -> Iterator[Tuple[int, str]]:
+        selector = self._validate_selector(pages)
+        cache = resolve_ocr_cache(ocr_cache)
+
+        if isinstance(input_data, (str, Path)):
+            path = Path(input_data)
+            if not path.exists():
+                raise FileNotFoundCustomError(path)
+            ext = path.suffix.lower().lstrip(".")
+            if ext != "pdf":
+                raise UnsupportedExtensionError(ext)
+            src = path
+        else:
+            src = input_data
+
+        return self._reader("pdf").iter_pages(
+            src, pages_list=selector, ocr=ocr, language_ocr=language_ocr,
+            ocr_workers=ocr_workers, ocr_cache=cache, ocr_mode=ocr_mode,
+            ocr_dpi=ocr_dpi, ocr_regions=ocr_regions,
+        )
+
@@ -3,27 +3,34 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import re
 import zipfile
 from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union,Callable
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union,Callable
 from collections import defaultdict
 import xml.etree.ElementTree as ET
 
 import fitz
-from azure.core.credentials import AzureKeyCredential               # type: ignore
-from azure.ai.documentintelligence import DocumentIntelligenceClient  # type: ignore
-from azure.ai.documentintelligence.models import AnalyzeResult        # type: ignore
+
+if TYPE_CHECKING:
+    from azure.ai.documentintelligence.models import AnalyzeResult        # type: ignore
 
 from textwizard.utils.errors.errors import (
     AzureCredentialsError,
     FileProcessingError,
     UnsupportedExtensionAzureError,
+    ValidationError,
 )
 
+# Default bound on the Azure calls one AsyncAzureOcr.extract() keeps in
+# flight: a DOCX with hundreds of images must not open hundreds of requests
+# at once and run into the service's rate limits.
+_MAX_CONCURRENT_CALLS = 8
+
 
 @dataclass(frozen=True)
 class KeyValue:
@@ -181,13 +188,106 @@ def _normalize_pages(pages: PagesLike) -> Optional[List[int]]:
 
 
 
+# ────────────────────────────────────────────────────────────────────────────
+#  Shared request/response handling
+# ────────────────────────────────────────────────────────────────────────────
+class _AzureOcrBase:
+    """Client-independent parts of :class:`AzureOcr` and :class:`AsyncAzureOcr`."""
+
+    __slots__ = ()
+
+    @staticmethod
+    def _check_model(model_id: str) -> None:
+        if model_id not in _SUPPORTED_MODELS:
+            raise ValueError("model_id must be 'prebuilt-read' or 'prebuilt-layout'")
+
+    def _normalize_source(self, src, ext) -> Tuple[bytes,str]:
+        if isinstance(src,(bytes,bytearray)) or hasattr(src,"read"):
+            if not ext: raise UnsupportedExtensionAzureError(None)
+            data = src.getvalue() if hasattr(src,"getvalue") else bytes(src)
+            return data, ext.lower()
+        path = Path(src)
+        if not path.exists():
+            raise FileProcessingError(f"File '{path}' not found")
+        return path.read_bytes(), path.suffix.lstrip(".").lower()
+
+    @staticmethod
+    def _call_kwargs(model_id, ext, lang, pages_str=None) -> Dict[str,Any]:
+        kwargs: Dict[str,Any] = {
+            "content_type": f"image/{ext}" if ext in _IMG_EXT else f"application/{ext}"
+        }
+        ln = _normalize_lang(lang)
+        if ln:         kwargs["locale"]   = ln
+        if pages_str:  kwargs["pages"]    = pages_str
+        if model_id!="prebuilt-read":
+            kwargs["features"] = _FEATURES_FOR_LAYOUT
+        return kwargs
+
+    @staticmethod
+    def _hybrid_plan(blob, sel) -> Tuple[List[int], List[int], Dict[int, str]]:
+        """
+        Split the selected PDF pages into pages read natively and pages sent
+        to Azure. Returns (0-based selected pages, 1-based image pages,
+        native text by 0-based page).
+        """
+        doc = fitz.open(stream=blob, filetype="pdf")
+        try:
+            valid_1based = _filter_valid_pages(sel, doc.page_count)
+            all_idx = [p - 1 for p in valid_1based]  # 0-based
+            img_pages: list[int] = []  # 1-based per Azure
+            txt_map: dict[int, str] = {}
+
+            for i in all_idx:
+                pg = doc.load_page(i)
+                if pg.get_images(full=True):
+                    img_pages.append(i + 1)
+                else:
+                    txt_map[i] = pg.get_text() + "\n"
+            return all_idx, img_pages, txt_map
+        finally:
+            doc.close()
+
+    @staticmethod
+    def _hybrid_merge(all_idx, img_pages, txt_map, built: CloudExtractionResult) -> CloudExtractionResult:
+        out, queue = [], built.text_pages.copy()
+        for i in all_idx:
+            if (i + 1) in img_pages:
+                out.append(queue.pop(0) if queue else "")
+            else:
+                out.append(txt_map[i])
+
+        return CloudExtractionResult(
+            text_pages=out,
+            tables=built.tables,
+            _raw_key_value=built._raw_key_value,
+        )
+
+    def _build_result(self, res: AnalyzeResult, model_id: str) -> CloudExtractionResult:
+        pages = ["".join(line.content+"\n" for line in p.lines) for p in getattr(res,"pages",[])]
+        if model_id=="prebuilt-read":
+            return CloudExtractionResult(text_pages=pages)
+        tbls,kvs = [],[]
+        for t in getattr(res,"tables",[]) or []:
+            mat=[["" for _ in range(t.column_count)] for _ in range(t.row_count)]
+            for c in t.cells: mat[c.row_index][c.column_index]=c.content
+            tbls.append(mat)
+        for pair in getattr(res,"key_value_pairs",[]) or []:
+            if pair.key and pair.value:
+                kvs.append(KeyValue(pair.key.content.strip(),pair.value.content.strip()))
+        return CloudExtractionResult(text_pages=pages, tables=tbls, _raw_key_value=kvs)
+
+
 # ────────────────────────────────────────────────────────────────────────────
 #  AzureOcr client
 # ────────────────────────────────────────────────────────────────────────────
-class AzureOcr:
+class AzureOcr(_AzureOcrBase):
     __slots__ = ("_client",)
 
     def __init__(self, *, endpoint: str, key: str) -> None:
+        # The SDK is the optional "azure" extra, imported with the first client.
+        from azure.core.credentials import AzureKeyCredential               # type: ignore
+        from azure.ai.documentintelligence import DocumentIntelligenceClient  # type: ignore
+
         if not endpoint or not key:
             raise AzureCredentialsError()
         try:
@@ -208,8 +308,7 @@ class AzureOcr:
         pages: PagesLike = None,
         hybrid: bool = False,
     ) -> CloudExtractionResult:
-        if model_id not in _SUPPORTED_MODELS:
-            raise ValueError("model_id must be 'prebuilt-read' or 'prebuilt-layout'")
+        self._check_model(model_id)
         blob, ext = self._normalize_source(source, extension)
         pages_norm = _normalize_pages(pages)
         if   ext in _IMG_EXT:   return self._process_image(blob, model_id, ext, language_ocr)
@@ -217,25 +316,8 @@ class AzureOcr:
         elif ext in _DOCX_EXT:  return self._process_docx(blob, model_id, language_ocr, pages_norm)
         else: raise UnsupportedExtensionAzureError(ext)
 
-    def _normalize_source(self, src, ext) -> Tuple[bytes,str]:
-        if isinstance(src,(bytes,bytearray)) or hasattr(src,"read"):
-            if not ext: raise UnsupportedExtensionAzureError(None)
-            data = src.getvalue() if hasattr(src,"getvalue") else bytes(src)
-            return data, ext.lower()
-        path = Path(src)
-        if not path.exists():
-            raise FileProcessingError(f"File '{path}' not found")
-        return path.read_bytes(), path.suffix.lstrip(".").lower()
-
     def _make_call(self, blob, model_id, ext, lang, pages_str=None) -> AnalyzeResult:
-        kwargs: Dict[str,Any] = {
-            "content_type": f"image/{ext}" if ext in _IMG_EXT else f"application/{ext}"
-        }
-        ln = _normalize_lang(lang)
-        if ln:         kwargs["locale"]   = ln
-        if pages_str:  kwargs["pages"]    = pages_str
-        if model_id!="prebuilt-read":
-            kwargs["features"] = _FEATURES_FOR_LAYOUT
+        kwargs = self._call_kwargs(model_id, ext, lang, pages_str)
         return self._client.begin_analyze_document(model_id, blob, **kwargs).result()
 
     def _process_image(self, blob, model_id, ext, lang):
@@ -250,72 +332,146 @@ class AzureOcr:
         return self._build_result(res, model_id)
 
     def _pdf_hybrid(self, blob, model_id, lang, sel):
-        doc = fitz.open(stream=blob, filetype="pdf")
-        try:
-            valid_1based = _filter_valid_pages(sel, doc.page_count)
-            if not valid_1based:
-                return CloudExtractionResult(text_pages=[])
+        all_idx, img_pages, txt_map = self._hybrid_plan(blob, sel)
+        if not all_idx:
+            return CloudExtractionResult(text_pages=[])
+        if not img_pages:
+            return CloudExtractionResult(text_pages=[txt_map[i] for i in all_idx])
+        if len(img_pages) == len(all_idx):
+            return self._process_pdf(blob, model_id, lang, img_pages, False)
+
+        pages_str = _pages_list_to_string(img_pages)
+        az = self._make_call(blob, model_id, "pdf", lang, pages_str)
+        return self._hybrid_merge(all_idx, img_pages, txt_map, self._build_result(az, model_id))
 
-            all_idx = [p - 1 for p in valid_1based]  # 0-based
-            img_pages: list[int] = []  # 1-based per Azure
-            txt_map: dict[int, str] = {}
+    def _process_docx(self, blob, model_id, lang, pages):
+        parser = _DocxParser(
+            parent=self,
+            blob=blob,
+            model_id=model_id,
+            lang=lang or "eng",
+            pages_sel=pages,
+        )
+        return parser.extract()
 
-            for i in all_idx:
-                pg = doc.load_page(i)
-                if pg.get_images(full=True):
-                    img_pages.append(i + 1)
-                else:
-                    txt_map[i] = pg.get_text() + "\n"
 
-            if not img_pages:
-                return CloudExtractionResult(text_pages=[txt_map[i] for i in all_idx])
+# ────────────────────────────────────────────────────────────────────────────
+#  AsyncAzureOcr client
+# ────────────────────────────────────────────────────────────────────────────
+class AsyncAzureOcr(_AzureOcrBase):
+    """
+    :class:`AzureOcr` on the ``azure.ai.documentintelligence.aio`` client.
 
-            if len(img_pages) == len(all_idx):
-                return self._process_pdf(blob, model_id, lang, img_pages, False)
+    Azure calls are awaited instead of blocking a thread; the images of a
+    DOCX are analysed concurrently, at most ``max_concurrency`` at a time.
+    Local work (reading the file, PyMuPDF page triage for hybrid PDFs) runs
+    in a worker thread. Use as an async context manager, or call
+    :meth:`close` when done.
+    """
 
-            pages_str = _pages_list_to_string(img_pages)
-            az = self._make_call(blob, model_id, "pdf", lang, pages_str)
-            built = self._build_result(az, model_id)
+    __slots__ = ("_client", "_max_concurrency")
 
-            out, queue = [], built.text_pages.copy()
-            for i in all_idx:
-                if (i + 1) in img_pages:
-                    out.append(queue.pop(0) if queue else "")
-                else:
-                    out.append(txt_map[i])
+    def __init__(self, *, endpoint: str, key: str, max_concurrency: int = _MAX_CONCURRENT_CALLS) -> None:
+        if not isinstance(max_concurrency, int) or isinstance(max_concurrency, bool) or max_concurrency < 1:
+            raise ValidationError("max_concurrency", "must be a positive integer", max_concurrency)
+        self._max_concurrency = max_concurrency
+        # The SDK is the optional "azure" extra, imported with the first client.
+        from azure.core.credentials import AzureKeyCredential               # type: ignore
+        from azure.ai.documentintelligence.aio import (                       # type: ignore
+            DocumentIntelligenceClient as AsyncDocumentIntelligenceClient,
+        )
 
-            return CloudExtractionResult(
-                text_pages=out,
-                tables=built.tables,
-                _raw_key_value=built._raw_key_value,
+        if not endpoint or not key:
+            raise AzureCredentialsError()
+        try:
+            self._client = AsyncDocumentIntelligenceClient(
+                endpoint=endpoint,
+                credential=AzureKeyCredential(key),
             )
-        finally:
-            doc.close()
-            
-    def _process_docx(self, blob, model_id, lang, pages):
+        except Exception as exc:
+            raise AzureCredentialsError() from exc
+
+    async def __aenter__(self) -> "AsyncAzureOcr":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    async def extract(
+        self,
+        source: Union[str, bytes, Path, io.BytesIO],
+        *,
+        model_id: str = "prebuilt-read",
+        extension: Optional[str] = None,
+        language_ocr: Optional[str] = None,
+        pages: PagesLike = None,
+        hybrid: bool = False,
+    ) -> CloudExtractionResult:
+        self._check_model(model_id)
+        blob, ext = await asyncio.to_thread(self._normalize_source, source, extension)
+        pages_norm = _normalize_pages(pages)
+        if   ext in _IMG_EXT:   return await self._process_image(blob, model_id, ext, language_ocr)
+        elif ext in _PDF_EXT:   return await self._process_pdf(blob, model_id, language_ocr, pages_norm, hybrid)
+        elif ext in _DOCX_EXT:  return await self._process_docx(blob, model_id, language_ocr, pages_norm)
+        else: raise UnsupportedExtensionAzureError(ext)
+
+    async def _make_call(self, blob, model_id, ext, lang, pages_str=None) -> AnalyzeResult:
+        kwargs = self._call_kwargs(model_id, ext, lang, pages_str)
+        poller = await self._client.begin_analyze_document(model_id, blob, **kwargs)
+        return await poller.result()
+
+    async def _process_image(self, blob, model_id, ext, lang):
+        res = await self._make_call(blob, model_id, ext, lang)
+        return self._build_result(res, model_id)
+
+    async def _process_pdf(self, blob, model_id, lang, pages, hybrid):
+        if hybrid:
+            return await self._pdf_hybrid(blob, model_id, lang, pages)
+        pages_str = _pages_list_to_string(list(pages)) if pages else None
+        res = await self._make_call(blob, model_id, "pdf", lang, pages_str)
+        return self._build_result(res, model_id)
+
+    async def _pdf_hybrid(self, blob, model_id, lang, sel):
+        all_idx, img_pages, txt_map = await asyncio.to_thread(self._hybrid_plan, blob, sel)
+        if not all_idx:
+            return CloudExtractionResult(text_pages=[])
+        if not img_pages:
+            return CloudExtractionResult(text_pages=[txt_map[i] for i in all_idx])
+        if len(img_pages) == len(all_idx):
+            return await self._process_pdf(blob, model_id, lang, img_pages, False)
+
+        pages_str = _pages_list_to_string(img_pages)
+        az = await self._make_call(blob, model_id, "pdf", lang, pages_str)
+        return self._hybrid_merge(all_idx, img_pages, txt_map, self._build_result(az, model_id))
+
+    async def _process_docx(self, blob, model_id, lang, pages):
+        lang = lang or "eng"
         parser = _DocxParser(
             parent=self,
             blob=blob,
             model_id=model_id,
-            lang=lang or "eng",
+            lang=lang,
             pages_sel=pages,
         )
+        # OCR every referenced image concurrently, with at most
+        # max_concurrency calls in flight, then let the parser assemble the
+        # text from its (now complete) cache. Image bytes are read under the
+        # semaphore, so only the images being analysed are held in memory.
+        limit = asyncio.Semaphore(self._max_concurrency)
+
+        async def _ocr(target: str):
+            async with limit:
+                img_bytes = parser.read_image(target)
+                res = await self._make_call(img_bytes, model_id, Path(target).suffix.lstrip("."), lang)
+            return target, self._build_result(res, model_id)
+
+        done = await asyncio.gather(*(_ocr(t) for t in parser.image_targets()))
+        parser.add_ocr_results(done)
         return parser.extract()
 
-    def _build_result(self, res: AnalyzeResult, model_id: str) -> CloudExtractionResult:
-        pages = ["".join(line.content+"\n" for line in p.lines) for p in getattr(res,"pages",[])]
-        if model_id=="prebuilt-read":
-            return CloudExtractionResult(text_pages=pages)
-        tbls,kvs = [],[]
-        for t in getattr(res,"tables",[]) or []:
-            mat=[["" for _ in range(t.column_count)] for _ in range(t.row_count)]
-            for c in t.cells: mat[c.row_index][c.column_index]=c.content
-            tbls.append(mat)
-        for pair in getattr(res,"key_value_pairs",[]) or []:
-            if pair.key and pair.value:
-                kvs.append(KeyValue(pair.key.content.strip(),pair.value.content.strip()))
-        return CloudExtractionResult(text_pages=pages, tables=tbls, _raw_key_value=kvs)
-
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -323,7 +479,7 @@ class AzureOcr:
 # ────────────────────────────────────────────────────────────────────
 
 class _DocxParser:
-    def __init__(self, parent: "AzureOcr", blob: bytes,
+    def __init__(self, parent: "_AzureOcrBase", blob: bytes,
                  model_id: str, lang: str, pages_sel: Sequence[int] | None,
                  debug: bool = False) -> None:
         self._parent  = parent
@@ -342,12 +498,37 @@ class _DocxParser:
 
         self._load_relationships()
 
+    def _parts(self) -> List[Tuple[str, bytes]]:
+        return [(n, self._zf.read(n)) for n in sorted(self._zf.namelist())
+                if n.endswith(".xml") and (
+                       n == "word/document.xml"
+                       or _HEADER_RX.fullmatch(n)
+                       or _FOOTER_RX.fullmatch(n))]
+
+    def image_targets(self) -> List[str]:
+        """Distinct images referenced by the document and present in it."""
+        found: Dict[str, None] = {}
+        for _name, data in self._parts():
+            for _ev, el in ET.iterparse(io.BytesIO(data), events=("end",)):
+                tag = el.tag
+                if tag == qn("a","blip"):
+                    rid = el.get(qn("r","embed"))
+                elif tag == qn("v","imagedata"):
+                    rid = el.get(qn("r","id"))
+                else:
+                    rid = None
+                el.clear()
+                target = self._rels.get(rid) if rid else None
+                if target and target not in found and self._image_member(target) in self._zf.NameToInfo:
+                    found[target] = None
+        return list(found)
+
+    def add_ocr_results(self, results: Sequence[Tuple[str, CloudExtractionResult]]) -> None:
+        """Record OCR results by image target, for :meth:`extract` to use."""
+        self._ocr_cache.update(results)
+
     def extract(self) -> CloudExtractionResult:
-        parts = [(n, self._zf.read(n)) for n in sorted(self._zf.namelist())
-                 if n.endswith(".xml") and (
-                        n == "word/document.xml"
-                        or _HEADER_RX.fullmatch(n)
-                        or _FOOTER_RX.fullmatch(n))]
+        parts = self._parts()
 
         emit = self._buf.append
         for _name, data in parts:
@@ -400,10 +581,8 @@ class _DocxParser:
             return
         target = self._rels[rid]
         if target not in self._ocr_cache:
-            member = f"word/{target}" if not target.startswith("word/") else target
-            try:
-                img_bytes = self._zf.read(member)
-            except KeyError:                      
+            img_bytes = self.read_image(target)
+            if img_bytes is None:
                 return
             res = self._parent._make_call(
                 img_bytes, self._model, Path(target).suffix.lstrip("."), self._lang
@@ -415,3 +594,13 @@ class _DocxParser:
         self._kvs.extend(ocr_res._raw_key_value)
 
         emit("\n" + ocr_res.text.strip() + "\n")
+
+    @staticmethod
+    def _image_member(target: str) -> str:
+        return f"word/{target}" if not target.startswith("word/") else target
+
+    def read_image(self, target: str) -> Optional[bytes]:
+        try:
+            return self._zf.read(self._image_member(target))
+        except KeyError:
+            return None
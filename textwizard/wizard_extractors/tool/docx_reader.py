@@ -13,6 +13,7 @@ from textwizard.utils.errors.errors import (
     ImageProcessingError,
     OCRNotConfiguredError,
 )
+from textwizard.wizard_extractors.utils.ocr_cache import OcrCache, ocr_cache_key
 from textwizard.wizard_extractors.utils.selector import  normalize_pages_selector
 
 _NS = {
@@ -40,6 +41,7 @@ class _Extractor:
     zf: zipfile.ZipFile
     lang: str
     do_ocr: bool
+    cache: Optional[OcrCache] = None
 
     _rels: Dict[str, str]  = field(init=False, default_factory=dict)
     _ocr:  Dict[str, str]  = field(init=False, default_factory=dict)
@@ -93,10 +95,18 @@ class _Extractor:
             member = f"word/{tgt}" if not tgt.startswith("word/") else tgt
             try:
                 data = self.zf.read(member)
+                key = None
+                if self.cache is not None:
+                    key = ocr_cache_key("docx-image", data, 0, self.lang)
+                    if (txt := self.cache.get(key)) is not None:
+                        self._ocr[tgt] = txt
+                        continue
                 with PILImage.open(io.BytesIO(data)) as im:
                     txt = pytesseract.image_to_string(im, lang=self.lang).strip() or "[Empty OCR]"
             except Exception as exc:
                 raise ImageProcessingError(f"OCR failed on {member}: {exc}") from exc
+            if key is not None:
+                self.cache.put(key, txt)
             self._ocr[tgt] = txt
 
     def _ocr_for_rid(self, rid: str | None) -> str | None:
@@ -143,6 +153,7 @@ class DocxReader:
         pages_list: Optional[Sequence[Union[int, str]]] = None,  # 1, "3-5", "1,3,5-7", [...]
         ocr: bool = False,
         language_ocr: str = "eng",
+        ocr_cache: Optional[OcrCache] = None,
     ) -> str:
         zf = self._open_zip(docx_source)
         try:
@@ -156,7 +167,7 @@ class DocxReader:
                 )
             ]
 
-            ext = _Extractor(zf, language_ocr, ocr)
+            ext = _Extractor(zf, language_ocr, ocr, ocr_cache)
             pages = ext.run(xml_parts) 
 
             idx = normalize_pages_selector(pages_list, len(pages))
@@ -167,7 +178,7 @@ class DocxReader:
     @staticmethod
     def _open_zip(src):
         try:
-            if isinstance(src, (bytes, bytearray)):
+            if isinstance(src, (bytes, bytearray, memoryview)):
                 return zipfile.ZipFile(io.BytesIO(src))
             if hasattr(src, "read"):
                 return zipfile.ZipFile(src)
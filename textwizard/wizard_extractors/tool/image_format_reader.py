@@ -2,10 +2,11 @@
 # © 2024–2025 Mattia Rubino
 
 import io
-from typing import IO, Sequence, Union
+from typing import IO, Optional, Sequence, Union
 
 from PIL import Image, UnidentifiedImageError
 from textwizard.utils.errors.errors import ImageProcessingError, OCRNotConfiguredError
+from textwizard.wizard_extractors.utils.ocr_cache import OcrCache, ocr_cache_key
 from textwizard.wizard_extractors.utils.selector import  normalize_pages_selector  # <- your shared util
 
 
@@ -20,10 +21,12 @@ class ImgReader:
         *,
         pages: Sequence[Union[int, str]] | None = None,  # 1-based ints / "csv" / "a-b"
         language_ocr: str = "eng",
+        ocr_cache: Optional[OcrCache] = None,
     ) -> str:
         """
         Return concatenated OCR text. Invalid/out-of-range frame selectors are ignored.
         If no selected frames exist, returns an empty string.
+        With *ocr_cache*, frames whose pixels were OCRed before are served from the cache.
         """
         try:
             img = Image.open(content)
@@ -46,8 +49,18 @@ class ImgReader:
                 try:
                     img.seek(i)
                     frame = img.convert("RGB")  
-                    text = pytesseract.image_to_string(frame, lang=language_ocr)
-                    out.append(text.strip())
+                    key = None
+                    if ocr_cache is not None:
+                        w, h = frame.size
+                        key = ocr_cache_key(f"image-{w}x{h}", frame.tobytes(), 0, language_ocr)
+                        text = ocr_cache.get(key)
+                        if text is not None:
+                            out.append(text)
+                            continue
+                    text = pytesseract.image_to_string(frame, lang=language_ocr).strip()
+                    if key is not None:
+                        ocr_cache.put(key, text)
+                    out.append(text)
                 except Exception as ocr_exc:
                     continue
 
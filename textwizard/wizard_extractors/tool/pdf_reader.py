@@ -3,19 +3,227 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
+import mmap
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import IO, List, Sequence, Union
+from typing import IO, Deque, Iterator, List, Optional, Sequence, Tuple, Union
 
 import fitz 
 
 from textwizard.utils.errors.errors import (
     FileProcessingError,
     OCRNotConfiguredError,
+    ValidationError,
 )
+from textwizard.wizard_extractors.utils.ocr_cache import OcrCache, ocr_cache_key
 from textwizard.wizard_extractors.utils.selector import  normalize_pages_selector
 
 __all__ = ["PdfReader"]
 
+PdfSource = Union[bytes, bytearray, memoryview, mmap.mmap, str, Path, IO[bytes]]
+
+_OCR_MODES = ("images", "adaptive")
+
+# Adaptive OCR thresholds: a page is OCRed when its text layer has fewer
+# than _MIN_TEXT_CHARS characters, or when images cover at least
+# _MIN_IMAGE_COVERAGE of the page and almost no text overlaps them.
+_MIN_TEXT_CHARS = 32
+_MIN_IMAGE_COVERAGE = 0.5
+
+# How many pages may be pending per OCR worker before iter_pages waits for
+# the oldest one. Keeps memory bounded on long documents.
+_INFLIGHT_PER_WORKER = 4
+
+
+def _needs_ocr(page: fitz.Page, mode: str) -> bool:
+    if mode == "images":
+        return bool(page.get_images(full=True))
+
+    page_rect = page.rect
+    rects = [fitz.Rect(info["bbox"]) & page_rect for info in page.get_image_info()]
+    rects = [r for r in rects if not r.is_empty]
+    if not rects:
+        return False
+
+    words = page.get_text("words")
+    if sum(len(w[4]) for w in words) < _MIN_TEXT_CHARS:
+        return True  # scanned page or image-only page without a text layer
+
+    page_area = abs(page_rect) or 1.0
+    coverage = min(1.0, sum(abs(r) for r in rects) / page_area)
+    if coverage < _MIN_IMAGE_COVERAGE:
+        return False  # logos, icons, photos next to real text
+
+    # Large images: skip OCR only if the text layer actually lies on them
+    # (e.g. a searchable scan with an invisible text layer).
+    on_images = 0
+    for w in words:
+        wr = fitz.Rect(w[:4])
+        if any(r.intersects(wr) for r in rects):
+            on_images += len(w[4])
+    return on_images < _MIN_TEXT_CHARS
+
+
+# DPI bounds for ``ocr_dpi="auto"``: images are rendered at their native
+# resolution, but never below what Tesseract reads reliably nor above the
+# usual 300 DPI scan resolution.
+_MIN_AUTO_DPI = 150
+_MAX_AUTO_DPI = 300
+# Image regions smaller than this (in points, either side) are not OCRed.
+_MIN_REGION_SIDE = 8.0
+
+DpiSpec = Union[int, str]
+
+
+def _native_dpi(info: dict) -> float:
+    bbox = fitz.Rect(info["bbox"])
+    if bbox.is_empty:
+        return 0.0
+    return max(info["width"] * 72.0 / bbox.width, info["height"] * 72.0 / bbox.height)
+
+
+def _pick_dpi(dpi: DpiSpec, infos: Sequence[dict]) -> int:
+    if dpi != "auto":
+        return dpi
+    native = max((_native_dpi(i) for i in infos), default=_MAX_AUTO_DPI)
+    return int(min(_MAX_AUTO_DPI, max(_MIN_AUTO_DPI, round(native))))
+
+
+def _require_ocr() -> None:
+    try:
+        import pytesseract  # noqa: F401
+        from PIL import Image  # noqa: F401
+    except ModuleNotFoundError as exc:
+        raise OCRNotConfiguredError("OCR requested but pytesseract/Pillow not installed.") from exc
+
+
+def _render(page: fitz.Page, dpi: int, clip: Optional[fitz.Rect] = None) -> fitz.Pixmap:
+    try:
+        return page.get_pixmap(dpi=dpi, clip=clip)
+    except Exception as exc:
+        raise FileProcessingError(f"Cannot render page for OCR: {exc}") from exc
+
+
+def _ocr_pixmap(pix: fitz.Pixmap, lang: str) -> str:
+    _require_ocr()
+    try:
+        with fitz.open("pdf", pix.pdfocr_tobytes(language=lang)) as ocr_doc:
+            return ocr_doc[0].get_text()
+    except Exception as exc:
+        raise FileProcessingError(f"OCR failed: {exc}") from exc
+
+
+def _ocr_page(
+    page: fitz.Page,
+    dpi: DpiSpec,
+    lang: str,
+    cache: Optional[OcrCache] = None,
+    regions: bool = False,
+) -> str:
+    if regions:
+        return _ocr_regions(page, dpi, lang, cache)
+    if dpi == "auto":
+        dpi = _pick_dpi(dpi, page.get_image_info())
+
+    # The page is rasterised once: the same pixmap keys the cache and is OCRed.
+    pix = _render(page, dpi)
+    key = None
+    if cache is not None:
+        key = ocr_cache_key("pdf-page", pix.samples_mv, dpi, lang)
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+    text = _ocr_pixmap(pix, lang)
+    del pix
+
+    if key is not None:
+        cache.put(key, text)
+    return text
+
+
+def _ocr_regions(page: fitz.Page, dpi: DpiSpec, lang: str, cache: Optional[OcrCache]) -> str:
+    """
+    Native text of *page* followed by the OCR text of each embedded image,
+    rendered clipped to the image bbox instead of rasterizing the whole page.
+    """
+    parts = [page.get_text()]
+    page_rect = page.rect
+    infos = sorted(page.get_image_info(), key=lambda i: (i["bbox"][1], i["bbox"][0]))
+    for info in infos:
+        clip = fitz.Rect(info["bbox"]) & page_rect
+        if clip.is_empty or min(clip.width, clip.height) < _MIN_REGION_SIDE:
+            continue
+        region_dpi = _pick_dpi(dpi, (info,))
+        pix = _render(page, region_dpi, clip)
+
+        key = None
+        if cache is not None:
+            key = ocr_cache_key("pdf-region", pix.samples_mv, region_dpi, lang)
+            hit = cache.get(key)
+            if hit is not None:
+                parts.append(hit)
+                continue
+
+        text = _ocr_pixmap(pix, lang)
+        del pix
+
+        if key is not None:
+            cache.put(key, text)
+        parts.append(text)
+    return "".join(parts)
+
+
+# ── parallel OCR workers ──────────────────────────────────────────
+# PyMuPDF holds the GIL while Tesseract runs, so pages are OCRed in
+# separate processes. Workers only receive a filename: each one opens the
+# document once and keeps it for all its pages, and MuPDF reads the file
+# on demand instead of every worker holding a copy of the PDF.
+_WORKER_DOC: Optional[fitz.Document] = None
+_WORKER_DPI: DpiSpec = 300
+_WORKER_CACHE: Optional[OcrCache] = None
+_WORKER_REGIONS: bool = False
+
+
+def _init_ocr_worker(
+    path: str,
+    dpi: DpiSpec,
+    cache: Optional[OcrCache],
+    regions: bool = False,
+) -> None:
+    global _WORKER_DOC, _WORKER_DPI, _WORKER_CACHE, _WORKER_REGIONS
+    _WORKER_DOC = fitz.open(path, filetype="pdf")
+    _WORKER_DPI = dpi
+    _WORKER_CACHE = cache
+    _WORKER_REGIONS = regions
+
+
+def _ocr_worker_page(idx: int, lang: str) -> str:
+    return _ocr_page(_WORKER_DOC.load_page(idx), _WORKER_DPI, lang, _WORKER_CACHE, _WORKER_REGIONS)
+
+
+def _next_result(window: Deque[Tuple[int, Union[Future, str]]]) -> Tuple[int, str]:
+    idx, text = window.popleft()
+    return idx + 1, text if isinstance(text, str) else text.result()
+
+
+def _spill_to_file(buf: Union[bytes, memoryview]) -> str:
+    """Write an in-memory PDF to a temporary file the OCR workers can open."""
+    fd, path = tempfile.mkstemp(prefix="textwizard-ocr-", suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(buf)
+    except OSError as exc:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+        raise FileProcessingError(f"Cannot stage PDF for OCR workers: {exc}") from exc
+    return path
+
 
 class PdfReader:
     """
@@ -23,29 +231,37 @@ class PdfReader:
 
     Methods
     -------
-    pdf_reader(source, pages_list, ocr, language_ocr) -> str
+    pdf_reader(source, pages_list, ocr, language_ocr, ...) -> str
         Extract text from PDF bytes, path, or file-like.
+    iter_pages(source, pages_list, ocr, language_ocr, ...) -> Iterator[(int, str)]
+        Yield page text one page at a time.
     count_images(source) -> int
         Count embedded images in the PDF.
     """
 
     __slots__ = ("ocr_dpi",)
 
-    def __init__(self, ocr_dpi: int = 300) -> None:
-        self.ocr_dpi: int = ocr_dpi
+    def __init__(self, ocr_dpi: DpiSpec = 300) -> None:
+        self.ocr_dpi: DpiSpec = ocr_dpi
 
     def pdf_reader(
         self,
-        pdf_source: Union[bytes, str, Path, IO[bytes]],
+        pdf_source: PdfSource,
         pages_list: Sequence[Union[int, str]] | None = None,
         ocr: bool = False,
         language_ocr: str = "eng",
+        ocr_workers: int = 1,
+        ocr_cache: Optional[OcrCache] = None,
+        ocr_mode: str = "images",
+        ocr_dpi: Optional[DpiSpec] = None,
+        ocr_regions: bool = False,
     ) -> str:
         """
         Parameters
         ----------
-        pdf_source : bytes | str | Path | file-like
-            PDF content or path or open file.
+        pdf_source : bytes | bytearray | memoryview | mmap | str | Path | file-like
+            PDF content or path or open file. Paths are opened by filename and
+            buffers are used in place, so the document is never copied.
         pages_list : Sequence[int | str] | None
             Page selection (1-based). Accepts ints, ranges and CSV:
               • 1
@@ -58,6 +274,26 @@ class PdfReader:
             Enable OCR on pages with images.
         language_ocr : str
             Tesseract language code.
+        ocr_workers : int
+            Number of processes used to OCR image pages concurrently.
+            1 (default) OCRs pages sequentially in the calling process.
+            Results are always returned in page order.
+        ocr_cache : OcrCache | None
+            Cache of OCR results keyed by the rendered page, DPI and language.
+            Pages seen before are served from the cache without Tesseract.
+        ocr_mode : {"images", "adaptive"}
+            Which pages are OCRed when ``ocr`` is True:
+              • "images"   – every page that contains an image (default).
+              • "adaptive" – only pages whose native text layer is missing or
+                does not cover their large images; logos and photos next to
+                real text no longer trigger Tesseract.
+        ocr_dpi : int | "auto" | None
+            Render resolution for OCR. "auto" uses the native resolution of
+            the page images, clamped to 150–300 DPI. None = ``self.ocr_dpi``.
+        ocr_regions : bool
+            OCR only the embedded image regions (each clipped to its bbox)
+            and keep the native text of the rest of the page, instead of
+            rasterizing the full page.
 
         Returns
         -------
@@ -70,51 +306,153 @@ class PdfReader:
             On file I/O or parsing errors.
         OCRNotConfiguredError
             If OCR is requested but pytesseract/Pillow are missing.
+        ValidationError
+            If ``ocr_workers``, ``ocr_mode`` or ``ocr_dpi`` is invalid.
         """
-        raw = self._read_input(pdf_source)
+        pages = self.iter_pages(
+            pdf_source, pages_list, ocr, language_ocr, ocr_workers, ocr_cache, ocr_mode, ocr_dpi, ocr_regions
+        )
+        return "".join(text for _, text in pages)
 
-        try:
-            doc = fitz.open(stream=raw, filetype="pdf")
-        except Exception as exc:
-            raise FileProcessingError(f"Cannot open PDF: {exc}") from exc
+    def iter_pages(
+        self,
+        pdf_source: PdfSource,
+        pages_list: Sequence[Union[int, str]] | None = None,
+        ocr: bool = False,
+        language_ocr: str = "eng",
+        ocr_workers: int = 1,
+        ocr_cache: Optional[OcrCache] = None,
+        ocr_mode: str = "images",
+        ocr_dpi: Optional[DpiSpec] = None,
+        ocr_regions: bool = False,
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily yield ``(page_number, text)`` for each selected page.
+
+        Pages are decoded one at a time, so callers can start processing
+        before the whole document is read. ``page_number`` is 1-based.
+        Parameters and errors are the same as :meth:`pdf_reader`; the
+        document is closed when the generator is exhausted or closed.
+        """
+        if not isinstance(ocr_workers, int) or ocr_workers < 1:
+            raise ValidationError("ocr_workers", "must be a positive integer", ocr_workers)
+        if ocr_mode not in _OCR_MODES:
+            raise ValidationError("ocr_mode", f"must be one of {_OCR_MODES}", ocr_mode)
+        if ocr_dpi is None:
+            ocr_dpi = self.ocr_dpi
+        if ocr_dpi != "auto" and (not isinstance(ocr_dpi, int) or isinstance(ocr_dpi, bool) or ocr_dpi < 1):
+            raise ValidationError("ocr_dpi", 'must be a positive integer or "auto"', ocr_dpi)
 
+        doc, shared = self._open_document(pdf_source)
         try:
-            idxs: List[int] = normalize_pages_selector(pages_list, doc.page_count)
-            out: List[str] = []
+            idxs = normalize_pages_selector(pages_list, doc.page_count)
+            if ocr and ocr_workers > 1:
+                yield from self._iter_pages_parallel(
+                    doc, shared, idxs, language_ocr, ocr_workers, ocr_cache, ocr_mode, ocr_dpi, ocr_regions
+                )
+                return
             for idx in idxs:
                 page = doc.load_page(idx)
-                if not ocr:
-                    out.append(page.get_text() + "\n")
-                    continue
-                has_img = bool(page.get_images(full=True))
-                out.append(self._perform_ocr(page, language_ocr) if has_img else page.get_text() + "\n")
-            return "".join(out)
+                if ocr and _needs_ocr(page, ocr_mode):
+                    text = _ocr_page(page, ocr_dpi, language_ocr, ocr_cache, ocr_regions)
+                else:
+                    text = page.get_text() + "\n"
+                yield idx + 1, text
         finally:
             doc.close()
 
-    @staticmethod
-    def _read_input(src: Union[bytes, str, Path, IO[bytes]]) -> bytes:
-        if isinstance(src, (bytes, bytearray)):
-            return bytes(src)
-        if hasattr(src, "read"):
-            data = src.read()
-            return data if isinstance(data, (bytes, bytearray)) else bytes(data)
-        path = Path(src)
+    def _iter_pages_parallel(
+        self,
+        doc: fitz.Document,
+        shared: Union[str, bytes, memoryview],
+        idxs: List[int],
+        lang: str,
+        workers: int,
+        cache: Optional[OcrCache],
+        mode: str,
+        dpi: DpiSpec,
+        regions: bool,
+    ) -> Iterator[Tuple[int, str]]:
+        # Pages are inspected as the window advances: at most
+        # workers * _INFLIGHT_PER_WORKER are decided or OCRed ahead of the
+        # page being yielded, and the pool starts with the first OCR page.
+        max_ahead = workers * _INFLIGHT_PER_WORKER
+        window: Deque[Tuple[int, Union[Future, str]]] = deque()
+        pool: Optional[ProcessPoolExecutor] = None
+        spilled: Optional[str] = None
         try:
-            return path.read_bytes()
-        except Exception as exc:
-            raise FileProcessingError(f"Cannot read file {path!s}: {exc}") from exc
-        
-
-    def _perform_ocr(self, page: fitz.Page, lang: str) -> str:
+            for idx in idxs:
+                page = doc.load_page(idx)
+                if _needs_ocr(page, mode):
+                    if pool is None:
+                        # Paths are handed over as is; buffers are written once to a
+                        # temporary file rather than pickled into the initargs of every worker.
+                        spilled = None if isinstance(shared, str) else _spill_to_file(shared)
+                        pool = ProcessPoolExecutor(
+                            max_workers=min(workers, len(idxs)),
+                            initializer=_init_ocr_worker,
+                            initargs=(spilled or shared, dpi, cache, regions),
+                        )
+                    window.append((idx, pool.submit(_ocr_worker_page, idx, lang)))
+                else:
+                    window.append((idx, page.get_text() + "\n"))
+                del page
+                while window and (len(window) >= max_ahead or isinstance(window[0][1], str)):
+                    yield _next_result(window)
+            while window:
+                yield _next_result(window)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+            if spilled is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(spilled)
 
+    def _open_document(self, src: PdfSource) -> Tuple[fitz.Document, Union[str, bytes, memoryview]]:
+        """
+        Open *src* and return the document plus the filename or buffer it
+        was opened from, so OCR workers can reopen it by filename.
+        """
+        if isinstance(src, (str, Path)):
+            # MuPDF reads the file on demand; nothing is copied into Python memory.
+            try:
+                return fitz.open(str(src), filetype="pdf"), str(src)
+            except Exception as exc:
+                raise FileProcessingError(f"Cannot open PDF {src!s}: {exc}") from exc
+        buf = self._as_buffer(src)
         try:
-            import pytesseract  # noqa: F401
-            from PIL import Image  # noqa: F401
-        except ModuleNotFoundError as exc:
-            raise OCRNotConfiguredError("OCR requested but pytesseract/Pillow not installed.") from exc
-        try:
-            tpage = page.get_textpage_ocr(dpi=self.ocr_dpi, full=True, language=lang)
-            return page.get_text(textpage=tpage)
+            return fitz.open(stream=buf, filetype="pdf"), buf
         except Exception as exc:
-            raise FileProcessingError(f"OCR failed: {exc}") from exc
\ No newline at end of file
+            raise FileProcessingError(f"Cannot open PDF: {exc}") from exc
+
+    @staticmethod
+    def _as_buffer(src: PdfSource) -> Union[bytes, memoryview]:
+        """
+        Return a zero-copy view of in-memory or file-backed PDF data.
+
+        ``bytearray``, ``mmap`` and ``BytesIO`` are exposed through a
+        ``memoryview``; real files are memory-mapped. Only file-likes
+        without a file descriptor fall back to ``read()``.
+        """
+        if isinstance(src, bytes):
+            return src
+        if isinstance(src, (bytearray, memoryview, mmap.mmap)):
+            return memoryview(src).cast("B")
+        if isinstance(src, io.BytesIO):
+            return src.getbuffer()
+        if hasattr(src, "read"):
+            try:
+                fd = src.fileno()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                fd = None
+            if fd is not None:
+                try:
+                    return memoryview(mmap.mmap(fd, 0, access=mmap.ACCESS_READ))
+                except (OSError, ValueError):
+                    pass  # empty file, pipe, ...: read it below
+            try:
+                data = src.read()
+            except Exception as exc:
+                raise FileProcessingError(f"Cannot read PDF stream: {exc}") from exc
+            return data if isinstance(data, bytes) else memoryview(data).cast("B")
+        raise FileProcessingError(f"Unsupported PDF source type: {type(src).__name__}")
@@ -5,15 +5,15 @@ from __future__ import annotations
 
 import io
 from pathlib import Path
-from typing import Iterable, List, Sequence, Union
-
-import pandas as pd
+from typing import Iterable, Iterator, List, Sequence, Union
 
 from textwizard.utils.errors.errors import FileFormatError, FileProcessingError
 from textwizard.wizard_extractors.utils.selector import  normalize_sheets_selector 
 
 __all__ = ["XlsxReader"]
 
+_ZIP_MAGIC = b"PK\x03\x04"
+
 
 class XlsxReader:
     __slots__ = ()
@@ -23,12 +23,25 @@ class XlsxReader:
         source: Union[bytes, str, Path, io.BytesIO],
         *,
         sheets: Union[None, int, str, Iterable[int | str]] = None,
+        streaming: bool = False,
     ) -> str:
         """
         Extract plain text from Excel workbooks.
         - `sheets`: None = all sheets; otherwise accepts 0-based indices, names,
           and CSV/ranges inside strings (e.g. "0,2,4-6"). Invalid selectors are ignored.
+        - `streaming`: for .xlsx, read rows with openpyxl in read-only mode and
+          emit them tab-separated, without building DataFrames. Memory stays
+          flat on large sheets; columns are not padded as with `to_string`.
+          Legacy .xls workbooks always use pandas.
         """
+        if streaming:
+            buf = self._to_bytes_io(source) if not isinstance(source, (str, Path)) else source
+            if self._is_xlsx(buf):
+                return "\n".join(self.iter_lines(buf, sheets=sheets)).rstrip()
+            source = buf
+
+        import pandas as pd
+
         try:
             buf = self._to_bytes_io(source)
             xls = pd.ExcelFile(buf)
@@ -67,12 +80,75 @@ class XlsxReader:
 
         return "\n".join(out).rstrip()
 
+    def iter_lines(
+        self,
+        source: Union[bytes, str, Path, io.BytesIO],
+        *,
+        sheets: Union[None, int, str, Iterable[int | str]] = None,
+    ) -> Iterator[str]:
+        """
+        Yield the text of an .xlsx workbook line by line: a ``Sheet: <name>``
+        header, one tab-separated line per non-empty row, then a blank line.
+        Rows are streamed from the file by openpyxl's read-only parser.
+        """
+        from openpyxl import load_workbook
+
+        src = source if isinstance(source, (str, Path, io.BytesIO)) else self._to_bytes_io(source)
+        try:
+            wb = load_workbook(src, read_only=True, data_only=True)
+        except Exception as exc:
+            raise FileFormatError(f"Invalid Excel file: {exc}") from exc
+
+        try:
+            sheet_names = list(wb.sheetnames)
+            if sheets is None:
+                sel_idx = list(range(len(sheet_names)))
+            else:
+                sel_list = [sheets] if isinstance(sheets, (int, str)) else list(sheets)
+                sel_idx = normalize_sheets_selector(sel_list, sheet_names)
+
+            for i in sel_idx:
+                ws = wb[sheet_names[i]]
+                if not hasattr(ws, "iter_rows"):
+                    continue  # chartsheet
+                header = False
+                try:
+                    for row in ws.iter_rows(values_only=True):
+                        cells = ["" if v is None else str(v) for v in row]
+                        while cells and not cells[-1]:
+                            cells.pop()
+                        if not cells:
+                            continue
+                        if not header:
+                            yield f"Sheet: {sheet_names[i]}"
+                            header = True
+                        yield "\t".join(cells)
+                except Exception as exc:
+                    raise FileProcessingError(f"Excel processing error: {exc}") from exc
+                if header:
+                    yield ""
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _is_xlsx(src: Union[str, Path, io.BytesIO]) -> bool:
+        if isinstance(src, io.BytesIO):
+            src.seek(0)
+            head = src.read(4)
+            src.seek(0)
+            return head == _ZIP_MAGIC
+        try:
+            with open(src, "rb") as fh:
+                return fh.read(4) == _ZIP_MAGIC
+        except OSError as exc:
+            raise FileProcessingError(f"Cannot read Excel file {src!s}: {exc}") from exc
+
     @staticmethod
     def _to_bytes_io(src) -> io.BytesIO:
         if isinstance(src, io.BytesIO):
             src.seek(0)
             return src
-        if isinstance(src, (bytes, bytearray)):
+        if isinstance(src, (bytes, bytearray, memoryview)):
             return io.BytesIO(src)
         path = Path(src)
         try:
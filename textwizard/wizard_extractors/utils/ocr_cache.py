@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: 2024–2025 Mattia Rubino
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from __future__ import annotations
+
+import abc
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import platformdirs
+
+from textwizard.utils.errors.errors import InvalidInputError
+
+__all__ = ["OcrCache", "DiskOcrCache", "ocr_cache_key", "resolve_ocr_cache"]
+
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# After an eviction the cache is trimmed below this fraction of `max_bytes`
+# so that a full cache does not rescan the directory on every write.
+# The directory is also rescanned once a process has written the remaining
+# fraction since its last scan, since other processes sharing the directory
+# write entries its running size never sees.
+_EVICT_TARGET = 0.9
+
+
+def ocr_cache_key(kind: str, data: Union[bytes, memoryview], dpi: int, lang: str) -> str:
+    """
+    Content address of one OCR job.
+
+    *kind* names the OCR path (``"pdf-page"``, ``"image"``, ``"docx-image"``)
+    because each one post-processes Tesseract output differently; *data* is
+    the rendered page or image payload.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{kind}\0{dpi}\0{lang}\0".encode("utf-8"))
+    h.update(data)
+    return h.hexdigest()
+
+
+class OcrCache(abc.ABC):
+    """
+    Interface for OCR result caches.
+
+    Subclass and implement :meth:`get` / :meth:`put` to plug in another
+    backend (Redis, SQLite, …). Implementations must be picklable if they
+    are used with ``ocr_workers > 1``.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text for *key*, or None on a miss."""
+
+    @abc.abstractmethod
+    def put(self, key: str, text: str) -> None:
+        """Store *text* under *key*."""
+
+
+class DiskOcrCache(OcrCache):
+    """
+    On-disk OCR cache with size-bounded LRU eviction.
+
+    Each entry is a UTF-8 file named after its key. Reads refresh the file
+    mtime, and when the total size exceeds *max_bytes* the least recently
+    used entries are deleted. Writes are atomic, so several processes may
+    share one directory; the size is recomputed from the directory before
+    evicting, so the bound holds for their entries too.
+
+    Parameters
+    ----------
+    directory : str | Path | None
+        Cache directory. None = ``<user cache dir>/textwizard/ocr``.
+    max_bytes : int
+        Upper bound on the total size of cached entries.
+    """
+
+    __slots__ = ("directory", "max_bytes", "_size", "_unscanned", "_lock")
+
+    def __init__(self, directory: Union[str, Path, None] = None, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+        if directory is None:
+            directory = Path(platformdirs.user_cache_dir("textwizard")) / "ocr"
+        self.directory = Path(directory).expanduser()
+        self.max_bytes = int(max_bytes)
+        self._size: Optional[int] = None
+        self._unscanned = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {"directory": self.directory, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state) -> None:
+        self.__init__(state["directory"], state["max_bytes"])
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        path = self._path(key)
+        data = text.encode("utf-8")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+                raise
+        except OSError:
+            return  # a cache must never break extraction
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+                self._unscanned += len(data)
+            if self._size > self.max_bytes or self._unscanned > self.max_bytes * (1 - _EVICT_TARGET):
+                self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._entries():
+                with contextlib.suppress(OSError):
+                    entry.unlink()
+            self._size = 0
+            self._unscanned = 0
+
+    def _entries(self):
+        if not self.directory.is_dir():
+            return
+        for sub in self.directory.iterdir():
+            if sub.is_dir():
+                yield from sub.glob("*.txt")
+
+    def _scan_size(self) -> int:
+        total = 0
+        for entry in self._entries():
+            with contextlib.suppress(OSError):
+                total += entry.stat().st_size
+        return total
+
+    def _evict(self) -> None:
+        # The running size only counts this process's writes: stat the
+        # directory and evict against what is really there.
+        stats = []
+        for entry in self._entries():
+            with contextlib.suppress(OSError):
+                st = entry.stat()
+                stats.append((st.st_mtime, st.st_size, entry))
+        total = sum(size for _, size, _ in stats)
+        self._unscanned = 0
+        if total <= self.max_bytes:
+            self._size = total
+            return
+        stats.sort(key=lambda t: t[0])
+        target = int(self.max_bytes * _EVICT_TARGET)
+        for _, size, entry in stats:
+            if total <= target:
+                break
+            with contextlib.suppress(OSError):
+                entry.unlink()
+                total -= size
+        self._size = total
+
+
+# One instance per directory, so the running size estimate is reused
+# across calls instead of rescanning the directory each time.
+_disk_caches: Dict[Path, DiskOcrCache] = {}
+_disk_caches_lock = threading.Lock()
+
+
+def resolve_ocr_cache(cache: Union[OcrCache, str, Path, bool, None]) -> Optional[OcrCache]:
+    """Turn the user-facing ``ocr_cache`` argument into a cache instance."""
+    if cache is None or cache is False:
+        return None
+    if isinstance(cache, OcrCache):
+        return cache
+    if cache is True or isinstance(cache, (str, Path)):
+        directory = None if cache is True else Path(cache).expanduser()
+        with _disk_caches_lock:
+            inst = DiskOcrCache(directory)
+            return _disk_caches.setdefault(inst.directory, inst)
+    raise InvalidInputError("ocr_cache", "OcrCache, directory path, True or None", cache)
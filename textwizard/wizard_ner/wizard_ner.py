@@ -12,20 +12,34 @@ from typing import Dict, List, Literal, Optional
 from dataclasses import asdict
 
 
-try:
-    import numpy as _np
-    import torch
-    from torch.serialization import add_safe_globals
+_torch_patched = False
 
-    add_safe_globals([_np.core.multiarray._reconstruct])
 
-    _orig_torch_load = torch.load
-    def _torch_load_override(f, *args, **kwargs):
-        return _orig_torch_load(f, *args, weights_only=False, **kwargs)
-    torch.load = _torch_load_override
+def _patch_torch_load() -> None:
+    """
+    Let torch load Stanza checkpoints (``weights_only=False``).
 
-except ImportError:
-    pass
+    Applied on first pipeline load rather than at import time, so that
+    ``import textwizard`` does not import numpy and torch.
+    """
+    global _torch_patched
+    if _torch_patched:
+        return
+    _torch_patched = True
+    try:
+        import numpy as _np
+        import torch
+        from torch.serialization import add_safe_globals
+
+        add_safe_globals([_np.core.multiarray._reconstruct])
+
+        _orig_torch_load = torch.load
+        def _torch_load_override(f, *args, **kwargs):
+            return _orig_torch_load(f, *args, weights_only=False, **kwargs)
+        torch.load = _torch_load_override
+
+    except ImportError:
+        pass
 
 
 ###############################################################################
@@ -224,6 +238,7 @@ class WizardNER:
     # ------------------------------------------------------------------
     @cached_property
     def _nlp(self):
+        _patch_torch_load()
         want_gpu = {
             "cpu": False,
             "gpu": True,